@@ -0,0 +1,52 @@
+"""research_chunks
+
+Revision ID: 3f9c1d7e2a54
+Revises: 8c249e7dcba2
+Create Date: 2026-10-18 10:12:31.204417
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f9c1d7e2a54'
+down_revision: Union[str, Sequence[str], None] = '8c249e7dcba2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('research_chunks',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('research_document_id', sa.Integer(), nullable=False),
+    sa.Column('analysis_id', sa.Integer(), nullable=False),
+    sa.Column('chunk_index', sa.Integer(), nullable=False),
+    sa.Column('start_offset', sa.Integer(), nullable=False),
+    sa.Column('end_offset', sa.Integer(), nullable=False),
+    sa.Column('content', sa.Text(), nullable=False),
+    sa.Column('content_hash', sa.String(length=64), nullable=True),
+    sa.Column('embedding_id', sa.String(length=255), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.ForeignKeyConstraint(['analysis_id'], ['analyses.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['research_document_id'], ['research_documents.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+
+    # Embedding reuse looks chunks up by content hash
+    op.create_index('ix_research_chunks_content_hash', 'research_chunks', ['content_hash'], unique=False)
+
+    # Foreign keys walked by cascading deletes
+    op.create_index('ix_research_chunks_research_document_id', 'research_chunks', ['research_document_id'], unique=False)
+    op.create_index('ix_research_chunks_analysis_id', 'research_chunks', ['analysis_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_research_chunks_analysis_id', table_name='research_chunks')
+    op.drop_index('ix_research_chunks_research_document_id', table_name='research_chunks')
+    op.drop_index('ix_research_chunks_content_hash', table_name='research_chunks')
+    op.drop_table('research_chunks')
@@ -0,0 +1,44 @@
+"""daily_priority_snapshot
+
+Revision ID: 7b2e4c9a1f30
+Revises: 3f9c1d7e2a54
+Create Date: 2026-10-18 14:05:47.318265
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7b2e4c9a1f30'
+down_revision: Union[str, Sequence[str], None] = '3f9c1d7e2a54'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('daily_priorities', sa.Column('analysis_id', sa.Integer(), nullable=True))
+    op.add_column('daily_priorities', sa.Column('daily_score', sa.Float(), nullable=True))
+    op.create_foreign_key(
+        'daily_priorities_analysis_id_fkey',
+        'daily_priorities', 'analyses',
+        ['analysis_id'], ['id'],
+        ondelete='CASCADE'
+    )
+    op.create_index(
+        'ix_daily_priorities_user_rank',
+        'daily_priorities',
+        ['user_id', 'rank_position'],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_daily_priorities_user_rank', table_name='daily_priorities')
+    op.drop_constraint('daily_priorities_analysis_id_fkey', 'daily_priorities', type_='foreignkey')
+    op.drop_column('daily_priorities', 'daily_score')
+    op.drop_column('daily_priorities', 'analysis_id')
@@ -0,0 +1,63 @@
+"""hot_path_indexes
+
+Revision ID: 9d4a6f2c8e11
+Revises: 7b2e4c9a1f30
+Create Date: 2026-10-18 15:42:09.671530
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9d4a6f2c8e11'
+down_revision: Union[str, Sequence[str], None] = '7b2e4c9a1f30'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Analyses of a user, by status (lists, in-progress checks, dashboard)
+    op.create_index('ix_analyses_user_status', 'analyses', ['user_id', 'status'], unique=False)
+
+    # Completed analyses only: dashboard ranking and summary
+    op.create_index(
+        'ix_analyses_user_completed',
+        'analyses',
+        ['user_id'],
+        unique=False,
+        postgresql_where=sa.text("status = 'completed'")
+    )
+
+    # Foreign keys walked on every analysis read
+    op.create_index('ix_insights_analysis_id', 'insights', ['analysis_id'], unique=False)
+    op.create_index('ix_research_documents_analysis_id', 'research_documents', ['analysis_id'], unique=False)
+
+    # Recommendations of an insight, and accepted ones for the strategy
+    op.create_index(
+        'ix_recommendations_insight_accepted',
+        'recommendations',
+        ['insight_id', 'is_accepted'],
+        unique=False
+    )
+
+    # Case-insensitive company lookup in create_analysis
+    op.create_index(
+        'ix_companies_name_lower',
+        'companies',
+        [sa.text('lower(name)')],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_companies_name_lower', table_name='companies')
+    op.drop_index('ix_recommendations_insight_accepted', table_name='recommendations')
+    op.drop_index('ix_research_documents_analysis_id', table_name='research_documents')
+    op.drop_index('ix_insights_analysis_id', table_name='insights')
+    op.drop_index('ix_analyses_user_completed', table_name='analyses')
+    op.drop_index('ix_analyses_user_status', table_name='analyses')
@@ -1,10 +1,12 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, func
 from sqlalchemy.orm import selectinload
 from ...dependencies.deps import get_db
 from ...dependencies.deps_auth import get_current_user
-from ...models.user import User
+from ...core.auth_cache import AuthenticatedUser
 from ...models.sales_strategy import SalesStrategy
 from ...models.analysis import Analysis
 from ...models.recommendation import Recommendation
@@ -14,10 +16,19 @@ from ...schemas.analysis import AnalysisResponse, AnalysisCreate, AnalysisListIt
 from ...schemas.recommendation import RecommendationAccept, RecommendationResponse, RecommendationUpdate
 from ...schemas.sales_strategy import SalesStrategyResponse
 from ...schemas.insight import InsightResponse
-from ...services.ai.tasks.research_task import run_research
-from ...models.enums import PROGRESS_MAP
+from ...services.ai.tasks.pipeline_task import start_analysis_pipeline
+from ...models.enums import PROGRESS_MAP, AnalysisStatus
+from ...core.analysis_events import (
+    TERMINAL_STATUSES,
+    format_sse,
+    reset_analysis_events,
+    subscribe_analysis_events,
+)
+from ...core.config import settings
 from ...utils.url import normalize_domain
+from ...utils.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, NEXT_CURSOR_HEADER, keyset_page, split_page
 from ...services.ai.tasks.sales_strategy_task import run_sales_strategy
+from ...services.ai.tasks.daily_priority_task import refresh_user_daily_priorities
 
 api_router = APIRouter()
 
@@ -25,14 +36,14 @@ api_router = APIRouter()
 async def create_analysis(
     payload: AnalysisCreate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: AuthenticatedUser = Depends(get_current_user),
 ):
     normalized_domain = normalize_domain(str(payload.website_url) if payload.website_url else None)
 
-    # Try to find existing company by name
+    # Try to find existing company by name (case-insensitive, uses ix_companies_name_lower)
     result = await db.execute(
         select(Company).where(
-            Company.name.ilike(payload.company_name)
+            func.lower(Company.name) == payload.company_name.lower()
         )
     )
     company = result.scalar_one_or_none()
@@ -90,8 +101,8 @@ async def create_analysis(
     await db.commit()
     await db.refresh(analysis)
 
-    # Trigger AI pipeline
-    run_research.delay(analysis.id)
+    # Trigger AI pipeline (research → insights → recommendations)
+    start_analysis_pipeline(analysis.id)
 
     return AnalysisResponse(
         analysis_id=analysis.id,
@@ -104,7 +115,7 @@ async def accept_recommendation(
     recommendation_id: int,
     payload: RecommendationAccept,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: AuthenticatedUser = Depends(get_current_user),
 ):
 
     result = await db.execute(
@@ -135,7 +146,7 @@ async def accept_recommendation(
 async def get_sales_strategy(
     analysis_id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: AuthenticatedUser = Depends(get_current_user),
 ):
 
     result = await db.execute(
@@ -169,7 +180,7 @@ async def get_sales_strategy(
 async def mark_analysis_completed(
     analysis_id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: AuthenticatedUser = Depends(get_current_user),
 ):
 
     result = await db.execute(
@@ -193,34 +204,63 @@ async def mark_analysis_completed(
 
     await db.commit()
 
+    # The analysis now counts for the dashboard ranking
+    refresh_user_daily_priorities.delay(current_user.id)
+
     return {"message": "Analysis marked as completed"}
 
 
 @api_router.get("/", response_model=list[AnalysisListItem])
 async def list_user_analyses(
+    response: Response,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[int] = Query(None, description="X-Next-Cursor of the previous page"),
+    status_filter: Optional[str] = Query(None, alias="status"),
+    company_id: Optional[int] = Query(None),
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: AuthenticatedUser = Depends(get_current_user),
 ):
-
-    result = await db.execute(
-        select(Analysis)
-        .options(selectinload(Analysis.company))
+    """
+    Newest first, keyset-paginated on id. When more rows exist the
+    X-Next-Cursor header holds the `cursor` for the next page.
+    """
+
+    query = (
+        select(
+            Analysis.id,
+            Analysis.company_id,
+            Company.name.label("company_name"),
+            Analysis.status,
+            Analysis.strategic_score,
+            Analysis.propensity_score
+        )
+        .join(Company, Company.id == Analysis.company_id)
         .where(Analysis.user_id == current_user.id)
-        .order_by(Analysis.id.desc())
     )
 
-    analyses = result.scalars().all()
+    if status_filter:
+        query = query.where(Analysis.status == status_filter)
+
+    if company_id:
+        query = query.where(Analysis.company_id == company_id)
+
+    result = await db.execute(keyset_page(query, Analysis.id, limit, cursor))
+
+    rows, next_cursor = split_page(result.all(), limit, lambda row: row.id)
+
+    if next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = str(next_cursor)
 
     return [
         AnalysisListItem(
-            analysis_id=a.id,
-            company_id=a.company_id,
-            company_name=a.company.name if a.company else None,
-            status=a.status,
-            strategic_score=a.strategic_score,
-            propensity_score=a.propensity_score
+            analysis_id=row.id,
+            company_id=row.company_id,
+            company_name=row.company_name,
+            status=row.status,
+            strategic_score=row.strategic_score,
+            propensity_score=row.propensity_score
         )
-        for a in analyses
+        for row in rows
     ]
 
 
@@ -229,7 +269,7 @@ async def list_user_analyses(
 async def get_full_analysis(
     analysis_id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: AuthenticatedUser = Depends(get_current_user),
 ):
 
     result = await db.execute(
@@ -317,7 +357,7 @@ async def update_recommendation_status(
     recommendation_id: int,
     payload: RecommendationUpdate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: AuthenticatedUser = Depends(get_current_user),
 ):
 
     result = await db.execute(
@@ -354,7 +394,7 @@ async def update_recommendation_status(
 async def regenerate_sales_strategy(
     analysis_id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: AuthenticatedUser = Depends(get_current_user),
 ):
 
     result = await db.execute(
@@ -374,7 +414,7 @@ async def regenerate_sales_strategy(
         )
 
     # Prevent duplicate strategy generation
-    if analysis.status == "generating_strategy":
+    if analysis.status == AnalysisStatus.STRATEGY_GENERATING:
         raise HTTPException(
             status_code=409,
             detail="Sales strategy generation already in progress"
@@ -399,12 +439,18 @@ async def regenerate_sales_strategy(
         )
 
     # Update status BEFORE launching task
-    analysis.status = "generating_strategy"
+    analysis.status = AnalysisStatus.STRATEGY_GENERATING
     await db.commit()
 
+    # Subscribers must not replay sections of the previous strategy
+    await reset_analysis_events(analysis_id, "strategy")
+
     # Launch async task
     run_sales_strategy.delay(analysis_id)
 
+    # Not completed anymore: drop it from the dashboard ranking until done
+    refresh_user_daily_priorities.delay(current_user.id)
+
     return {
         "message": "Sales strategy regeneration started",
         "analysis_id": analysis_id
@@ -416,7 +462,7 @@ async def regenerate_sales_strategy(
 async def get_analysis_progress(
     analysis_id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: AuthenticatedUser = Depends(get_current_user),
 ):
 
     result = await db.execute(
@@ -443,11 +489,140 @@ async def get_analysis_progress(
     )
 
 
+@api_router.get("/{analysis_id}/events")
+async def stream_analysis_events(
+    analysis_id: int,
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+    current_user: AuthenticatedUser = Depends(get_current_user),
+):
+    """
+    Server-Sent Events: status transitions (with stage timings) and
+    partial results, published by the pipeline tasks via Redis pub/sub.
+    """
+
+    result = await db.execute(
+        select(Analysis.id, Analysis.status).where(
+            Analysis.id == analysis_id,
+            Analysis.user_id == current_user.id
+        )
+    )
+
+    analysis = result.one_or_none()
+
+    if not analysis:
+        raise HTTPException(
+            status_code=404,
+            detail="Analysis not found"
+        )
+
+    # The session (also used by get_current_user) is only torn down after
+    # the response ends: return its connection to the pool before streaming
+    await db.close()
+
+    async def event_stream():
+        # Current state first, so the client renders immediately
+        yield format_sse({
+            "id": 0,
+            "event": "snapshot",
+            "analysis_id": analysis_id,
+            "data": {
+                "status": analysis.status,
+                "progress": PROGRESS_MAP.get(analysis.status, 0),
+            },
+        })
+
+        if analysis.status in TERMINAL_STATUSES:
+            return
+
+        async for event in subscribe_analysis_events(
+            analysis_id,
+            keepalive_seconds=settings.ANALYSIS_EVENTS_KEEPALIVE_SECONDS,
+        ):
+            if await request.is_disconnected():
+                break
+
+            yield format_sse(event)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",
+        },
+    )
+
+
+@api_router.get("/{analysis_id}/strategy/events")
+async def stream_sales_strategy_events(
+    analysis_id: int,
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+    current_user: AuthenticatedUser = Depends(get_current_user),
+):
+    """
+    Server-Sent Events: one `strategy_section` event per strategy field as
+    soon as the LLM has written it, then `strategy_completed` or
+    `strategy_failed`. `strategy_reset` means the streamed sections were
+    rejected: discard them, the fallback sections follow.
+    """
+
+    result = await db.execute(
+        select(Analysis.id, Analysis.status).where(
+            Analysis.id == analysis_id,
+            Analysis.user_id == current_user.id
+        )
+    )
+
+    analysis = result.one_or_none()
+
+    if not analysis:
+        raise HTTPException(
+            status_code=404,
+            detail="Analysis not found"
+        )
+
+    # Same as /events: do not hold a pooled connection for the whole stream
+    await db.close()
+
+    async def event_stream():
+        yield format_sse({
+            "id": 0,
+            "event": "snapshot",
+            "analysis_id": analysis_id,
+            "data": {"status": analysis.status},
+        })
+
+        # Nothing being generated: the stored strategy is served by /strategy
+        if analysis.status != AnalysisStatus.STRATEGY_GENERATING:
+            return
+
+        async for event in subscribe_analysis_events(
+            analysis_id,
+            keepalive_seconds=settings.ANALYSIS_EVENTS_KEEPALIVE_SECONDS,
+            stream="strategy",
+        ):
+            if await request.is_disconnected():
+                break
+
+            yield format_sse(event)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",
+        },
+    )
+
+
 @api_router.delete("/{analysis_id}")
 async def delete_analysis(
     analysis_id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: AuthenticatedUser = Depends(get_current_user),
 ):
 
     result = await db.execute(
@@ -466,4 +641,7 @@ async def delete_analysis(
     await db.delete(analysis)
     await db.commit()
 
+    # Its snapshot rows are gone; re-rank so the dashboard keeps its size
+    refresh_user_daily_priorities.delay(current_user.id)
+
     return {"message": "Analysis deleted successfully"}
\ No newline at end of file
@@ -1,5 +1,5 @@
 from fastapi import APIRouter
-from . import test, auth, users, dashboard, analysis, insights
+from . import test, auth, users, dashboard, analysis, insights, metrics
 
 api_router = APIRouter()
 
@@ -8,4 +8,5 @@ api_router.include_router(auth.api_router, prefix="/auth", tags=["auth"])
 api_router.include_router(users.api_router, prefix="/users", tags=["users"])
 api_router.include_router(dashboard.api_router, prefix="/dashboard", tags=["Dashboard"])
 api_router.include_router(analysis.api_router, prefix="/analysis", tags=["Analysis"])
-api_router.include_router(insights.api_router, prefix="/insights", tags=["Insights"])
\ No newline at end of file
+api_router.include_router(insights.api_router, prefix="/insights", tags=["Insights"])
+api_router.include_router(metrics.api_router, prefix="/metrics", tags=["Metrics"])
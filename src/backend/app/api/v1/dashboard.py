@@ -2,12 +2,10 @@ from fastapi import APIRouter, Depends
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import func
-from sqlalchemy.orm import joinedload
 from ...dependencies.deps import get_db
 from ...dependencies.deps_auth import get_current_user
-from ...models.user import User
+from ...core.auth_cache import AuthenticatedUser
 from ...models.analysis import Analysis
-from ...models.company import Company
 from ...schemas.dashboard import TopCompanyResponse, DashboardSummaryResponse
 from ...services.ai.daily_prioritization_service import DailyPrioritizationService
 from ...models.enums import AnalysisStatus
@@ -20,59 +18,28 @@ api_router = APIRouter()
 async def get_top_accounts(
     limit: int = 5,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: AuthenticatedUser = Depends(get_current_user),
 ):
 
-    result = await db.execute(
-        select(Analysis)
-        .where(
-            Analysis.status == AnalysisStatus.COMPLETED,
-            Analysis.user_id == current_user.id
-        )
-    )
-
-    analyses = result.scalars().all()
-
     service = DailyPrioritizationService(db)
-    ranked = await service.generate_daily_top(analyses, limit)
-
-    company_ids = [item["company_id"] for item in ranked]
-
-    if not company_ids:
-        return []
-
-    companies_result = await db.execute(
-        select(Company)
-        .options(
-            joinedload(Company.industry)
-        )
-        .where(Company.id.in_(company_ids))
-    )
-
-    companies = {c.id: c for c in companies_result.scalars().all()}
-
-    response = []
-
-    for item in ranked:
-        company = companies.get(item["company_id"])
-
-        response.append(
-            TopCompanyResponse(
-                analysis_id=item["analysis_id"],
-                company_id=item["company_id"],
-                company_name=company.name if company else None,
-                industry=company.industry.name if company and company.industry else None,
-                score=round(item["daily_score"], 2)
-            )
+    ranked = await service.get_daily_top(current_user.id, limit)
+
+    return [
+        TopCompanyResponse(
+            analysis_id=item["analysis_id"],
+            company_id=item["company_id"],
+            company_name=item["company_name"],
+            industry=item["industry"],
+            score=round(item["daily_score"], 2)
         )
-
-    return response
+        for item in ranked
+    ]
 
 
 @api_router.get("/summary", response_model=DashboardSummaryResponse)
 async def get_dashboard_summary(
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: AuthenticatedUser = Depends(get_current_user),
 ):
 
     prioritized_result = await db.execute(
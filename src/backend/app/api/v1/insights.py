@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Response
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional, List
@@ -7,22 +7,36 @@ from ...models.analysis import Analysis
 from ...schemas.insight import InsightResponse
 from ...dependencies.deps import get_db
 from ...dependencies.deps_auth import get_current_user
-from ...models.user import User
+from ...core.auth_cache import AuthenticatedUser
+from ...utils.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, NEXT_CURSOR_HEADER, keyset_page, split_page
 
 api_router = APIRouter(prefix="/insights", tags=["Insights"])
 
 
 @api_router.get("/", response_model=List[InsightResponse])
 async def list_user_insights(
+    response: Response,
     company_id: Optional[int] = Query(None),
     severity: Optional[str] = Query(None),
+    status: Optional[str] = Query(None, description="Status of the parent analysis"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[int] = Query(None, description="X-Next-Cursor of the previous page"),
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: AuthenticatedUser = Depends(get_current_user),
 ):
+    """
+    Newest first, keyset-paginated on id. When more rows exist the
+    X-Next-Cursor header holds the `cursor` for the next page.
+    """
 
     query = (
-        select(Insight)
-        .join(Analysis)
+        select(
+            Insight.id,
+            Insight.title,
+            Insight.severity,
+            Insight.description
+        )
+        .join(Analysis, Analysis.id == Insight.analysis_id)
         .where(Analysis.user_id == current_user.id)
     )
 
@@ -32,7 +46,14 @@ async def list_user_insights(
     if severity:
         query = query.where(Insight.severity == severity)
 
-    result = await db.execute(query)
-    insights = result.scalars().all()
+    if status:
+        query = query.where(Analysis.status == status)
 
-    return insights
\ No newline at end of file
+    result = await db.execute(keyset_page(query, Insight.id, limit, cursor))
+
+    rows, next_cursor = split_page(result.all(), limit, lambda row: row.id)
+
+    if next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = str(next_cursor)
+
+    return [InsightResponse(**row._mapping) for row in rows]
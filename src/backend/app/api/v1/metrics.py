@@ -0,0 +1,21 @@
+import asyncio
+
+from fastapi import APIRouter, Depends
+
+from ...core.rate_limiter import rate_limit_snapshot
+from ...core.roles import Roles
+from ...dependencies.deps_auth import require_role
+
+api_router = APIRouter()
+
+
+@api_router.get("/rate-limits")
+async def get_rate_limits(
+    current_user = Depends(require_role(Roles.ADMIN)),
+):
+    """
+    Current token budget and throttling counters per provider/model.
+    """
+    limits = await asyncio.to_thread(rate_limit_snapshot)
+
+    return {"rate_limits": limits}
@@ -12,11 +12,12 @@ from ...crud.user import user_crud
 from ...core.roles import Roles
 from datetime import datetime, timezone
 from ...crud.session import revoke_all_user_sessions
+from ...core.auth_cache import AuthenticatedUser, invalidate_auth_user
 
 api_router = APIRouter()
 
 @api_router.get("/me", response_model=MeResponse)
-async def get_me(current_user = Depends(get_current_user)):
+async def get_me(current_user: AuthenticatedUser = Depends(get_current_user)):
 
     return MeResponse(
         email=current_user.email,
@@ -30,9 +31,13 @@ async def get_me(current_user = Depends(get_current_user)):
 async def update_me(
     data: SelfUserUpdate,
     db: AsyncSession = Depends(get_db),
-    current_user = Depends(get_current_user)
+    current_user: AuthenticatedUser = Depends(get_current_user)
 ):
     print(current_user.role.name)
+
+    # current_user is a cached snapshot: update the ORM row
+    user = await db.get(User, current_user.id)
+
     password_changed = False
     security_sensitive_change = False
 
@@ -55,13 +60,15 @@ async def update_me(
     for field in forbidden_fields:
         update_data.pop(field, None)
 
-    updated_user = await user_crud.update(db, current_user, update_data)
+    updated_user = await user_crud.update(db, user, update_data)
 
     # Access token invalidation
     if security_sensitive_change:
         updated_user.token_version += 1
         await db.commit()
 
+    await invalidate_auth_user(current_user.email)
+
     # Refresh token invalidation
     if password_changed or security_sensitive_change:
         await revoke_all_user_sessions(db, current_user.id)
@@ -73,7 +80,7 @@ async def update_me(
 async def soft_delete_user(
     user_id: int,
     db: AsyncSession = Depends(get_db),
-    current_user = Depends(require_role("admin"))
+    current_user: AuthenticatedUser = Depends(require_role("admin"))
 ):
     result = await db.execute(
         select(User).where(
@@ -92,6 +99,8 @@ async def soft_delete_user(
 
     await db.commit()
 
+    await invalidate_auth_user(user.email)
+
     return {"message": "User soft deleted"}
 
 @api_router.patch("/{user_id}")
@@ -99,7 +108,7 @@ async def update_user_admin(
     user_id: int,
     data: AdminUserUpdate,
     db: AsyncSession = Depends(get_db),
-    current_user = Depends(require_role(Roles.ADMIN))
+    current_user: AuthenticatedUser = Depends(require_role(Roles.ADMIN))
 ):
 
     result = await db.execute(
@@ -110,6 +119,7 @@ async def update_user_admin(
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
+    previous_email = user.email
     password_changed = False
     security_sensitive_change = False
 
@@ -149,6 +159,8 @@ async def update_user_admin(
         updated_user.token_version += 1
         await db.commit()
 
+    await invalidate_auth_user(previous_email)
+
     # Refresh token invalidation
     if password_changed or security_sensitive_change:
         await revoke_all_user_sessions(db, user.id)  # FIXED (was current_user.id)
@@ -0,0 +1,159 @@
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from array import array
+from typing import Dict, Iterable, List, Optional
+
+from app.core.config import settings
+from app.utils.lru import LRUCache
+
+logger = logging.getLogger(__name__)
+
+
+def build_embedding_cache_key(model: str, kind: str, text: str) -> str:
+    """
+    Key from model name, embedding kind ("query" / "document", which use
+    different task types) and a hash of the exact text.
+    """
+    digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+    return f"{model}:{kind}:{digest}"
+
+
+def _pack(values: List[float]) -> bytes:
+    return array("f", values).tobytes()
+
+
+def _unpack(blob: bytes) -> List[float]:
+    values = array("f")
+    values.frombytes(blob)
+    return values.tolist()
+
+
+class EmbeddingCache:
+    """
+    Two-tier embedding cache: an in-process LRU in front of a SQLite file
+    holding vectors as packed float32 blobs (4 bytes per dimension).
+
+    Backend errors are logged and treated as a cache miss.
+    """
+
+    def __init__(self, path: str, local_max_entries: int):
+        self.path = path
+        self._local = LRUCache(local_max_entries)
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self.hits = 0
+        self.misses = 0
+
+    # ===============================
+    # PUBLIC METHODS
+    # ===============================
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, List[float]]:
+        keys = list(keys)
+        found: Dict[str, List[float]] = {}
+        missing = []
+
+        for key in keys:
+            values = self._local.get(key)
+            if values is not None:
+                found[key] = values
+            else:
+                missing.append(key)
+
+        if missing:
+            try:
+                for key, values in self._select(missing).items():
+                    self._local.set(key, values)
+                    found[key] = values
+            except Exception as e:
+                logger.warning(f"[EmbeddingCache] get failed: {e}")
+
+        self.hits += len(found)
+        self.misses += len(keys) - len(found)
+
+        return found
+
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses}
+
+    def set_many(self, items: Dict[str, List[float]]) -> None:
+        if not items:
+            return
+
+        for key, values in items.items():
+            self._local.set(key, values)
+
+        try:
+            self._insert(items)
+        except Exception as e:
+            logger.warning(f"[EmbeddingCache] set failed: {e}")
+
+    # ===============================
+    # INTERNAL HELPERS
+    # ===============================
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            if self.path != ":memory:":
+                os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+
+            conn = sqlite3.connect(self.path, check_same_thread=False, timeout=10)
+            # Shared by the API and every worker process
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS embedding_cache (
+                    key TEXT PRIMARY KEY,
+                    vector BLOB NOT NULL,
+                    created_at REAL NOT NULL
+                )
+                """
+            )
+            conn.commit()
+            self._conn = conn
+
+        return self._conn
+
+    def _select(self, keys: List[str]) -> Dict[str, List[float]]:
+        found = {}
+
+        with self._lock:
+            conn = self._connect()
+
+            # Stay well below SQLite's bound-parameter limit
+            for start in range(0, len(keys), 500):
+                batch = keys[start:start + 500]
+                placeholders = ",".join("?" * len(batch))
+
+                for key, blob in conn.execute(
+                    f"SELECT key, vector FROM embedding_cache WHERE key IN ({placeholders})",
+                    batch,
+                ):
+                    found[key] = _unpack(blob)
+
+        return found
+
+    def _insert(self, items: Dict[str, List[float]]) -> None:
+        now = time.time()
+
+        with self._lock:
+            conn = self._connect()
+            conn.executemany(
+                "INSERT OR REPLACE INTO embedding_cache VALUES (?, ?, ?)",
+                [(key, _pack(values), now) for key, values in items.items()],
+            )
+            conn.commit()
+
+
+def build_embedding_cache() -> Optional[EmbeddingCache]:
+    if not settings.EMBEDDING_CACHE_ENABLED:
+        return None
+
+    return EmbeddingCache(
+        path=settings.EMBEDDING_CACHE_PATH,
+        local_max_entries=settings.EMBEDDING_CACHE_LOCAL_MAX_ENTRIES,
+    )
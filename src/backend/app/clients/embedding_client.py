@@ -1,15 +1,23 @@
-from typing import List
+import asyncio
+from typing import Dict, List, Optional
 from langchain_google_genai import GoogleGenerativeAIEmbeddings
 from ..core.config import settings
+from ..core.rate_limiter import acall_with_backoff, call_with_backoff, get_rate_limiter
+from .embedding_cache import EmbeddingCache, build_embedding_cache, build_embedding_cache_key
+
+_UNSET = object()
 
 
 class EmbeddingClient:
     """
     Encapsulates embedding generation logic.
     Uses Gemini embedding model via LangChain wrapper.
+
+    Vectors are cached by model + text hash; batches only send the
+    cache misses to the remote model.
     """
 
-    def __init__(self):
+    def __init__(self, cache: Optional[EmbeddingCache] = _UNSET):
         self.model_name = settings.GEMINI_EMBEDDING_MODEL
 
         self._embeddings = GoogleGenerativeAIEmbeddings(
@@ -17,14 +25,123 @@ class EmbeddingClient:
             google_api_key=settings.GEMINI_API_KEY
         )
 
+        self._cache = build_embedding_cache() if cache is _UNSET else cache
+        self._limiter = get_rate_limiter("gemini-embedding", self.model_name)
+
     def embed_text(self, text: str) -> List[float]:
         """
         Generate embedding vector for a single text.
         """
-        return self._embeddings.embed_query(text)
+        if self._cache is None:
+            return self._embed_query(text)
+
+        key = build_embedding_cache_key(self.model_name, "query", text)
+
+        cached = self._cache.get_many([key])
+        if key in cached:
+            return cached[key]
+
+        values = self._embed_query(text)
+        self._cache.set_many({key: values})
+
+        return values
 
     def embed_batch(self, texts: List[str]) -> List[List[float]]:
         """
         Generate embeddings for multiple texts.
         """
-        return self._embeddings.embed_documents(texts)
\ No newline at end of file
+        if self._cache is None:
+            return self._embed_documents(texts)
+
+        keys = self._document_keys(texts)
+        found = self._cache.get_many(keys)
+
+        missing = self._missing_texts(texts, keys, found)
+
+        if missing:
+            embeddings = self._embed_documents(list(missing.values()))
+            fresh = dict(zip(missing, embeddings))
+            self._cache.set_many(fresh)
+            found.update(fresh)
+
+        return [found[key] for key in keys]
+
+    async def aembed_text(self, text: str) -> List[float]:
+        """
+        Async variant of embed_text.
+        """
+        if self._cache is None:
+            return await self._aembed_query(text)
+
+        key = build_embedding_cache_key(self.model_name, "query", text)
+
+        cached = await asyncio.to_thread(self._cache.get_many, [key])
+        if key in cached:
+            return cached[key]
+
+        values = await self._aembed_query(text)
+        await asyncio.to_thread(self._cache.set_many, {key: values})
+
+        return values
+
+    async def aembed_batch(self, texts: List[str]) -> List[List[float]]:
+        """
+        Async variant of embed_batch.
+        """
+        if self._cache is None:
+            return await self._aembed_documents(texts)
+
+        keys = self._document_keys(texts)
+        found = await asyncio.to_thread(self._cache.get_many, keys)
+
+        missing = self._missing_texts(texts, keys, found)
+
+        if missing:
+            embeddings = await self._aembed_documents(list(missing.values()))
+            fresh = dict(zip(missing, embeddings))
+            await asyncio.to_thread(self._cache.set_many, fresh)
+            found.update(fresh)
+
+        return [found[key] for key in keys]
+
+    def cache_stats(self) -> Dict[str, int]:
+        if self._cache is None:
+            return {"hits": 0, "misses": 0}
+        return self._cache.stats()
+
+    # Remote calls: rate limited, throttling errors retried with backoff
+
+    def _embed_query(self, text: str) -> List[float]:
+        return call_with_backoff(self._embeddings.embed_query, text, limiter=self._limiter)
+
+    def _embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return call_with_backoff(self._embeddings.embed_documents, texts, limiter=self._limiter)
+
+    async def _aembed_query(self, text: str) -> List[float]:
+        return await acall_with_backoff(self._embeddings.aembed_query, text, limiter=self._limiter)
+
+    async def _aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        return await acall_with_backoff(self._embeddings.aembed_documents, texts, limiter=self._limiter)
+
+    def _document_keys(self, texts: List[str]) -> List[str]:
+        return [
+            build_embedding_cache_key(self.model_name, "document", text)
+            for text in texts
+        ]
+
+    def _missing_texts(
+        self,
+        texts: List[str],
+        keys: List[str],
+        found: Dict[str, List[float]],
+    ) -> Dict[str, str]:
+        """
+        Cache misses as key -> text, deduplicated, in input order.
+        """
+        missing: Dict[str, str] = {}
+
+        for key, text in zip(keys, texts):
+            if key not in found and key not in missing:
+                missing[key] = text
+
+        return missing
@@ -0,0 +1,90 @@
+import hashlib
+import json
+import logging
+from typing import Optional
+
+from app.core.config import settings
+from app.core.redis_client import get_redis
+from app.utils.lru import LRUCache
+
+logger = logging.getLogger(__name__)
+
+
+def build_llm_cache_key(
+    model: str,
+    temperature: float,
+    prompt: str,
+    output_schema: Optional[str] = None,
+) -> str:
+    """
+    Content address of an LLM call: identical inputs, identical key.
+    """
+    payload = json.dumps(
+        {
+            "model": model,
+            "temperature": temperature,
+            "prompt": prompt,
+            "schema": output_schema,
+        },
+        sort_keys=True,
+    )
+
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """
+    Raw LLM response text, stored in Redis with a per-process LRU in front.
+
+    Only responses that parsed successfully are stored (the caller decides).
+    Backend errors are logged and treated as a cache miss.
+    """
+
+    PREFIX = "llm:cache:"
+
+    def __init__(self, ttl_seconds: int, local_max_entries: int, client=None):
+        self.ttl_seconds = ttl_seconds
+        self._local = LRUCache(local_max_entries, ttl_seconds=ttl_seconds)
+        self._redis = client
+
+    def get(self, key: str) -> Optional[str]:
+        value = self._local.get(key)
+
+        if value is not None:
+            return value
+
+        try:
+            value = self._get_redis().get(self.PREFIX + key)
+        except Exception as e:
+            logger.warning(f"[LLMResponseCache] get failed: {e}")
+            return None
+
+        if value is not None:
+            self._local.set(key, value)
+
+        return value
+
+    def set(self, key: str, value: str, ttl_seconds: Optional[int] = None) -> None:
+        ttl = ttl_seconds or self.ttl_seconds
+
+        self._local.set(key, value, ttl_seconds=ttl)
+
+        try:
+            self._get_redis().setex(self.PREFIX + key, ttl, value)
+        except Exception as e:
+            logger.warning(f"[LLMResponseCache] set failed: {e}")
+
+    def _get_redis(self):
+        if self._redis is None:
+            self._redis = get_redis()
+        return self._redis
+
+
+def build_llm_cache() -> Optional[LLMResponseCache]:
+    if not settings.LLM_CACHE_ENABLED:
+        return None
+
+    return LLMResponseCache(
+        ttl_seconds=settings.LLM_CACHE_TTL_SECONDS,
+        local_max_entries=settings.LLM_CACHE_LOCAL_MAX_ENTRIES,
+    )
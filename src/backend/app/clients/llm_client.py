@@ -1,45 +1,129 @@
-from typing import Optional, Type
+import asyncio
+import inspect
+import weakref
+from typing import Any, Awaitable, Callable, Optional, Type, Union
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_core.output_parsers import PydanticOutputParser
 from langchain_core.prompts import PromptTemplate
 from pydantic import BaseModel
 from app.core.config import settings
+from app.clients.llm_cache import LLMResponseCache, build_llm_cache, build_llm_cache_key
+from app.core.rate_limiter import acall_with_backoff, call_with_backoff, get_rate_limiter
+from app.utils.json_stream import IncrementalJSONObjectParser
 import json
 import logging
 
 logger = logging.getLogger(__name__)
 
+_UNSET = object()
+_MISS = object()
+
 class LLMClient:
     """
     Encapsulates Gemini LLM interaction.
     Supports both free-form generation and structured output.
+
+    Structured calls go through a content-addressed response cache keyed
+    by (model, temperature, prompt, output schema). Only responses that
+    parsed successfully are cached; pass `use_cache=False` to bypass it.
     """
 
-    def __init__(self):
+    def __init__(self, cache: Optional[LLMResponseCache] = _UNSET):
         self.model_name = settings.GEMINI_LLM_MODEL
+        self.temperature = 0.2
+
+        self._llm = self._build_llm()
 
-        self._llm = ChatGoogleGenerativeAI(
+        # The async HTTP client of a chat model is bound to the event loop
+        # that first used it, and Celery tasks run a fresh loop per call:
+        # one model per loop, released with the loop
+        self._async_llms: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+        self._cache = build_llm_cache() if cache is _UNSET else cache
+        self._limiter = get_rate_limiter("gemini-llm", self.model_name)
+
+    def _build_llm(self) -> ChatGoogleGenerativeAI:
+        return ChatGoogleGenerativeAI(
             model=self.model_name,
             google_api_key=settings.GEMINI_API_KEY,
-            temperature=0.2,
+            temperature=self.temperature,
+            # Retries are handled by call_with_backoff
+            max_retries=1,
         )
 
+    def _get_async_llm(self) -> ChatGoogleGenerativeAI:
+        """
+        Chat model for the running event loop (see __init__).
+        """
+        loop = asyncio.get_running_loop()
+
+        llm = self._async_llms.get(loop)
+
+        if llm is None:
+            llm = self._build_llm()
+            self._async_llms[loop] = llm
+
+        return llm
+
     def generate_text(self, prompt: str) -> str:
         """
         Generate free-form text.
         """
-        response = self._llm.invoke(prompt)
+        response = self._invoke(prompt)
+        return response.content
+
+    async def agenerate_text(self, prompt: str) -> str:
+        """
+        Async variant of generate_text.
+        """
+        response = await self._ainvoke(prompt)
         return response.content
 
     def generate_structured_output(
         self,
         prompt: str,
         output_schema: Type[BaseModel],
+        use_cache: bool = True,
+        cache_ttl: Optional[int] = None,
     ) -> BaseModel:
         """
         Generate structured output validated by Pydantic schema.
         """
+        parser, final_prompt = self._build_structured_prompt(prompt, output_schema)
+
+        return self._cached_call(
+            final_prompt,
+            parse=parser.parse,
+            schema_name=output_schema.__name__,
+            use_cache=use_cache,
+            cache_ttl=cache_ttl,
+        )
+
+    async def agenerate_structured_output(
+        self,
+        prompt: str,
+        output_schema: Type[BaseModel],
+        use_cache: bool = True,
+        cache_ttl: Optional[int] = None,
+    ) -> BaseModel:
+        """
+        Async variant of generate_structured_output.
+        """
+        parser, final_prompt = self._build_structured_prompt(prompt, output_schema)
+
+        return await self._acached_call(
+            final_prompt,
+            parse=parser.parse,
+            schema_name=output_schema.__name__,
+            use_cache=use_cache,
+            cache_ttl=cache_ttl,
+        )
 
+    def _build_structured_prompt(
+        self,
+        prompt: str,
+        output_schema: Type[BaseModel],
+    ):
         parser = PydanticOutputParser(pydantic_object=output_schema)
 
         formatted_prompt = PromptTemplate(
@@ -50,16 +134,252 @@ class LLMClient:
             },
         )
 
-        final_prompt = formatted_prompt.format()
+        return parser, formatted_prompt.format()
+
+    def generate_sales_strategy(
+        self,
+        context_payload: dict,
+        use_cache: bool = True,
+        cache_ttl: Optional[int] = None,
+    ):
+
+        prompt = self._build_sales_strategy_prompt(context_payload)
+
+        return self._cached_call(
+            prompt,
+            parse=self._load_sales_strategy,
+            schema_name="sales_strategy",
+            use_cache=use_cache,
+            cache_ttl=cache_ttl,
+            on_parse_error=self._fallback_sales_strategy,
+        )
+
+    async def agenerate_sales_strategy(
+        self,
+        context_payload: dict,
+        use_cache: bool = True,
+        cache_ttl: Optional[int] = None,
+    ):
+        """
+        Async variant of generate_sales_strategy.
+        """
+        prompt = self._build_sales_strategy_prompt(context_payload)
+
+        return await self._acached_call(
+            prompt,
+            parse=self._load_sales_strategy,
+            schema_name="sales_strategy",
+            use_cache=use_cache,
+            cache_ttl=cache_ttl,
+            on_parse_error=self._fallback_sales_strategy,
+        )
+
+    async def astream_sales_strategy(
+        self,
+        context_payload: dict,
+        on_section: Callable[[str, Any], Union[None, Awaitable[None]]],
+        on_reset: Optional[Callable[[], Union[None, Awaitable[None]]]] = None,
+        use_cache: bool = True,
+        cache_ttl: Optional[int] = None,
+    ) -> dict:
+        """
+        Streaming variant of agenerate_sales_strategy.
+
+        `on_section(key, value)` is called for each top-level section as
+        soon as its JSON value is complete. If the full response is then
+        rejected, `on_reset()` is called and every section of the fallback
+        strategy is sent again. Returns the strategy that was produced.
+        """
+        prompt = self._build_sales_strategy_prompt(context_payload)
+        key = self._cache_key(prompt, "sales_strategy", use_cache)
+
+        async def _notify(section, value):
+            outcome = on_section(section, value)
+            if inspect.isawaitable(outcome):
+                await outcome
+
+        async def _reset():
+            outcome = on_reset() if on_reset is not None else None
+            if inspect.isawaitable(outcome):
+                await outcome
+
+        if key:
+            cached = await asyncio.to_thread(self._cache.get, key)
+            result = self._from_cache(cached, self._load_sales_strategy)
+            if result is not _MISS:
+                logger.info("[LLMClient] Cache hit (sales_strategy, streamed)")
+                for section, value in result.items():
+                    await _notify(section, value)
+                return result
+
+        first_chunk, stream = await self._aopen_stream(prompt)
+
+        parser = IncrementalJSONObjectParser()
+        parts = []
+
+        async def _chunks():
+            if first_chunk is not None:
+                yield first_chunk
+            async for chunk in stream:
+                yield chunk
+
+        async for chunk in _chunks():
+            text = chunk.text
+            if not text:
+                continue
+
+            parts.append(text)
+
+            for section, value in parser.feed(text):
+                await _notify(section, value)
+
+        response_text = "".join(parts)
+
+        result, cacheable = self._finish(
+            response_text,
+            self._load_sales_strategy,
+            self._fallback_sales_strategy,
+        )
+
+        if not cacheable:
+            # Streamed sections are not what gets persisted: replace them
+            if parser.result:
+                await _reset()
+
+            for section, value in result.items():
+                await _notify(section, value)
+
+        if key and cacheable:
+            await asyncio.to_thread(self._cache.set, key, response_text, cache_ttl)
+
+        return result
+
+    # ===============================
+    # RATE-LIMITED CALLS
+    # ===============================
+
+    def _invoke(self, prompt: str):
+        return call_with_backoff(self._llm.invoke, prompt, limiter=self._limiter)
+
+    async def _ainvoke(self, prompt: str):
+        return await acall_with_backoff(self._get_async_llm().ainvoke, prompt, limiter=self._limiter)
+
+    async def _aopen_stream(self, prompt: str):
+        """
+        Start streaming and wait for the first chunk under backoff, so
+        throttling raised when the request is sent is retried like
+        `_ainvoke`. Returns (first chunk or None, rest of the stream).
+        """
+
+        async def _open():
+            stream = self._get_async_llm().astream(prompt)
+
+            try:
+                return await stream.__anext__(), stream
+            except StopAsyncIteration:
+                return None, stream
+            except Exception:
+                await stream.aclose()
+                raise
+
+        return await acall_with_backoff(_open, limiter=self._limiter)
+
+    # ===============================
+    # RESPONSE CACHE
+    # ===============================
+
+    def _cache_key(self, prompt: str, schema_name: str, use_cache: bool) -> Optional[str]:
+        if not use_cache or self._cache is None:
+            return None
+
+        return build_llm_cache_key(
+            self.model_name,
+            self.temperature,
+            prompt,
+            schema_name,
+        )
+
+    def _from_cache(self, cached: Optional[str], parse: Callable[[str], Any]):
+        if cached is None:
+            return _MISS
+
+        try:
+            return parse(cached)
+        except Exception:
+            return _MISS
+
+    def _finish(
+        self,
+        text: str,
+        parse: Callable[[str], Any],
+        on_parse_error: Optional[Callable[[str], Any]],
+    ):
+        """
+        Parse a fresh response. Returns (result, cacheable).
+        """
+        try:
+            return parse(text), True
+        except Exception:
+            if on_parse_error is None:
+                raise
+            return on_parse_error(text), False
+
+    def _cached_call(
+        self,
+        prompt: str,
+        parse: Callable[[str], Any],
+        schema_name: str,
+        use_cache: bool = True,
+        cache_ttl: Optional[int] = None,
+        on_parse_error: Optional[Callable[[str], Any]] = None,
+    ):
+        key = self._cache_key(prompt, schema_name, use_cache)
+
+        if key:
+            result = self._from_cache(self._cache.get(key), parse)
+            if result is not _MISS:
+                logger.info(f"[LLMClient] Cache hit ({schema_name})")
+                return result
+
+        response = self._invoke(prompt)
+
+        result, cacheable = self._finish(response.text, parse, on_parse_error)
+
+        if key and cacheable:
+            self._cache.set(key, response.text, cache_ttl)
+
+        return result
+
+    async def _acached_call(
+        self,
+        prompt: str,
+        parse: Callable[[str], Any],
+        schema_name: str,
+        use_cache: bool = True,
+        cache_ttl: Optional[int] = None,
+        on_parse_error: Optional[Callable[[str], Any]] = None,
+    ):
+        key = self._cache_key(prompt, schema_name, use_cache)
+
+        if key:
+            cached = await asyncio.to_thread(self._cache.get, key)
+            result = self._from_cache(cached, parse)
+            if result is not _MISS:
+                logger.info(f"[LLMClient] Cache hit ({schema_name})")
+                return result
 
-        response = self._llm.invoke(final_prompt)
+        response = await self._ainvoke(prompt)
 
-        return parser.parse(response.content)
-    
+        result, cacheable = self._finish(response.text, parse, on_parse_error)
 
-    def generate_sales_strategy(self, context_payload: dict):
+        if key and cacheable:
+            await asyncio.to_thread(self._cache.set, key, response.text, cache_ttl)
 
-        prompt = f"""
+        return result
+
+    def _build_sales_strategy_prompt(self, context_payload: dict) -> str:
+
+        return f"""
         You are a senior enterprise sales strategist coaching an Account Manager 
         before a high-stakes executive conversation.
 
@@ -153,24 +473,27 @@ class LLMClient:
         7. No explanation outside JSON.
         """
 
-        response = self._llm.invoke(prompt)
+    def _load_sales_strategy(self, response_text: str) -> dict:
 
-        response_text = response.text.strip()
+        response_text = response_text.strip()
 
         if response_text.startswith("```"):
             response_text = response_text.split("```")[1].strip()
 
-        try:
-            return json.loads(response_text)
-        except Exception:
-            logger.error("LLM returned invalid JSON")
-            return {
-                "account_strategic_overview": response_text,
-                "priority_initiatives": [],
-                "financial_positioning": "",
-                "technical_enablement_summary": "",
-                "objection_handling": [],
-                "executive_conversation_version": response_text,
-                "email_version": ""
-            }
-        
\ No newline at end of file
+        return json.loads(response_text)
+
+    def _fallback_sales_strategy(self, response_text: str) -> dict:
+
+        logger.error("LLM returned invalid JSON")
+
+        response_text = response_text.strip()
+
+        return {
+            "account_strategic_overview": response_text,
+            "priority_initiatives": [],
+            "financial_positioning": "",
+            "technical_enablement_summary": "",
+            "objection_handling": [],
+            "executive_conversation_version": response_text,
+            "email_version": ""
+        }
@@ -0,0 +1,236 @@
+import json
+import logging
+import os
+import re
+import threading
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from ..core.config import settings
+from .vector_store import VectorStore
+
+try:
+    import faiss
+except ImportError:  # optional, NumPy brute force is used instead
+    faiss = None
+
+logger = logging.getLogger(__name__)
+
+
+class _Namespace:
+    """
+    In-memory copy of one namespace: normalized float32 rows plus
+    parallel id / metadata lists.
+    """
+
+    def __init__(self, ids, metadata, matrix, mtime):
+        self.ids: List[str] = ids
+        self.metadata: List[Dict[str, Any]] = metadata
+        self.matrix: np.ndarray = matrix
+        self.mtime: Optional[float] = mtime
+        self.rows = {vector_id: row for row, vector_id in enumerate(ids)}
+        self.faiss_index = None
+
+
+class LocalVectorStore(VectorStore):
+    """
+    Flat inner-product index persisted per namespace under FAISS_INDEX_PATH.
+
+    Each namespace is a `<namespace>.npy` matrix of L2-normalized vectors
+    (so inner product equals cosine similarity) and a `<namespace>.json`
+    file with ids and metadata. Files are replaced atomically on every
+    upsert and reloaded when another process rewrote them. FAISS is used
+    for search when installed, NumPy otherwise.
+
+    Intended for development, tests and benchmarking; one process should
+    write a given namespace at a time.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or settings.FAISS_INDEX_PATH
+        self._namespaces: Dict[str, _Namespace] = {}
+        self._lock = threading.Lock()
+
+        os.makedirs(self.path, exist_ok=True)
+
+    # ===============================
+    # PUBLIC METHODS
+    # ===============================
+
+    def upsert_batch(
+        self,
+        vectors: List[Dict[str, Any]],
+        namespace: str,
+    ) -> None:
+        if not vectors:
+            return
+
+        with self._lock:
+            current = self._load(namespace)
+
+            ids = list(current.ids)
+            metadata = list(current.metadata)
+            rows = dict(current.rows)
+            matrix = current.matrix
+
+            new_values = self._normalize(
+                np.asarray([v["values"] for v in vectors], dtype=np.float32)
+            )
+
+            if matrix.size == 0:
+                matrix = np.zeros((0, new_values.shape[1]), dtype=np.float32)
+            else:
+                matrix = np.array(matrix, dtype=np.float32)  # writable copy
+
+            appended = []
+
+            for vector, values in zip(vectors, new_values):
+                row = rows.get(vector["id"])
+
+                if row is None:
+                    rows[vector["id"]] = len(ids)
+                    ids.append(vector["id"])
+                    metadata.append(vector.get("metadata") or {})
+                    appended.append(values)
+                elif row < matrix.shape[0]:
+                    matrix[row] = values
+                    metadata[row] = vector.get("metadata") or {}
+                else:
+                    # Duplicate id within this batch
+                    appended[row - matrix.shape[0]] = values
+                    metadata[row] = vector.get("metadata") or {}
+
+            if appended:
+                matrix = np.vstack([matrix, np.asarray(appended, dtype=np.float32)])
+
+            self._save(namespace, ids, metadata, matrix)
+
+    def delete_namespace(self, namespace: str) -> None:
+        with self._lock:
+            for path in self._files(namespace):
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+
+            self._namespaces.pop(namespace, None)
+
+    def fetch_vectors(
+        self,
+        vector_ids: List[str],
+        namespace: str,
+    ) -> Dict[str, List[float]]:
+        if not vector_ids:
+            return {}
+
+        current = self._load(namespace)
+
+        return {
+            vector_id: current.matrix[current.rows[vector_id]].tolist()
+            for vector_id in vector_ids
+            if vector_id in current.rows
+        }
+
+    def similarity_search(
+        self,
+        query_vector: List[float],
+        namespace: str,
+        top_k: int = 5,
+    ) -> List[Dict[str, Any]]:
+        current = self._load(namespace)
+
+        if not current.ids:
+            return []
+
+        query = self._normalize(np.asarray([query_vector], dtype=np.float32))
+        k = min(top_k, len(current.ids))
+
+        if faiss is not None:
+            if current.faiss_index is None:
+                index = faiss.IndexFlatIP(current.matrix.shape[1])
+                index.add(np.ascontiguousarray(current.matrix))
+                current.faiss_index = index
+
+            scores, rows = current.faiss_index.search(query, k)
+            hits = zip(rows[0].tolist(), scores[0].tolist())
+        else:
+            scores = current.matrix @ query[0]
+            top = np.argpartition(-scores, k - 1)[:k]
+            top = top[np.argsort(-scores[top])]
+            hits = ((int(row), float(scores[row])) for row in top)
+
+        return [
+            {
+                "id": current.ids[row],
+                "score": score,
+                "metadata": current.metadata[row],
+            }
+            for row, score in hits
+            if row >= 0
+        ]
+
+    # ===============================
+    # INTERNAL HELPERS
+    # ===============================
+
+    def _files(self, namespace: str):
+        safe = re.sub(r"[^A-Za-z0-9_.-]", "_", namespace)
+        base = os.path.join(self.path, safe)
+        return f"{base}.npy", f"{base}.json"
+
+    def _load(self, namespace: str) -> _Namespace:
+        matrix_path, manifest_path = self._files(namespace)
+
+        try:
+            mtime = os.stat(manifest_path).st_mtime
+        except FileNotFoundError:
+            mtime = None
+
+        current = self._namespaces.get(namespace)
+
+        if current is not None and current.mtime == mtime:
+            return current
+
+        if mtime is None:
+            current = _Namespace([], [], np.zeros((0, 0), dtype=np.float32), None)
+        else:
+            with open(manifest_path) as f:
+                manifest = json.load(f)
+
+            matrix = np.load(matrix_path)
+
+            current = _Namespace(manifest["ids"], manifest["metadata"], matrix, mtime)
+
+        self._namespaces[namespace] = current
+        return current
+
+    def _save(self, namespace, ids, metadata, matrix) -> None:
+        matrix_path, manifest_path = self._files(namespace)
+
+        tmp_matrix = f"{matrix_path}.tmp.npy"
+        tmp_manifest = f"{manifest_path}.tmp"
+
+        np.save(tmp_matrix, matrix)
+
+        with open(tmp_manifest, "w") as f:
+            json.dump({"ids": ids, "metadata": metadata}, f)
+
+        # Matrix first: the manifest mtime is what triggers reloads
+        os.replace(tmp_matrix, matrix_path)
+        os.replace(tmp_manifest, manifest_path)
+
+        self._namespaces[namespace] = _Namespace(
+            ids,
+            metadata,
+            matrix,
+            os.stat(manifest_path).st_mtime,
+        )
+
+        logger.info(f"[LocalVectorStore] {namespace}: {len(ids)} vectors")
+
+    @staticmethod
+    def _normalize(matrix: np.ndarray) -> np.ndarray:
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return matrix / norms
@@ -1,16 +1,24 @@
 from typing import List, Dict, Any
 from pinecone import Pinecone
 from app.core.config import settings
+from .vector_store import VectorStore
 
 
-class PineconeClient:
+class PineconeClient(VectorStore):
     """
     Encapsulates all interactions with Pinecone vector database.
     """
 
     def __init__(self):
-        self._pc = Pinecone(api_key=settings.PINECONE_API_KEY)
-        self._index = self._pc.Index(settings.PINECONE_INDEX_NAME)
+        self._pc = Pinecone(
+            api_key=settings.PINECONE_API_KEY,
+            pool_threads=settings.PINECONE_POOL_THREADS,
+        )
+        self._index = self._pc.Index(
+            settings.PINECONE_INDEX_NAME,
+            pool_threads=settings.PINECONE_POOL_THREADS,
+            connection_pool_maxsize=settings.PINECONE_CONNECTION_POOL_MAXSIZE,
+        )
 
     def upsert_vector(
         self,
@@ -47,6 +55,36 @@ class PineconeClient:
             namespace=namespace,
         )
 
+    def delete_namespace(self, namespace: str) -> None:
+        try:
+            self._index.delete(delete_all=True, namespace=namespace)
+        except Exception as e:
+            # Pinecone answers 404 for a namespace that was never written
+            if getattr(e, "status", None) != 404:
+                raise
+
+    def fetch_vectors(
+        self,
+        vector_ids: List[str],
+        namespace: str,
+    ) -> Dict[str, List[float]]:
+        """
+        Fetch stored vector values by id.
+        Missing ids are simply absent from the result.
+        """
+        if not vector_ids:
+            return {}
+
+        response = self._index.fetch(
+            ids=vector_ids,
+            namespace=namespace,
+        )
+
+        return {
+            vector_id: list(vector.values)
+            for vector_id, vector in response.vectors.items()
+        }
+
     def similarity_search(
         self,
         query_vector: List[float],
@@ -63,4 +101,4 @@ class PineconeClient:
             include_metadata=True,
         )
 
-        return response.get("matches", [])
\ No newline at end of file
+        return response.get("matches", [])
@@ -0,0 +1,60 @@
+import os
+import threading
+from typing import Any, Callable, Dict
+
+from .embedding_client import EmbeddingClient
+from .llm_client import LLMClient
+from .tavily_client import TavilyClient
+from .vector_store import VectorStore, build_vector_store
+
+# Process-wide client instances, keyed by name. Clients hold HTTP/gRPC
+# connection pools, so they are built lazily once per process and never
+# shared across a fork (the owning pid is checked on every lookup).
+_clients: Dict[str, Any] = {}
+_owner_pid = os.getpid()
+_lock = threading.Lock()
+
+
+def _get(name: str, factory: Callable[[], Any]) -> Any:
+    global _owner_pid
+
+    if _owner_pid != os.getpid():
+        reset_clients()
+
+    client = _clients.get(name)
+
+    if client is None:
+        with _lock:
+            client = _clients.get(name)
+            if client is None:
+                client = factory()
+                _clients[name] = client
+
+    return client
+
+
+def reset_clients() -> None:
+    """
+    Drop every cached client. Called in freshly forked worker processes.
+    """
+    global _owner_pid
+
+    with _lock:
+        _clients.clear()
+        _owner_pid = os.getpid()
+
+
+def get_llm_client() -> LLMClient:
+    return _get("llm", LLMClient)
+
+
+def get_embedding_client() -> EmbeddingClient:
+    return _get("embedding", EmbeddingClient)
+
+
+def get_tavily_client() -> TavilyClient:
+    return _get("tavily", TavilyClient)
+
+
+def get_vector_store() -> VectorStore:
+    return _get("vector_store", build_vector_store)
@@ -0,0 +1,223 @@
+import hashlib
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional
+
+from app.core.config import settings
+from app.core.redis_client import get_redis
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def build_search_cache_key(query: str, **params: Any) -> str:
+    """
+    Cache key from the normalized query plus every search parameter
+    that changes the result set.
+    """
+    normalized_query = _WHITESPACE_RE.sub(" ", query).strip().lower()
+
+    payload = json.dumps(
+        {"query": normalized_query, **params},
+        sort_keys=True,
+    )
+
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class SearchCache(ABC):
+    """
+    Base class for Tavily search-result caches.
+
+    Backends must never break a search: errors are logged and treated
+    as a cache miss.
+    """
+
+    def __init__(self, ttl_seconds: int, max_entries: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[List[Dict]]:
+        try:
+            value = self._get(key)
+        except Exception as e:
+            logger.warning(f"[SearchCache] get failed: {e}")
+            value = None
+
+        self._record(hit=value is not None)
+        return value
+
+    def set(self, key: str, value: List[Dict]) -> None:
+        try:
+            self._set(key, value)
+        except Exception as e:
+            logger.warning(f"[SearchCache] set failed: {e}")
+
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses}
+
+    def _record(self, hit: bool) -> None:
+        if hit:
+            self.hits += 1
+        else:
+            self.misses += 1
+
+    @abstractmethod
+    def _get(self, key: str) -> Optional[List[Dict]]:
+        """
+        Cached results for `key`, or None when missing or expired.
+        """
+
+    @abstractmethod
+    def _set(self, key: str, value: List[Dict]) -> None:
+        """
+        Store results under `key` for `ttl_seconds`.
+        """
+
+
+class RedisSearchCache(SearchCache):
+    """
+    Shared cache on the Redis instance used by Celery.
+
+    Entries expire via TTL; a sorted set of keys by insertion time keeps
+    the cache under `max_entries`. Hit/miss counters are shared by all
+    processes.
+    """
+
+    PREFIX = "tavily:cache:"
+    INDEX_KEY = "tavily:cache:index"
+    STATS_KEY = "tavily:cache:stats"
+
+    def __init__(self, ttl_seconds: int, max_entries: int, client=None):
+        super().__init__(ttl_seconds, max_entries)
+        self._redis = client or get_redis()
+
+    def stats(self) -> Dict[str, int]:
+        try:
+            shared = self._redis.hgetall(self.STATS_KEY)
+        except Exception:
+            return super().stats()
+
+        return {
+            "hits": int(shared.get("hits", 0)),
+            "misses": int(shared.get("misses", 0)),
+        }
+
+    def _record(self, hit: bool) -> None:
+        super()._record(hit)
+
+        try:
+            self._redis.hincrby(self.STATS_KEY, "hits" if hit else "misses", 1)
+        except Exception:
+            pass
+
+    def _get(self, key: str) -> Optional[List[Dict]]:
+        raw = self._redis.get(self.PREFIX + key)
+        return json.loads(raw) if raw is not None else None
+
+    def _set(self, key: str, value: List[Dict]) -> None:
+        now = time.time()
+
+        pipe = self._redis.pipeline()
+        pipe.setex(self.PREFIX + key, self.ttl_seconds, json.dumps(value))
+        pipe.zadd(self.INDEX_KEY, {key: now})
+        pipe.zremrangebyscore(self.INDEX_KEY, "-inf", now - self.ttl_seconds)
+        pipe.zcard(self.INDEX_KEY)
+        size = pipe.execute()[-1]
+
+        # Size-bounded eviction: drop the oldest entries
+        overflow = size - self.max_entries
+        if overflow > 0:
+            evicted = [k for k, _ in self._redis.zpopmin(self.INDEX_KEY, overflow)]
+            if evicted:
+                self._redis.delete(*[self.PREFIX + k for k in evicted])
+
+
+class SQLiteSearchCache(SearchCache):
+    """
+    On-disk fallback for local runs and tests (no Redis needed).
+    """
+
+    def __init__(self, path: str, ttl_seconds: int, max_entries: int):
+        super().__init__(ttl_seconds, max_entries)
+
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS search_cache (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                expires_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.commit()
+
+    def _get(self, key: str) -> Optional[List[Dict]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM search_cache WHERE key = ? AND expires_at > ?",
+                (key, time.time()),
+            ).fetchone()
+
+        return json.loads(row[0]) if row else None
+
+    def _set(self, key: str, value: List[Dict]) -> None:
+        now = time.time()
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO search_cache VALUES (?, ?, ?, ?)",
+                (key, json.dumps(value), now, now + self.ttl_seconds),
+            )
+            self._conn.execute(
+                "DELETE FROM search_cache WHERE expires_at <= ?",
+                (now,),
+            )
+            self._conn.execute(
+                """
+                DELETE FROM search_cache WHERE key IN (
+                    SELECT key FROM search_cache
+                    ORDER BY created_at DESC
+                    LIMIT -1 OFFSET ?
+                )
+                """,
+                (self.max_entries,),
+            )
+            self._conn.commit()
+
+
+def build_search_cache() -> Optional[SearchCache]:
+    """
+    Build the cache selected by TAVILY_CACHE_BACKEND.
+    """
+    backend = settings.TAVILY_CACHE_BACKEND.lower()
+
+    if backend == "redis":
+        return RedisSearchCache(
+            ttl_seconds=settings.TAVILY_CACHE_TTL_SECONDS,
+            max_entries=settings.TAVILY_CACHE_MAX_ENTRIES,
+        )
+
+    if backend == "sqlite":
+        return SQLiteSearchCache(
+            path=settings.TAVILY_CACHE_SQLITE_PATH,
+            ttl_seconds=settings.TAVILY_CACHE_TTL_SECONDS,
+            max_entries=settings.TAVILY_CACHE_MAX_ENTRIES,
+        )
+
+    return None
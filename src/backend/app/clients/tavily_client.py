@@ -1,31 +1,73 @@
-from typing import List, Dict
+from typing import List, Dict, Optional
 from tavily import TavilyClient as TavilySDKClient
 from app.core.config import settings
+from app.core.rate_limiter import call_with_backoff, get_rate_limiter
+from app.clients.search_cache import (
+    SearchCache,
+    build_search_cache,
+    build_search_cache_key,
+)
+
+_UNSET = object()
 
 
 class TavilyClient:
     """
     Encapsulates Tavily web search functionality.
+    Results are served from the configured search cache when possible.
     """
 
-    def __init__(self):
+    def __init__(self, cache: Optional[SearchCache] = _UNSET):
         self._client = TavilySDKClient(api_key=settings.TAVILY_API_KEY)
+        self._cache = build_search_cache() if cache is _UNSET else cache
+        self._limiter = get_rate_limiter("tavily", "search")
 
     def search(
         self,
         query: str,
         max_results: int = 3,
+        timeout: Optional[int] = None,
+        use_cache: bool = True,
     ) -> List[Dict]:
         """
         Perform a web search query.
         Returns a list of result dictionaries.
         """
 
-        response = self._client.search(
+        params = self._build_params(max_results)
+
+        cache_key = None
+
+        if use_cache and self._cache is not None:
+            cache_key = build_search_cache_key(query, **params)
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        response = call_with_backoff(
+            self._client.search,
+            limiter=self._limiter,
             query=query,
-            search_depth="basic",
-            max_results=max_results,
-            include_raw_content=True,
+            timeout=timeout or settings.REQUEST_TIMEOUT_SECONDS,
+            **params,
         )
 
-        return response.get("results", [])
\ No newline at end of file
+        results = response.get("results", [])
+
+        # Empty result sets are not cached, they are often transient
+        if cache_key and results:
+            self._cache.set(cache_key, results)
+
+        return results
+
+    def _build_params(self, max_results: int) -> Dict:
+        return {
+            "search_depth": "basic",
+            "max_results": max_results,
+            "include_raw_content": True,
+        }
+
+    def cache_stats(self) -> Dict[str, int]:
+        if self._cache is None:
+            return {"hits": 0, "misses": 0}
+        return self._cache.stats()
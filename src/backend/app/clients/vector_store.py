@@ -0,0 +1,90 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List
+
+from ..core.config import settings
+
+
+class VectorStore(ABC):
+    """
+    Interface shared by every vector database backend.
+
+    Matches are returned Pinecone-style: dicts with `id`, `score`
+    and `metadata`, highest score first.
+    """
+
+    @abstractmethod
+    def upsert_batch(
+        self,
+        vectors: List[Dict[str, Any]],
+        namespace: str,
+    ) -> None:
+        """
+        Insert or update vectors. Each dict must contain: id, values, metadata
+        """
+
+    @abstractmethod
+    def fetch_vectors(
+        self,
+        vector_ids: List[str],
+        namespace: str,
+    ) -> Dict[str, List[float]]:
+        """
+        Fetch stored vector values by id.
+        Missing ids are simply absent from the result.
+        """
+
+    @abstractmethod
+    def similarity_search(
+        self,
+        query_vector: List[float],
+        namespace: str,
+        top_k: int = 5,
+    ) -> List[Dict[str, Any]]:
+        """
+        Perform similarity search inside a namespace.
+        """
+
+    @abstractmethod
+    def delete_namespace(self, namespace: str) -> None:
+        """
+        Remove every vector of a namespace (no error if it does not exist).
+        """
+
+    def upsert_vector(
+        self,
+        vector_id: str,
+        values: List[float],
+        metadata: Dict[str, Any],
+        namespace: str,
+    ) -> None:
+        """
+        Insert or update a single vector in a namespace.
+        """
+        self.upsert_batch(
+            vectors=[
+                {
+                    "id": vector_id,
+                    "values": values,
+                    "metadata": metadata,
+                }
+            ],
+            namespace=namespace,
+        )
+
+
+def build_vector_store() -> VectorStore:
+    """
+    Build the backend selected by VECTOR_STORE_BACKEND.
+    Use `registry.get_vector_store()` to share one instance per process.
+    """
+    backend = settings.VECTOR_STORE_BACKEND.lower()
+
+    if backend == "pinecone":
+        from .pinecone_client import PineconeClient
+        return PineconeClient()
+
+    if backend == "local":
+        from .local_vector_store import LocalVectorStore
+        return LocalVectorStore()
+
+    raise ValueError(f"Unknown VECTOR_STORE_BACKEND: {settings.VECTOR_STORE_BACKEND}")
@@ -0,0 +1,212 @@
+import json
+import logging
+import time
+from typing import Any, AsyncIterator, Dict, Optional
+
+from ..models.enums import PROGRESS_MAP, AnalysisStatus
+from .config import settings
+from .redis_client import get_async_redis, get_redis
+
+logger = logging.getLogger(__name__)
+
+TERMINAL_STATUSES = {
+    AnalysisStatus.ANALYSIS_COMPLETED.value,
+    AnalysisStatus.COMPLETED.value,
+    AnalysisStatus.FAILED.value,
+}
+
+# Streams per analysis: "events" (pipeline progress) and
+# "strategy" (sales strategy sections, reset on each generation)
+TERMINAL_EVENTS = {"strategy_completed", "strategy_failed"}
+
+
+def _channel(analysis_id: int, stream: str = "events") -> str:
+    return f"analysis:{analysis_id}:{stream}"
+
+
+def _history_key(analysis_id: int, stream: str = "events") -> str:
+    return f"analysis:{analysis_id}:{stream}:history"
+
+
+def _seq_key(analysis_id: int, stream: str = "events") -> str:
+    return f"analysis:{analysis_id}:{stream}:seq"
+
+
+def _timing_key(analysis_id: int) -> str:
+    return f"analysis:{analysis_id}:timing"
+
+
+# ─────────────────────────────────────────────
+# Publishing (Celery tasks, sync)
+# ─────────────────────────────────────────────
+def publish_analysis_event(
+    analysis_id: int,
+    event: str,
+    data: Dict[str, Any],
+    stream: str = "events",
+) -> None:
+    """
+    Publish an event to live subscribers and keep it in a short history
+    so clients connecting mid-pipeline can catch up.
+
+    Never raises: progress events must not break the pipeline.
+    """
+    try:
+        redis = get_redis()
+
+        payload = {
+            "id": redis.incr(_seq_key(analysis_id, stream)),
+            "event": event,
+            "analysis_id": analysis_id,
+            "timestamp": time.time(),
+            "data": data,
+        }
+        message = json.dumps(payload, default=str)
+
+        pipe = redis.pipeline()
+        pipe.rpush(_history_key(analysis_id, stream), message)
+        pipe.ltrim(_history_key(analysis_id, stream), -settings.ANALYSIS_EVENTS_HISTORY, -1)
+        pipe.expire(_history_key(analysis_id, stream), settings.ANALYSIS_EVENTS_TTL_SECONDS)
+        pipe.expire(_seq_key(analysis_id, stream), settings.ANALYSIS_EVENTS_TTL_SECONDS)
+        pipe.publish(_channel(analysis_id, stream), message)
+        pipe.execute()
+
+    except Exception as e:
+        logger.warning(f"[AnalysisEvents] Could not publish {event} for {analysis_id}: {e}")
+
+
+def publish_status(
+    analysis_id: int,
+    status: AnalysisStatus,
+    error: Optional[str] = None,
+) -> None:
+    """
+    Status transition event. Carries the time spent in every stage so far
+    (ms, keyed by status), measured from the previous transition.
+    """
+    status = AnalysisStatus(status)
+    timings: Dict[str, int] = {}
+
+    try:
+        redis = get_redis()
+        now = time.time()
+
+        previous = redis.hgetall(_timing_key(analysis_id))
+
+        if previous.get("status") and previous.get("started_at"):
+            elapsed_ms = int((now - float(previous["started_at"])) * 1000)
+            redis.hset(_timing_key(analysis_id), f"ms:{previous['status']}", elapsed_ms)
+
+        redis.hset(
+            _timing_key(analysis_id),
+            mapping={"status": status.value, "started_at": now},
+        )
+        redis.expire(_timing_key(analysis_id), settings.ANALYSIS_EVENTS_TTL_SECONDS)
+
+        timings = {
+            key[3:]: int(value)
+            for key, value in redis.hgetall(_timing_key(analysis_id)).items()
+            if key.startswith("ms:")
+        }
+
+    except Exception as e:
+        logger.warning(f"[AnalysisEvents] Could not record timings for {analysis_id}: {e}")
+
+    data = {
+        "status": status.value,
+        "progress": PROGRESS_MAP.get(status, 0),
+        "stage_timings_ms": timings,
+    }
+
+    if error:
+        data["error"] = error
+
+    publish_analysis_event(analysis_id, "status", data)
+
+
+# ─────────────────────────────────────────────
+# Subscribing (API, async)
+# ─────────────────────────────────────────────
+async def reset_analysis_events(analysis_id: int, stream: str) -> None:
+    """
+    Forget the history of a stream before it is produced again
+    (e.g. when a sales strategy is regenerated).
+    """
+    try:
+        await get_async_redis().delete(_history_key(analysis_id, stream))
+    except Exception as e:
+        logger.warning(f"[AnalysisEvents] Could not reset {stream} for {analysis_id}: {e}")
+
+
+async def subscribe_analysis_events(
+    analysis_id: int,
+    keepalive_seconds: float = 15.0,
+    stream: str = "events",
+) -> AsyncIterator[Optional[Dict[str, Any]]]:
+    """
+    Yield past events from the history, then live ones, in order and
+    without duplicates. Yields None as a keepalive tick when idle.
+    Stops after a terminal event.
+    """
+    redis = get_async_redis()
+    pubsub = redis.pubsub()
+
+    # Subscribe before reading the history so nothing falls in between
+    await pubsub.subscribe(_channel(analysis_id, stream))
+
+    try:
+        last_id = 0
+
+        for message in await redis.lrange(_history_key(analysis_id, stream), 0, -1):
+            event = json.loads(message)
+            last_id = event["id"]
+            yield event
+
+            if _is_terminal(event):
+                return
+
+        while True:
+            message = await pubsub.get_message(
+                ignore_subscribe_messages=True,
+                timeout=keepalive_seconds,
+            )
+
+            if message is None:
+                yield None
+                continue
+
+            event = json.loads(message["data"])
+
+            if event["id"] <= last_id:
+                continue
+
+            last_id = event["id"]
+            yield event
+
+            if _is_terminal(event):
+                return
+
+    finally:
+        await pubsub.unsubscribe(_channel(analysis_id, stream))
+        await pubsub.aclose()
+
+
+def _is_terminal(event: Dict[str, Any]) -> bool:
+    if event["event"] in TERMINAL_EVENTS:
+        return True
+
+    return event["event"] == "status" and event["data"].get("status") in TERMINAL_STATUSES
+
+
+def format_sse(event: Optional[Dict[str, Any]]) -> str:
+    """
+    Serialize an event in text/event-stream format (None → keepalive comment).
+    """
+    if event is None:
+        return ": keepalive\n\n"
+
+    return (
+        f"id: {event['id']}\n"
+        f"event: {event['event']}\n"
+        f"data: {json.dumps(event, default=str)}\n\n"
+    )
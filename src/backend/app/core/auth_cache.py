@@ -0,0 +1,187 @@
+import json
+import logging
+from abc import ABC, abstractmethod
+from dataclasses import asdict, dataclass
+from typing import Optional
+
+from ..utils.lru import LRUCache
+from .config import settings
+from .redis_client import get_async_redis
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class NamedRef:
+    id: int
+    name: str
+
+
+@dataclass(frozen=True)
+class AuthenticatedUser:
+    """
+    Detached snapshot of the authenticated user, returned by
+    `get_current_user`. Load the ORM `User` by id to modify it.
+    """
+    id: int
+    email: str
+    first_name: Optional[str]
+    last_name: Optional[str]
+    role_id: Optional[int]
+    region_id: Optional[int]
+    role: Optional[NamedRef]
+    region: Optional[NamedRef]
+    token_version: int
+    is_active: bool
+    is_deleted: bool
+
+    @classmethod
+    def from_user(cls, user) -> "AuthenticatedUser":
+        return cls(
+            id=user.id,
+            email=user.email,
+            first_name=user.first_name,
+            last_name=user.last_name,
+            role_id=user.role_id,
+            region_id=user.region_id,
+            role=NamedRef(user.role.id, user.role.name) if user.role else None,
+            region=NamedRef(user.region.id, user.region.name) if user.region else None,
+            token_version=user.token_version,
+            is_active=user.is_active,
+            is_deleted=user.is_deleted,
+        )
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self))
+
+    @classmethod
+    def from_json(cls, raw: str) -> "AuthenticatedUser":
+        data = json.loads(raw)
+
+        for field in ("role", "region"):
+            if data[field] is not None:
+                data[field] = NamedRef(**data[field])
+
+        return cls(**data)
+
+
+class AuthUserCache(ABC):
+    """
+    Short-TTL cache of authenticated users, keyed by email. A snapshot is
+    only served for the token_version it was loaded with, so revoked
+    tokens always fall through to the database check.
+
+    Backend errors are logged and treated as a cache miss.
+    """
+
+    async def get(self, email: str, token_version: int) -> Optional[AuthenticatedUser]:
+        try:
+            user = await self._get(email)
+        except Exception as e:
+            logger.warning(f"[AuthUserCache] get failed: {e}")
+            return None
+
+        if user is None or user.token_version != token_version:
+            return None
+
+        return user
+
+    async def set(self, user: AuthenticatedUser) -> None:
+        try:
+            await self._set(user)
+        except Exception as e:
+            logger.warning(f"[AuthUserCache] set failed: {e}")
+
+    async def invalidate(self, email: str) -> None:
+        """
+        Call whenever token_version, role, region or the active/deleted
+        flags of a user change.
+        """
+        try:
+            await self._delete(email)
+        except Exception as e:
+            logger.warning(f"[AuthUserCache] invalidate failed: {e}")
+
+    @abstractmethod
+    async def _get(self, email: str) -> Optional[AuthenticatedUser]:
+        """
+        Cached snapshot for `email`, or None.
+        """
+
+    @abstractmethod
+    async def _set(self, user: AuthenticatedUser) -> None:
+        """
+        Store the snapshot under its email.
+        """
+
+    @abstractmethod
+    async def _delete(self, email: str) -> None:
+        """
+        Drop the snapshot of `email` (no error if absent).
+        """
+
+
+class MemoryAuthUserCache(AuthUserCache):
+    """
+    Per-process LRU. Invalidation only reaches the current process:
+    use with a single API worker.
+    """
+
+    def __init__(self, ttl_seconds: int, max_entries: int):
+        self._lru = LRUCache(max_entries, ttl_seconds=ttl_seconds)
+
+    async def _get(self, email):
+        return self._lru.get(email)
+
+    async def _set(self, user):
+        self._lru.set(user.email, user)
+
+    async def _delete(self, email):
+        self._lru.delete(email)
+
+
+class RedisAuthUserCache(AuthUserCache):
+    """
+    Shared across API workers, so invalidation is immediate everywhere.
+    """
+
+    PREFIX = "auth:user:"
+
+    def __init__(self, ttl_seconds: int):
+        self.ttl_seconds = ttl_seconds
+
+    async def _get(self, email):
+        raw = await get_async_redis().get(self.PREFIX + email)
+        return AuthenticatedUser.from_json(raw) if raw else None
+
+    async def _set(self, user):
+        await get_async_redis().setex(self.PREFIX + user.email, self.ttl_seconds, user.to_json())
+
+    async def _delete(self, email):
+        await get_async_redis().delete(self.PREFIX + email)
+
+
+def build_auth_user_cache() -> Optional[AuthUserCache]:
+    """
+    Build the cache selected by AUTH_USER_CACHE_BACKEND.
+    """
+    backend = settings.AUTH_USER_CACHE_BACKEND.lower()
+
+    if backend == "redis":
+        return RedisAuthUserCache(ttl_seconds=settings.AUTH_USER_CACHE_TTL_SECONDS)
+
+    if backend == "memory":
+        return MemoryAuthUserCache(
+            ttl_seconds=settings.AUTH_USER_CACHE_TTL_SECONDS,
+            max_entries=settings.AUTH_USER_CACHE_MAX_ENTRIES,
+        )
+
+    return None
+
+
+auth_user_cache = build_auth_user_cache()
+
+
+async def invalidate_auth_user(email: str) -> None:
+    if auth_user_cache is not None:
+        await auth_user_cache.invalidate(email)
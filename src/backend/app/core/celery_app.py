@@ -1,6 +1,11 @@
+import logging
 from celery import Celery
+from celery.schedules import crontab
+from celery.signals import worker_init, worker_process_init
 from ..core.config import settings
 
+logger = logging.getLogger(__name__)
+
 celery = Celery(
     "HPE_Account_Intelligence",
     broker=settings.CELERY_BROKER_URL,
@@ -12,12 +17,92 @@ from ..services.ai.tasks import product_index_task
 from ..services.ai.tasks import research_task
 from ..services.ai.tasks import insight_task
 from ..services.ai.tasks import recommendation_task
+from ..services.ai.tasks import pipeline_task
+from ..services.ai.tasks import sales_strategy_task
+from ..services.ai.tasks import daily_priority_task
 
 celery.conf.update(
     task_track_started=True,
+    # Enforced by the prefork pool only; threads-pool queues (research,
+    # llm) run without them (see docker-compose.yml)
     task_time_limit=60 * 10,  # 10 min hard limit
     task_soft_time_limit=60 * 8,
     worker_max_tasks_per_child=50,
 )
 
-celery.conf.task_default_queue = "default"
\ No newline at end of file
+celery.conf.task_default_queue = "default"
+
+# ─────────────────────────────────────────────
+# Queues per pipeline stage, so bulk or slow work
+# cannot starve user-triggered analyses:
+#   research  → Tavily + embeddings (I/O bound)
+#   llm       → insight / recommendation generation
+#   indexing  → product seed + catalog indexing (bulk)
+#   strategy  → sales strategy generation
+#   default   → lightweight pipeline callbacks
+# ─────────────────────────────────────────────
+_TASKS = "app.services.ai.tasks"
+
+celery.conf.task_routes = {
+    f"{_TASKS}.research_task.*": {"queue": "research"},
+    f"{_TASKS}.insight_task.*": {"queue": "llm"},
+    f"{_TASKS}.recommendation_task.*": {"queue": "llm"},
+    f"{_TASKS}.product_index_task.*": {"queue": "indexing"},
+    f"{_TASKS}.product_seed_task.*": {"queue": "indexing"},
+    f"{_TASKS}.sales_strategy_task.*": {"queue": "strategy"},
+}
+
+# Long tasks should not sit prefetched behind other long tasks
+celery.conf.worker_prefetch_multiplier = 1
+celery.conf.task_acks_late = True
+
+# ─────────────────────────────────────────────
+# Periodic jobs (run by `celery beat`)
+# ─────────────────────────────────────────────
+celery.conf.beat_schedule = {
+    "refresh-daily-priorities": {
+        "task": f"{_TASKS}.daily_priority_task.refresh_daily_priorities",
+        "schedule": crontab(
+            hour=settings.DAILY_PRIORITY_REFRESH_HOUR,
+            minute=settings.DAILY_PRIORITY_REFRESH_MINUTE,
+        ),
+    },
+}
+
+
+@worker_process_init.connect
+def warm_worker_process(**kwargs):
+    """
+    Give each forked worker process its own clients, then embed the
+    constant retrieval queries once.
+    """
+    from ..clients.registry import reset_clients
+
+    # Connection pools inherited from the parent must not be reused
+    reset_clients()
+
+    _warm_retrieval_vectors()
+
+
+@worker_init.connect
+def warm_worker(sender=None, **kwargs):
+    """
+    worker_process_init only fires in prefork children; threads/solo
+    workers (research, llm queues) run tasks in this process, so warm here.
+    """
+    pool = getattr(sender, "pool_cls", "") or ""
+    pool_name = pool if isinstance(pool, str) else pool.__module__
+
+    if "prefork" not in pool_name:
+        _warm_retrieval_vectors()
+
+
+def _warm_retrieval_vectors():
+    from ..clients.registry import get_embedding_client
+    from ..services.ai.retrieval import get_aspect_query_vectors
+
+    try:
+        get_aspect_query_vectors(get_embedding_client())
+    except Exception as e:
+        # Not fatal: the first insight task will retry lazily
+        logger.warning(f"[Celery] Could not warm retrieval query vectors: {e}")
@@ -4,7 +4,7 @@ Reads from environment variables (.env file).
 """
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from typing import List
+from typing import List, Optional
 
 
 class Settings(BaseSettings):
@@ -30,6 +30,10 @@ class Settings(BaseSettings):
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int
     REFRESH_EXPIRE_DAYS: int
+    # Resolved user per (email, token_version); invalidated on revocation
+    AUTH_USER_CACHE_BACKEND: str = "redis"  # redis | memory | none
+    AUTH_USER_CACHE_TTL_SECONDS: int = 30
+    AUTH_USER_CACHE_MAX_ENTRIES: int = 1024
 
     # ── CORS ──────────────────────────────────────────────────────────────────
     CORS_ORIGINS: List[str] = ["http://localhost:3000", "http://127.0.0.1:3000"]
@@ -41,6 +45,16 @@ class Settings(BaseSettings):
     MAX_TOKENS: int = 1024
     TEMPERATURE: float = 0.7
 
+    # ── LLM response cache ────────────────────────────────────────────────────
+    LLM_CACHE_ENABLED: bool = True
+    LLM_CACHE_TTL_SECONDS: int = 60 * 60 * 24 * 7
+    LLM_CACHE_LOCAL_MAX_ENTRIES: int = 256
+
+    # ── Embedding cache ───────────────────────────────────────────────────────
+    EMBEDDING_CACHE_ENABLED: bool = True
+    EMBEDDING_CACHE_PATH: str = "/app/data/embedding_cache.sqlite3"
+    EMBEDDING_CACHE_LOCAL_MAX_ENTRIES: int = 2048
+
     # ── Embeddings (local fallback) ───────────────────────────────────────────
     EMBEDDING_MODEL: str = "sentence-transformers/all-MiniLM-L6-v2"
     FAISS_INDEX_PATH: str = "/app/data/faiss_index"
@@ -52,15 +66,84 @@ class Settings(BaseSettings):
     TAVILY_MAX_QUERIES: int = 3
     REQUEST_TIMEOUT_SECONDS: int = 15
 
+    # ── Research pipeline ────────────────────────────────────────────────────
+    RESEARCH_MAX_CONCURRENCY: int = 3
+    RESEARCH_QUERY_TIMEOUT_SECONDS: int = 20
+    RESEARCH_EMBED_BATCH_SIZE: int = 16
+    RESEARCH_UPSERT_BATCH_SIZE: int = 100
+    RESEARCH_CHUNK_SIZE: int = 1200  # characters
+    RESEARCH_CHUNK_OVERLAP: int = 200
+    RESEARCH_MAX_CHUNKS_PER_DOCUMENT: int = 40
+
+    # ── Insight generation ───────────────────────────────────────────────────
+    INSIGHT_RETRIEVAL_TOP_K: int = 20
+    INSIGHT_CONTEXT_TOKEN_BUDGET: int = 3000
+    INSIGHT_CONTEXT_DEDUP_THRESHOLD: float = 0.8
+
+    # ── Recommendations ──────────────────────────────────────────────────────
+    # "analysis": one batched task per analysis | "insight": one task per insight
+    RECOMMENDATION_MODE: str = "analysis"
+
+    # ── Product catalog cache ────────────────────────────────────────────────
+    PRODUCT_CATALOG_CHECK_SECONDS: int = 5
+    PRODUCT_CATALOG_FALLBACK_TTL_SECONDS: int = 300
+
+    # ── Local product vector index ───────────────────────────────────────────
+    PRODUCT_INDEX_ENABLED: bool = True
+    PRODUCT_INDEX_PATH: str = "/app/data/product_index"
+    PRODUCT_INDEX_RELOAD_CHECK_SECONDS: int = 5
+
+    # ── Vector store ──────────────────────────────────────────────
+    # "pinecone" or "local" (flat index under FAISS_INDEX_PATH)
+    VECTOR_STORE_BACKEND: str = "pinecone"
 
     # ── Pinecone ────────────────────────────────────────────────────
-    PINECONE_API_KEY: str
-    PINECONE_INDEX_NAME: str
+    PINECONE_API_KEY: Optional[str] = None
+    PINECONE_INDEX_NAME: Optional[str] = None
+    PINECONE_POOL_THREADS: int = 4
+    PINECONE_CONNECTION_POOL_MAXSIZE: int = 16
+
+    # ── Analysis progress events (SSE) ───────────────────────────
+    ANALYSIS_EVENTS_HISTORY: int = 200
+    ANALYSIS_EVENTS_TTL_SECONDS: int = 60 * 60 * 24
+    ANALYSIS_EVENTS_KEEPALIVE_SECONDS: int = 15
+    # Publish sales strategy sections as the LLM writes them
+    STRATEGY_STREAMING_ENABLED: bool = True
+
+    # ── Daily priorities snapshot ────────────────────────────────
+    # Top-N per user materialized by the nightly beat job (UTC)
+    DAILY_PRIORITY_SNAPSHOT_SIZE: int = 10
+    DAILY_PRIORITY_REFRESH_HOUR: int = 2
+    DAILY_PRIORITY_REFRESH_MINUTE: int = 0
+
+    # ── Provider rate limits (shared Redis token buckets) ────────
+    RATE_LIMIT_ENABLED: bool = True
+    GEMINI_LLM_RPM: int = 60
+    GEMINI_EMBEDDING_RPM: int = 1500
+    TAVILY_RPM: int = 100
+    RATE_LIMIT_BURST_SECONDS: int = 5
+    RATE_LIMIT_MAX_WAIT_SECONDS: int = 60
+
+    # Jittered exponential backoff on 429 / 503
+    BACKOFF_MAX_ATTEMPTS: int = 5
+    BACKOFF_BASE_SECONDS: float = 1.0
+    BACKOFF_MAX_SECONDS: float = 30.0
 
     # ── Celery ────────────────────────────────────────────────────
     CELERY_BROKER_URL: str
     CELERY_RESULT_BACKEND: str
 
+    # ── Redis (caches) ────────────────────────────────────────────
+    # Defaults to the Celery broker when not set
+    REDIS_URL: Optional[str] = None
+    REDIS_MAX_CONNECTIONS: int = 50
+
+    # ── Tavily search cache ───────────────────────────────────────
+    TAVILY_CACHE_BACKEND: str = "redis"  # redis | sqlite | none
+    TAVILY_CACHE_TTL_SECONDS: int = 60 * 60 * 6
+    TAVILY_CACHE_MAX_ENTRIES: int = 5000
+    TAVILY_CACHE_SQLITE_PATH: str = "/app/data/tavily_cache.sqlite3"
+
     model_config = SettingsConfigDict(
         env_file = ".env",
         env_file_encoding = "utf-8",
@@ -0,0 +1,313 @@
+import asyncio
+import logging
+import math
+import random
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from .config import settings
+from .redis_client import get_redis
+
+logger = logging.getLogger(__name__)
+
+
+# Token bucket, refilled continuously at `rate` tokens/second up to
+# `capacity`. Uses the Redis clock so every worker agrees on time.
+# Returns {allowed, tokens_left, seconds_to_wait}.
+_TOKEN_BUCKET_LUA = """
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local requested = tonumber(ARGV[3])
+
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+
+local allowed = 0
+local wait = 0
+
+if tokens >= requested then
+    tokens = tokens - requested
+    allowed = 1
+else
+    wait = (requested - tokens) / rate
+end
+
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate) * 2 + 1)
+
+return {allowed, tostring(tokens), tostring(wait)}
+"""
+
+_RETRYABLE_STATUS = {429, 503}
+_RETRYABLE_MARKERS = ("429", "503", "resource_exhausted", "unavailable", "rate limit")
+# Daily / project quota exhaustion also comes back as 429 but will not
+# clear within a backoff window, so retrying only burns the remaining budget
+_EXHAUSTED_MARKERS = ("perday", "per day", "daily", "monthly", "billing_disabled", "billing not enabled")
+
+
+class RateLimitExceeded(Exception):
+    """
+    Raised when a call could not get a token within the allowed wait.
+    """
+
+
+class RateLimiter:
+    """
+    Distributed token bucket shared by every process through Redis.
+
+    If Redis is unavailable the limiter fails open (calls proceed and
+    rely on backoff), so an outage never blocks the pipeline.
+    """
+
+    KEY_PREFIX = "ratelimit:bucket:"
+    STATS_PREFIX = "ratelimit:stats:"
+
+    def __init__(self, name: str, per_minute: int, burst_seconds: Optional[int] = None):
+        self.name = name
+        self.per_minute = per_minute
+        self.rate = per_minute / 60.0
+        burst_seconds = burst_seconds or settings.RATE_LIMIT_BURST_SECONDS
+        self.capacity = max(1, math.ceil(self.rate * burst_seconds))
+        self._script = None
+
+    # ===============================
+    # PUBLIC METHODS
+    # ===============================
+
+    def acquire(self, tokens: int = 1, max_wait: Optional[float] = None) -> None:
+        deadline = time.monotonic() + (max_wait or settings.RATE_LIMIT_MAX_WAIT_SECONDS)
+        throttled = False
+
+        while True:
+            allowed, _, wait = self._take(tokens)
+
+            if allowed:
+                break
+
+            throttled = True
+            if time.monotonic() + wait > deadline:
+                self._count("rejected")
+                raise RateLimitExceeded(f"{self.name}: no budget within wait limit")
+
+            time.sleep(wait)
+
+        if throttled:
+            self._count("throttled")
+
+    async def aacquire(self, tokens: int = 1, max_wait: Optional[float] = None) -> None:
+        deadline = time.monotonic() + (max_wait or settings.RATE_LIMIT_MAX_WAIT_SECONDS)
+        throttled = False
+
+        while True:
+            allowed, _, wait = await asyncio.to_thread(self._take, tokens)
+
+            if allowed:
+                break
+
+            throttled = True
+            if time.monotonic() + wait > deadline:
+                await asyncio.to_thread(self._count, "rejected")
+                raise RateLimitExceeded(f"{self.name}: no budget within wait limit")
+
+            await asyncio.sleep(wait)
+
+        if throttled:
+            await asyncio.to_thread(self._count, "throttled")
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Current budget without consuming a token.
+        """
+        _, tokens, _ = self._take(0)
+
+        try:
+            stats = get_redis().hgetall(self.STATS_PREFIX + self.name)
+        except Exception:
+            stats = {}
+
+        return {
+            "name": self.name,
+            "per_minute": self.per_minute,
+            "capacity": self.capacity,
+            "available": round(tokens, 2) if tokens is not None else None,
+            **{k: int(v) for k, v in stats.items()},
+        }
+
+    def count_retry(self) -> None:
+        self._count("retries")
+
+    # ===============================
+    # INTERNAL HELPERS
+    # ===============================
+
+    def _take(self, tokens: int):
+        try:
+            if self._script is None:
+                self._script = get_redis().register_script(_TOKEN_BUCKET_LUA)
+
+            allowed, left, wait = self._script(
+                keys=[self.KEY_PREFIX + self.name],
+                args=[self.rate, self.capacity, tokens],
+            )
+            return bool(int(allowed)), float(left), float(wait)
+
+        except Exception as e:
+            logger.warning(f"[RateLimiter] {self.name}: Redis unavailable, failing open ({e})")
+            return True, None, 0.0
+
+    def _count(self, field: str) -> None:
+        try:
+            get_redis().hincrby(self.STATS_PREFIX + self.name, field, 1)
+        except Exception:
+            pass
+
+
+# ─────────────────────────────────────────────
+# Limiters per provider / model
+# ─────────────────────────────────────────────
+_limiters: Dict[str, RateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def _limit_for(provider: str) -> int:
+    return {
+        "gemini-llm": settings.GEMINI_LLM_RPM,
+        "gemini-embedding": settings.GEMINI_EMBEDDING_RPM,
+        "tavily": settings.TAVILY_RPM,
+    }[provider]
+
+
+def get_rate_limiter(provider: str, model: str = "default") -> Optional[RateLimiter]:
+    """
+    Shared limiter for a provider/model pair, or None when disabled.
+    """
+    if not settings.RATE_LIMIT_ENABLED:
+        return None
+
+    name = f"{provider}:{model}"
+
+    limiter = _limiters.get(name)
+
+    if limiter is None:
+        with _limiters_lock:
+            limiter = _limiters.get(name)
+            if limiter is None:
+                limiter = RateLimiter(name, per_minute=_limit_for(provider))
+                _limiters[name] = limiter
+
+    return limiter
+
+
+def rate_limit_snapshot() -> List[Dict[str, Any]]:
+    """
+    Budget of every configured provider/model bucket.
+    """
+    if not settings.RATE_LIMIT_ENABLED:
+        return []
+
+    return [
+        get_rate_limiter(provider, model).snapshot()
+        for provider, model in (
+            ("gemini-llm", settings.GEMINI_LLM_MODEL),
+            ("gemini-embedding", settings.GEMINI_EMBEDDING_MODEL),
+            ("tavily", "search"),
+        )
+    ]
+
+
+# ─────────────────────────────────────────────
+# Jittered exponential backoff
+# ─────────────────────────────────────────────
+def is_retryable_error(exc: Exception) -> bool:
+    """
+    True for provider throttling / overload (HTTP 429 / 503 and the
+    equivalent gRPC codes), whatever SDK raised it. Daily quota
+    exhaustion is not retryable.
+    """
+    message = f"{type(exc).__name__} {exc}".lower()
+    if any(marker in message for marker in _EXHAUSTED_MARKERS):
+        return False
+
+    for attr in ("status_code", "code", "status"):
+        value = getattr(exc, attr, None)
+        if isinstance(value, int) and value in _RETRYABLE_STATUS:
+            return True
+
+    response = getattr(exc, "response", None)
+    if getattr(response, "status_code", None) in _RETRYABLE_STATUS:
+        return True
+
+    return any(marker in message for marker in _RETRYABLE_MARKERS)
+
+
+def _backoff_delay(attempt: int) -> float:
+    # "Full jitter": uniform in [0, min(cap, base * 2^attempt)]
+    ceiling = min(
+        settings.BACKOFF_MAX_SECONDS,
+        settings.BACKOFF_BASE_SECONDS * (2 ** attempt),
+    )
+    return random.uniform(0, ceiling)
+
+
+def call_with_backoff(
+    fn: Callable[..., Any],
+    *args,
+    limiter: Optional[RateLimiter] = None,
+    **kwargs,
+) -> Any:
+    """
+    Take a token, call `fn`, and retry throttling errors with jittered
+    exponential backoff. Other errors propagate immediately.
+    """
+    for attempt in range(settings.BACKOFF_MAX_ATTEMPTS):
+        if limiter is not None:
+            limiter.acquire()
+
+        try:
+            return fn(*args, **kwargs)
+        except Exception as e:
+            if not is_retryable_error(e) or attempt == settings.BACKOFF_MAX_ATTEMPTS - 1:
+                raise
+
+            delay = _backoff_delay(attempt)
+            logger.warning(f"[Backoff] {e.__class__.__name__}, retrying in {delay:.1f}s")
+
+            if limiter is not None:
+                limiter.count_retry()
+
+            time.sleep(delay)
+
+
+async def acall_with_backoff(
+    fn: Callable[..., Awaitable[Any]],
+    *args,
+    limiter: Optional[RateLimiter] = None,
+    **kwargs,
+) -> Any:
+    """
+    Async variant of call_with_backoff.
+    """
+    for attempt in range(settings.BACKOFF_MAX_ATTEMPTS):
+        if limiter is not None:
+            await limiter.aacquire()
+
+        try:
+            return await fn(*args, **kwargs)
+        except Exception as e:
+            if not is_retryable_error(e) or attempt == settings.BACKOFF_MAX_ATTEMPTS - 1:
+                raise
+
+            delay = _backoff_delay(attempt)
+            logger.warning(f"[Backoff] {e.__class__.__name__}, retrying in {delay:.1f}s")
+
+            if limiter is not None:
+                await asyncio.to_thread(limiter.count_retry)
+
+            await asyncio.sleep(delay)
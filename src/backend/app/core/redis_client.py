@@ -0,0 +1,39 @@
+import redis
+import redis.asyncio as aioredis
+from .config import settings
+
+_redis = None
+_async_redis = None
+
+
+def get_redis() -> redis.Redis:
+    """
+    Shared Redis connection (lazy, one pool per process).
+    Uses REDIS_URL, falling back to the Celery broker.
+    """
+    global _redis
+
+    if _redis is None:
+        _redis = redis.Redis.from_url(
+            settings.REDIS_URL or settings.CELERY_BROKER_URL,
+            decode_responses=True,
+            max_connections=settings.REDIS_MAX_CONNECTIONS,
+        )
+
+    return _redis
+
+
+def get_async_redis() -> aioredis.Redis:
+    """
+    asyncio Redis client for the API process (pub/sub subscribers).
+    """
+    global _async_redis
+
+    if _async_redis is None:
+        _async_redis = aioredis.Redis.from_url(
+            settings.REDIS_URL or settings.CELERY_BROKER_URL,
+            decode_responses=True,
+            max_connections=settings.REDIS_MAX_CONNECTIONS,
+        )
+
+    return _async_redis
@@ -5,6 +5,7 @@ from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from ..models.user import User
 from sqlalchemy.orm import selectinload
 from ..core.security import verify_token
+from ..core.auth_cache import AuthenticatedUser, auth_user_cache
 from ..models.user import User
 from sqlalchemy import select
 from .deps import get_db
@@ -16,7 +17,11 @@ security = HTTPBearer()
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: AsyncSession = Depends(get_db),
-) -> User:
+) -> AuthenticatedUser:
+    """
+    Resolve the token to a detached user snapshot (see AuthenticatedUser).
+    Snapshots are cached briefly per (email, token_version).
+    """
 
     token = credentials.credentials
 
@@ -31,26 +36,37 @@ async def get_current_user(
     email: str = payload.get("sub")
     token_version: int = payload.get("token_version")
 
-    # Fetch user with eager-loaded relationships to avoid lazy loading in async context
-    result = await db.execute(
-        select(User)
-        .options(
-            selectinload(User.role),
-            selectinload(User.region)
-        )
-        .where(User.email == email)
-    )
+    user = None
 
-    user = result.scalar_one_or_none()
+    if auth_user_cache is not None:
+        user = await auth_user_cache.get(email, token_version)
 
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not found"
+    if user is None:
+        # Fetch user with eager-loaded relationships to avoid lazy loading in async context
+        result = await db.execute(
+            select(User)
+            .options(
+                selectinload(User.role),
+                selectinload(User.region)
+            )
+            .where(User.email == email)
         )
 
+        db_user = result.scalar_one_or_none()
+
+        if not db_user:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="User not found"
+            )
+
+        user = AuthenticatedUser.from_user(db_user)
+
+        if auth_user_cache is not None:
+            await auth_user_cache.set(user)
+
     # Ensure user is active (soft delete / suspension check)
-    if not user.is_active:
+    if not user.is_active or user.is_deleted:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="User is inactive"
@@ -73,10 +89,10 @@ def require_role(required_role: str):
     """
     
     async def role_checker(
-        current_user: User = Depends(get_current_user)
-    ) -> User:
+        current_user: AuthenticatedUser = Depends(get_current_user)
+    ) -> AuthenticatedUser:
 
-        if current_user.role.name != required_role:
+        if current_user.role is None or current_user.role.name != required_role:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Insufficient permissions"
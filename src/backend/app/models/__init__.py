@@ -13,4 +13,5 @@ from .user_session import UserSession
 from .industry import Industry
 from .insight_source import InsightSource
 from .research_document import ResearchDocument
+from .research_chunk import ResearchChunk
 from . sales_strategy import SalesStrategy
\ No newline at end of file
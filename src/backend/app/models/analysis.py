@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, JSON
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, JSON, Index, text
 from ..db.database import Base
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -10,6 +10,14 @@ class Analysis(Base):
     The core fact table. Stores the result of an AI analysis session.
     """
     __tablename__ = "analyses"
+    __table_args__ = (
+        Index("ix_analyses_user_status", "user_id", "status"),
+        Index(
+            "ix_analyses_user_completed",
+            "user_id",
+            postgresql_where=text("status = 'completed'"),
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"))
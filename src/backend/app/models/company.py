@@ -1,6 +1,7 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Index
+from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
-from .base import Base  # o tu Base real
+from ..db.database import Base
 
 class Company(Base):
     __tablename__ = "companies"
@@ -10,6 +11,7 @@ class Company(Base):
 
     # ✅ esto es lo que tu BD tiene
     industry = Column(String, nullable=True)
+    industry_id = Column(Integer, ForeignKey("industries.id"), nullable=True)
 
     domain = Column(String, nullable=True)
     description = Column(String, nullable=True)
@@ -19,4 +21,14 @@ class Company(Base):
     last_research_at = Column(DateTime(timezone=True), nullable=True)
     is_simulated = Column(Boolean, nullable=False, server_default="false")
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now(), nullable=True)
\ No newline at end of file
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now(), nullable=True)
+
+    # Relationships
+    # (`industry` is the free-text column above, so the catalog row is `industry_ref`)
+    industry_ref = relationship("Industry", back_populates="companies")
+    analyses = relationship("Analysis", back_populates="company")
+    daily_priorities = relationship("DailyPriority", back_populates="company")
+
+
+# create_analysis looks companies up case-insensitively
+Index("ix_companies_name_lower", func.lower(Company.name))
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, DateTime, ForeignKey, String
+from sqlalchemy import Column, Integer, DateTime, ForeignKey, String, Float, Index
 from ..db.database import Base
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -6,17 +6,24 @@ from sqlalchemy.sql import func
 class DailyPriority(Base):
     """
     Stores the pre-calculated 'Top 5 Accounts' for the dashboard.
-    Populated by a nightly Cron Job.
+    Populated by a nightly Celery beat job and refreshed per user when
+    one of their analyses completes.
     """
     __tablename__ = "daily_priorities"
+    __table_args__ = (
+        # Dashboard read: WHERE user_id = ? ORDER BY rank_position
+        Index("ix_daily_priorities_user_rank", "user_id", "rank_position"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"))
     company_id = Column(Integer, ForeignKey("companies.id"))
+    analysis_id = Column(Integer, ForeignKey("analyses.id", ondelete="CASCADE"), nullable=True)
     
     report_date = Column(DateTime(timezone=True), server_default=func.now())
-    rank_position = Column(Integer)  # 1 to 5
+    rank_position = Column(Integer)  # 1 = highest daily score
     reason_short = Column(String(255))  # e.g., "New CTO announced yesterday"
+    daily_score = Column(Float)
     
     # Relationships
     user = relationship("User", back_populates="daily_priorities")
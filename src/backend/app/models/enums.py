@@ -31,6 +31,7 @@ PROGRESS_MAP = {
     AnalysisStatus.RESEARCHING: 20,
     AnalysisStatus.INSIGHT_PROCESSING: 40,
     AnalysisStatus.RECOMMENDING: 60,
+    AnalysisStatus.ANALYSIS_COMPLETED: 100,
     AnalysisStatus.STRATEGY_GENERATING: 85,
     AnalysisStatus.COMPLETED: 100,
     AnalysisStatus.FAILED: 100,
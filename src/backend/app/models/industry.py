@@ -10,4 +10,4 @@ class Industry(Base):
     name = Column(String(100), unique=True, nullable=False)
     description = Column(Text, nullable=True)
 
-    companies = relationship("Company", back_populates="industry")
\ No newline at end of file
+    companies = relationship("Company", back_populates="industry_ref")
\ No newline at end of file
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, Index
 from ..db.database import Base
 from sqlalchemy.orm import relationship
 from .enums import InsightSeverity
@@ -8,6 +8,9 @@ class Insight(Base):
     Specific findings detected by the AI (e.g., 'Cloud Migration Detected').
     """
     __tablename__ = "insights"
+    __table_args__ = (
+        Index("ix_insights_analysis_id", "analysis_id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     analysis_id = Column(Integer, ForeignKey("analyses.id"))
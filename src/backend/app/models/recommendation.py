@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, Boolean, Text, ForeignKey, Float
+from sqlalchemy import Column, Integer, Boolean, Text, ForeignKey, Float, Index
 from ..db.database import Base
 from sqlalchemy.orm import relationship
 
@@ -7,6 +7,9 @@ class Recommendation(Base):
     Links a detected Insight (Problem) to an HPE Product (Solution).
     """
     __tablename__ = "recommendations"
+    __table_args__ = (
+        Index("ix_recommendations_insight_accepted", "insight_id", "is_accepted"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     insight_id = Column(Integer, ForeignKey("insights.id"))
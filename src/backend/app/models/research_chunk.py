@@ -0,0 +1,34 @@
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Index
+from ..db.database import Base
+from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
+
+class ResearchChunk(Base):
+    """
+    A passage of a ResearchDocument, embedded on its own for retrieval.
+    Offsets point back into the parent's raw_content.
+    """
+    __tablename__ = "research_chunks"
+    __table_args__ = (
+        # Embedding reuse: WHERE content_hash IN (...)
+        Index("ix_research_chunks_content_hash", "content_hash"),
+        # Foreign keys walked by cascading deletes
+        Index("ix_research_chunks_research_document_id", "research_document_id"),
+        Index("ix_research_chunks_analysis_id", "analysis_id"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    research_document_id = Column(Integer, ForeignKey("research_documents.id", ondelete="CASCADE"), nullable=False)
+    analysis_id = Column(Integer, ForeignKey("analyses.id", ondelete="CASCADE"), nullable=False)
+
+    chunk_index = Column(Integer, nullable=False)
+    start_offset = Column(Integer, nullable=False)
+    end_offset = Column(Integer, nullable=False)
+
+    content = Column(Text, nullable=False)
+    content_hash = Column(String(64))
+    embedding_id = Column(String(255))
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    research_document = relationship("ResearchDocument", back_populates="chunks")
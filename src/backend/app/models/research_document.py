@@ -1,10 +1,13 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Float
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Float, Index
 from ..db.database import Base
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
 class ResearchDocument(Base):
     __tablename__ = "research_documents"
+    __table_args__ = (
+        Index("ix_research_documents_analysis_id", "analysis_id"),
+    )
 
     id = Column(Integer, primary_key=True)
     analysis_id = Column(Integer, ForeignKey("analyses.id"))
@@ -24,4 +27,5 @@ class ResearchDocument(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     analysis = relationship("Analysis", back_populates="research_documents")
-    insight_sources = relationship("InsightSource", back_populates="research_document", cascade="all, delete-orphan")
\ No newline at end of file
+    insight_sources = relationship("InsightSource", back_populates="research_document", cascade="all, delete-orphan")
+    chunks = relationship("ResearchChunk", back_populates="research_document", cascade="all, delete-orphan", order_by="ResearchChunk.chunk_index")
\ No newline at end of file
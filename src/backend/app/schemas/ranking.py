@@ -7,4 +7,11 @@ class RankedProduct(BaseModel):
     reasoning: str
 
 class RankingOutput(BaseModel):
-    ranked_products: List[RankedProduct]
\ No newline at end of file
+    ranked_products: List[RankedProduct]
+
+class InsightRanking(BaseModel):
+    insight_id: int
+    ranked_products: List[RankedProduct]
+
+class AnalysisRankingOutput(BaseModel):
+    insights: List[InsightRanking]
@@ -0,0 +1,87 @@
+import re
+from typing import Dict, List, Tuple
+
+from ...utils.tokens import estimate_tokens
+
+_WORD_RE = re.compile(r"\w+")
+
+
+class ContextBuilder:
+    """
+    Packs retrieved passages into a prompt context under a token budget.
+
+    Passages are ranked by similarity score, near-duplicates are dropped,
+    and the rest are added greedily while they still fit the budget.
+    Each passage is a dict with at least `text` and `score`.
+    """
+
+    SEPARATOR = "\n\n"
+
+    def __init__(
+        self,
+        token_budget: int,
+        dedup_threshold: float = 0.8,
+        shingle_size: int = 3,
+    ):
+        self.token_budget = token_budget
+        self.dedup_threshold = dedup_threshold
+        self.shingle_size = shingle_size
+
+    def build(self, passages: List[Dict]) -> Tuple[str, List[Dict]]:
+        """
+        Returns (context, selected passages in prompt order).
+        """
+        ranked = sorted(passages, key=lambda p: p.get("score") or 0, reverse=True)
+
+        separator_tokens = estimate_tokens(self.SEPARATOR)
+        remaining = self.token_budget
+
+        selected = []
+        selected_shingles = []
+
+        for passage in ranked:
+            text = (passage.get("text") or "").strip()
+            if not text:
+                continue
+
+            cost = estimate_tokens(text) + (separator_tokens if selected else 0)
+            if cost > remaining:
+                # A smaller, lower-ranked passage may still fit
+                continue
+
+            shingles = self._shingles(text)
+            if any(
+                self._similarity(shingles, other) >= self.dedup_threshold
+                for other in selected_shingles
+            ):
+                continue
+
+            selected.append(passage)
+            selected_shingles.append(shingles)
+            remaining -= cost
+
+        context = self.SEPARATOR.join(p["text"].strip() for p in selected)
+
+        return context, selected
+
+    # ===============================
+    # INTERNAL HELPERS
+    # ===============================
+
+    def _shingles(self, text: str) -> frozenset:
+        words = _WORD_RE.findall(text.lower())
+        size = self.shingle_size
+
+        if len(words) < size:
+            return frozenset([" ".join(words)])
+
+        return frozenset(
+            hash(" ".join(words[i:i + size]))
+            for i in range(len(words) - size + 1)
+        )
+
+    @staticmethod
+    def _similarity(a: frozenset, b: frozenset) -> float:
+        if not a or not b:
+            return 0.0
+        return len(a & b) / len(a | b)
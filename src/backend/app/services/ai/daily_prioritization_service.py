@@ -1,75 +1,250 @@
 import logging
-from sqlalchemy import select, func
+from sqlalchemy import select, func, case, literal, delete, insert
+from ...core.config import settings
+from ...models.analysis import Analysis
+from ...models.company import Company
+from ...models.daily_priority import DailyPriority
+from ...models.enums import AnalysisStatus
 from ...models.insight import Insight
 from ...models.recommendation import Recommendation
 
 logger = logging.getLogger(__name__)
 
+# Weight of the most severe insight of an analysis (unknown → 1.0)
+SEVERITY_WEIGHTS = {
+    "high": 1.25,
+    "medium": 1.1,
+    "low": 1.0
+}
+DEFAULT_SEVERITY_WEIGHT = 1.0
+
 
 class DailyPrioritizationService:
+    """
+    Ranks a user's completed analyses by daily score:
+
+        0.35 * strategic + 0.25 * propensity
+        + 0.25 * highest severity weight + 0.15 * max recommendation confidence
+
+    The score is computed in a single aggregate query, so the cost does
+    not grow in round-trips with the size of the portfolio. The top
+    DAILY_PRIORITY_SNAPSHOT_SIZE rows per user are also materialized in
+    `daily_priorities` (see `build_snapshot_statements`).
+    """
 
     def __init__(self, db):
         self.db = db  # AsyncSession
 
-    async def generate_daily_top(self, analyses, limit: int = 5):
+    async def get_daily_top(self, user_id: int, limit: int = 5):
+        """
+        Dashboard read: the stored snapshot when it covers `limit`,
+        otherwise (or before the first refresh) the live ranking.
+        """
+        if limit <= settings.DAILY_PRIORITY_SNAPSHOT_SIZE:
+            ranked = await self.get_snapshot_top(user_id, limit)
+            if ranked:
+                return ranked
 
-        ranked_companies = []
+        return await self.generate_daily_top(user_id, limit)
 
-        for analysis in analyses:
+    async def get_snapshot_top(self, user_id: int, limit: int = 5):
 
-            highest_severity_weight = await self._get_highest_severity_weight(analysis.id)
-            max_recommendation_confidence = await self._get_max_recommendation_confidence(analysis.id)
-
-            daily_score = (
-                0.35 * (analysis.strategic_score or 0) +
-                0.25 * (analysis.propensity_score or 0) +
-                0.25 * highest_severity_weight +
-                0.15 * max_recommendation_confidence
+        result = await self.db.execute(
+            select(
+                DailyPriority.analysis_id,
+                DailyPriority.company_id,
+                DailyPriority.daily_score,
+                DailyPriority.reason_short,
+                Company.name.label("company_name"),
+                Company.industry.label("industry")
             )
+            .join(Company, Company.id == DailyPriority.company_id)
+            .where(DailyPriority.user_id == user_id)
+            .order_by(DailyPriority.rank_position)
+            .limit(limit)
+        )
 
-            ranked_companies.append({
-                "analysis_id": analysis.id,
-                "company_id": analysis.company_id,
-                "daily_score": round(daily_score, 4)
-            })
+        return [
+            {
+                "analysis_id": row.analysis_id,
+                "company_id": row.company_id,
+                "company_name": row.company_name,
+                "industry": row.industry,
+                "daily_score": round(row.daily_score or 0, 4)
+            }
+            for row in result.all()
+        ]
+
+    async def generate_daily_top(self, user_id: int, limit: int = 5):
+
+        query = self.build_score_query().where(Analysis.user_id == user_id)
+
+        query = (
+            query
+            .order_by(
+                query.selected_columns.daily_score.desc(),
+                Analysis.id.desc()
+            )
+            .limit(limit)
+        )
 
-        ranked_companies.sort(
-            key=lambda x: x["daily_score"],
-            reverse=True
+        result = await self.db.execute(query)
+
+        return [
+            {
+                "analysis_id": row.analysis_id,
+                "company_id": row.company_id,
+                "company_name": row.company_name,
+                "industry": row.industry,
+                "daily_score": round(row.daily_score, 4)
+            }
+            for row in result.all()
+        ]
+
+    # ===============================
+    # QUERY BUILDING
+    # ===============================
+
+    @classmethod
+    def build_score_query(cls):
+        """
+        SELECT of every completed analysis with its company and daily score.
+        Insights and recommendations are pre-aggregated per analysis so the
+        joins do not multiply rows.
+        """
+        severity = cls._severity_subquery()
+        confidence = cls._confidence_subquery()
+
+        daily_score = cls._daily_score_expression(severity, confidence)
+
+        return (
+            select(
+                Analysis.id.label("analysis_id"),
+                Analysis.user_id.label("user_id"),
+                Analysis.company_id.label("company_id"),
+                Company.name.label("company_name"),
+                Company.industry.label("industry"),
+                daily_score.label("daily_score")
+            )
+            .join(Company, Company.id == Analysis.company_id)
+            .outerjoin(severity, severity.c.analysis_id == Analysis.id)
+            .outerjoin(confidence, confidence.c.analysis_id == Analysis.id)
+            .where(Analysis.status == AnalysisStatus.COMPLETED)
         )
 
-        return ranked_companies[:limit]
+    @classmethod
+    def build_snapshot_statements(cls, size: int, user_id: int = None):
+        """
+        DELETE + INSERT ... SELECT that rewrite the snapshot for every user
+        (or only `user_id`) in one set-based pass. ROW_NUMBER() ranks the
+        analyses per user; the reason is the title of the most severe
+        insight. Execute both in the same transaction.
+        """
+        scored = cls.build_score_query()
+
+        if user_id is not None:
+            scored = scored.where(Analysis.user_id == user_id)
+
+        scored = scored.subquery("scored")
+
+        ranked = (
+            select(
+                scored.c.user_id,
+                scored.c.company_id,
+                scored.c.analysis_id,
+                scored.c.daily_score,
+                func.row_number().over(
+                    partition_by=scored.c.user_id,
+                    order_by=(
+                        scored.c.daily_score.desc(),
+                        scored.c.analysis_id.desc()
+                    )
+                ).label("rank_position")
+            )
+            .subquery("ranked")
+        )
 
-    async def _get_highest_severity_weight(self, analysis_id: int):
+        reason = (
+            select(func.substr(Insight.title, 1, 255))
+            .where(Insight.analysis_id == ranked.c.analysis_id)
+            .order_by(cls._severity_weight().desc(), Insight.id)
+            .limit(1)
+            .scalar_subquery()
+        )
 
-        severity_map = {
-            "high": 1.25,
-            "medium": 1.1,
-            "low": 1.0
-        }
+        rows = (
+            select(
+                ranked.c.user_id,
+                ranked.c.company_id,
+                ranked.c.analysis_id,
+                ranked.c.daily_score,
+                ranked.c.rank_position,
+                reason
+            )
+            .where(ranked.c.rank_position <= size)
+        )
 
-        result = await self.db.execute(
-            select(Insight.severity)
-            .where(Insight.analysis_id == analysis_id)
+        clear = delete(DailyPriority)
+
+        if user_id is not None:
+            clear = clear.where(DailyPriority.user_id == user_id)
+
+        fill = insert(DailyPriority).from_select(
+            [
+                "user_id",
+                "company_id",
+                "analysis_id",
+                "daily_score",
+                "rank_position",
+                "reason_short"
+            ],
+            rows
         )
 
-        severities = result.scalars().all()
+        return clear, fill
 
-        if not severities:
-            return 1.0
+    @staticmethod
+    def _severity_weight():
 
-        return max(
-            severity_map.get(sev.lower(), 1.0)
-            for sev in severities
+        return case(
+            *[
+                (func.lower(Insight.severity) == severity, value)
+                for severity, value in SEVERITY_WEIGHTS.items()
+            ],
+            else_=DEFAULT_SEVERITY_WEIGHT
         )
 
-    async def _get_max_recommendation_confidence(self, analysis_id: int):
+    @classmethod
+    def _severity_subquery(cls):
 
-        result = await self.db.execute(
-            select(func.max(Recommendation.confidence_score))
-            .join(Insight, Recommendation.insight_id == Insight.id)
-            .where(Insight.analysis_id == analysis_id)
+        return (
+            select(
+                Insight.analysis_id.label("analysis_id"),
+                func.max(cls._severity_weight()).label("severity_weight")
+            )
+            .group_by(Insight.analysis_id)
+            .subquery("severity_weights")
         )
 
-        value = result.scalar()
-        return value or 0
\ No newline at end of file
+    @staticmethod
+    def _confidence_subquery():
+
+        return (
+            select(
+                Insight.analysis_id.label("analysis_id"),
+                func.max(Recommendation.confidence_score).label("max_confidence")
+            )
+            .join(Recommendation, Recommendation.insight_id == Insight.id)
+            .group_by(Insight.analysis_id)
+            .subquery("max_confidences")
+        )
+
+    @staticmethod
+    def _daily_score_expression(severity, confidence):
+
+        return (
+            0.35 * func.coalesce(Analysis.strategic_score, 0) +
+            0.25 * func.coalesce(Analysis.propensity_score, 0) +
+            0.25 * func.coalesce(severity.c.severity_weight, literal(DEFAULT_SEVERITY_WEIGHT)) +
+            0.15 * func.coalesce(confidence.c.max_confidence, 0)
+        )
@@ -0,0 +1,202 @@
+import asyncio
+import logging
+import threading
+import time
+import weakref
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from sqlalchemy import select
+from sqlalchemy.orm import selectinload
+
+from ...core.config import settings
+from ...core.redis_client import get_redis
+from ...models.hpe_product import HPEProduct
+
+logger = logging.getLogger(__name__)
+
+VERSION_KEY = "products:catalog_version"
+
+
+@dataclass(frozen=True)
+class CatalogProduct:
+    """
+    Read-only snapshot of an HPEProduct, safe to share across sessions.
+    """
+    id: int
+    name: str
+    category_id: Optional[int]
+    category_name: Optional[str]
+    description: Optional[str]
+    business_value: Optional[str]
+    product_url: Optional[str]
+    is_simulated: bool
+    embedding_hash: Optional[str]
+
+
+def bump_catalog_version() -> None:
+    """
+    Invalidate every worker's catalog after products change. Processes
+    notice on their next version poll (no push notification).
+    """
+    try:
+        get_redis().incr(VERSION_KEY)
+    except Exception as e:
+        logger.warning(f"[ProductCatalog] Could not bump catalog version: {e}")
+
+
+class ProductCatalog:
+    """
+    Versioned in-memory copy of the HPE product catalog.
+
+    Loaded once per process and reloaded only when the shared version in
+    Redis changes (checked at most every PRODUCT_CATALOG_CHECK_SECONDS).
+    If Redis is unavailable the catalog falls back to a plain TTL.
+    """
+
+    def __init__(self):
+        self._products: Dict[int, CatalogProduct] = {}
+        self._version: Optional[str] = None
+        self._loaded = False
+        self._loaded_at = 0.0
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+        # asyncio locks are bound to a loop; Celery tasks run one loop per call
+        self._async_locks: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+    # ===============================
+    # PUBLIC METHODS
+    # ===============================
+
+    def get(self, db, product_id: int) -> Optional[CatalogProduct]:
+        """
+        Lookup using a sync Session for (re)loading.
+        """
+        self._ensure_loaded(db)
+        return self._products.get(product_id)
+
+    async def aget(self, db, product_id: int) -> Optional[CatalogProduct]:
+        """
+        Lookup using an AsyncSession for (re)loading. The Redis version
+        check runs in a thread so it never blocks the event loop.
+        """
+        if not self._recently_checked() and await asyncio.to_thread(self._is_stale):
+            async with self._get_async_lock():
+                # Another coroutine may have reloaded while we waited
+                if not self._loaded:
+                    result = await db.execute(self._load_statement())
+                    self._replace(result.scalars().all())
+
+        return self._products.get(product_id)
+
+    def all(self, db) -> List[CatalogProduct]:
+        self._ensure_loaded(db)
+        return list(self._products.values())
+
+    def invalidate(self) -> None:
+        self._loaded = False
+
+    # ===============================
+    # INTERNAL HELPERS
+    # ===============================
+
+    def _ensure_loaded(self, db) -> None:
+        if self._recently_checked() or not self._is_stale():
+            return
+
+        with self._lock:
+            # Another thread may have reloaded while we waited
+            if self._loaded:
+                return
+
+            products = db.execute(self._load_statement()).scalars().all()
+            self._replace(products)
+
+    def _get_async_lock(self) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+
+        lock = self._async_locks.get(loop)
+
+        if lock is None:
+            lock = asyncio.Lock()
+            self._async_locks[loop] = lock
+
+        return lock
+
+    def _recently_checked(self) -> bool:
+        """
+        Loaded and version checked within PRODUCT_CATALOG_CHECK_SECONDS
+        (no I/O needed).
+        """
+        return (
+            self._loaded
+            and time.monotonic() - self._checked_at < settings.PRODUCT_CATALOG_CHECK_SECONDS
+        )
+
+    def _load_statement(self):
+        return select(HPEProduct).options(selectinload(HPEProduct.category))
+
+    def _replace(self, products) -> None:
+        self._products = {
+            p.id: CatalogProduct(
+                id=p.id,
+                name=p.name,
+                category_id=p.category_id,
+                category_name=p.category.name if p.category else None,
+                description=p.description,
+                business_value=p.business_value,
+                product_url=p.product_url,
+                is_simulated=bool(p.is_simulated),
+                embedding_hash=p.embedding_hash,
+            )
+            for p in products
+        }
+        self._loaded = True
+        self._loaded_at = time.monotonic()
+
+        logger.info(
+            f"[ProductCatalog] Loaded {len(self._products)} products (version={self._version})"
+        )
+
+    def _is_stale(self) -> bool:
+        """
+        Poll the shared version. A stale catalog is marked not loaded, so
+        callers re-check `_loaded` after taking the reload lock.
+        """
+        if not self._loaded:
+            self._version = self._remote_version()
+            self._checked_at = time.monotonic()
+            return True
+
+        now = time.monotonic()
+
+        if now - self._checked_at < settings.PRODUCT_CATALOG_CHECK_SECONDS:
+            return False
+
+        self._checked_at = now
+        version = self._remote_version()
+
+        if version is None:
+            # Redis unavailable: fall back to a plain TTL
+            if now - self._loaded_at > settings.PRODUCT_CATALOG_FALLBACK_TTL_SECONDS:
+                self._loaded = False
+                return True
+
+            return False
+
+        if version != self._version:
+            self._version = version
+            self._loaded = False
+            return True
+
+        return False
+
+    def _remote_version(self) -> Optional[str]:
+        try:
+            return get_redis().get(VERSION_KEY) or "0"
+        except Exception:
+            return None
+
+
+# One catalog per process
+product_catalog = ProductCatalog()
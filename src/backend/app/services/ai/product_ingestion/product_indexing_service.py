@@ -1,12 +1,17 @@
 import hashlib
-from typing import Dict
+import logging
+from typing import Dict, List, Optional
 
 from sqlalchemy.orm import Session, selectinload
 from sqlalchemy import select
 
 from ....models import HPEProduct
 from ....clients.embedding_client import EmbeddingClient
-from ....clients.pinecone_client import PineconeClient
+from ....clients.vector_store import VectorStore
+from ..product_catalog import bump_catalog_version
+from ..product_vector_index import ProductVectorIndex, product_vector_index
+
+logger = logging.getLogger(__name__)
 
 
 class ProductIndexingService:
@@ -14,11 +19,13 @@ class ProductIndexingService:
         self,
         db: Session,
         embedding_client: EmbeddingClient,
-        pinecone_client: PineconeClient,
+        vector_store: VectorStore,
+        vector_index: Optional[ProductVectorIndex] = None,
     ):
         self.db = db
         self.embedding_client = embedding_client
-        self.pinecone_client = pinecone_client
+        self.vector_store = vector_store
+        self.vector_index = vector_index or product_vector_index
 
     # ===============================
     # PUBLIC METHOD
@@ -41,6 +48,8 @@ class ProductIndexingService:
         indexed = 0
         skipped = 0
 
+        new_vectors: Dict[int, List[float]] = {}
+
         for product in products:
             try:
                 product_text = self._build_product_text(product)
@@ -57,13 +66,20 @@ class ProductIndexingService:
                 product.embedding_hash = new_hash
                 self.db.commit()
 
+                new_vectors[product.id] = embedding
                 indexed += 1
 
             except Exception as e:
                 # Don't break all the flow only for one product
-                print(f"[ProductIndexingService] Error indexing product {product.id}: {e}")
+                logger.error(f"[ProductIndexingService] Error indexing product {product.id}: {e}")
                 self.db.rollback()
 
+        self._sync_local_index(products, new_vectors)
+
+        if indexed:
+            # embedding_hash changed → cached catalogs are stale
+            bump_catalog_version()
+
         return {
             "total": total,
             "indexed": indexed,
@@ -74,6 +90,58 @@ class ProductIndexingService:
     # INTERNAL HELPERS
     # ===============================
 
+    def _sync_local_index(
+        self,
+        products: List[HPEProduct],
+        new_vectors: Dict[int, List[float]],
+    ) -> None:
+        """
+        Mirror the `products` namespace into the local NumPy index.
+        Unchanged vectors are kept; missing ones are fetched from the store.
+        """
+        hashes = {p.id: p.embedding_hash for p in products if p.embedding_hash}
+
+        if not new_vectors and self.vector_index.is_current(hashes):
+            return
+
+        try:
+            previous_hashes = self.vector_index.hashes
+            previous_vectors = self.vector_index.get_vectors()
+
+            vectors = {}
+            missing = []
+
+            for product_id, embedding_hash in hashes.items():
+                if product_id in new_vectors:
+                    vectors[product_id] = new_vectors[product_id]
+                elif (
+                    previous_hashes.get(product_id) == embedding_hash
+                    and product_id in previous_vectors
+                ):
+                    vectors[product_id] = previous_vectors[product_id]
+                else:
+                    missing.append(product_id)
+
+            if missing:
+                fetched = self.vector_store.fetch_vectors(
+                    [f"product-{product_id}" for product_id in missing],
+                    namespace="products",
+                )
+                for product_id in missing:
+                    values = fetched.get(f"product-{product_id}")
+                    if values is not None:
+                        vectors[product_id] = values
+
+            # Only record hashes whose vector we actually have
+            self.vector_index.save(
+                vectors,
+                {product_id: hashes[product_id] for product_id in vectors},
+            )
+
+        except Exception as e:
+            # The local index is an optimization, the vector store stays authoritative
+            logger.warning(f"[ProductIndexingService] Could not update local index: {e}")
+
     def _build_product_text(self, product: HPEProduct) -> str:
         category_name = product.category.name if product.category else "Unknown"
 
@@ -101,7 +169,7 @@ class ProductIndexingService:
 
         vector_id = f"product-{product.id}"
 
-        self.pinecone_client.upsert_vector(
+        self.vector_store.upsert_vector(
             vector_id=vector_id,
             values=embedding,
             metadata=metadata,
@@ -2,6 +2,7 @@ from sqlalchemy.orm import Session
 from sqlalchemy import select
 
 from ....models import HPEProduct, ProductCategory
+from ..product_catalog import bump_catalog_version
 
 
 class ProductSeedService:
@@ -88,6 +89,9 @@ class ProductSeedService:
 
         self.db.commit()
 
+        if created:
+            bump_catalog_version()
+
         return {
             "created": created,
             "skipped": skipped,
@@ -0,0 +1,195 @@
+import json
+import logging
+import os
+import threading
+import time
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from ...core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class ProductVectorIndex:
+    """
+    Local NumPy index of the `products` namespace.
+
+    The catalog is tiny, so a brute-force dot product over a normalized
+    float32 matrix is sub-millisecond. The matrix lives in `<path>.npy`
+    (memory-mapped on load) next to a `<path>.json` manifest holding the
+    product ids and their `embedding_hash`. The files are rewritten
+    atomically by ProductIndexingService and reloaded here when their
+    mtime changes.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or settings.PRODUCT_INDEX_PATH
+        self._matrix: Optional[np.ndarray] = None
+        self._ids: List[int] = []
+        self._hashes: Dict[int, str] = {}
+        self._mtime: Optional[float] = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def matrix_path(self) -> str:
+        return f"{self.path}.npy"
+
+    @property
+    def manifest_path(self) -> str:
+        return f"{self.path}.json"
+
+    @property
+    def hashes(self) -> Dict[int, str]:
+        self._maybe_reload()
+        return dict(self._hashes)
+
+    # ===============================
+    # PUBLIC METHODS
+    # ===============================
+
+    def is_current(self, expected_hashes: Dict[int, str]) -> bool:
+        """
+        True when the loaded index holds exactly the given
+        product_id -> embedding_hash mapping.
+        """
+        self._maybe_reload()
+        return self._matrix is not None and self._hashes == expected_hashes
+
+    def search(self, query_vector: List[float], top_k: int = 5) -> List[Dict]:
+        """
+        Cosine top-k. Matches mirror Pinecone's shape so callers can
+        use either source interchangeably.
+        """
+        self._maybe_reload()
+
+        matrix, ids = self._matrix, self._ids
+
+        if matrix is None or not ids:
+            return []
+
+        query = np.asarray(query_vector, dtype=np.float32)
+        norm = np.linalg.norm(query)
+        if norm == 0:
+            return []
+
+        scores = matrix @ (query / norm)
+
+        k = min(top_k, len(ids))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+
+        return [
+            {
+                "id": f"product-{ids[i]}",
+                "score": float(scores[i]),
+                "metadata": {"product_id": ids[i]},
+            }
+            for i in top
+        ]
+
+    def get_vectors(self) -> Dict[int, List[float]]:
+        """
+        Currently stored (normalized) vectors by product id.
+        """
+        self._maybe_reload()
+
+        if self._matrix is None:
+            return {}
+
+        return {
+            product_id: self._matrix[row].tolist()
+            for row, product_id in enumerate(self._ids)
+        }
+
+    def save(
+        self,
+        vectors: Dict[int, List[float]],
+        hashes: Dict[int, str],
+    ) -> None:
+        """
+        Atomically replace the on-disk index.
+        """
+        ids = sorted(vectors)
+
+        if ids:
+            matrix = np.asarray([vectors[i] for i in ids], dtype=np.float32)
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+            norms[norms == 0] = 1.0
+            matrix /= norms
+        else:
+            matrix = np.zeros((0, 0), dtype=np.float32)
+
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+
+        tmp_matrix = f"{self.path}.tmp.npy"
+        tmp_manifest = f"{self.manifest_path}.tmp"
+
+        np.save(tmp_matrix, matrix)
+
+        with open(tmp_manifest, "w") as f:
+            json.dump(
+                {
+                    "ids": ids,
+                    "hashes": {str(i): hashes[i] for i in ids},
+                    "dim": int(matrix.shape[1]) if ids else 0,
+                },
+                f,
+            )
+
+        # Matrix first: the manifest mtime is what triggers reloads
+        os.replace(tmp_matrix, self.matrix_path)
+        os.replace(tmp_manifest, self.manifest_path)
+
+        logger.info(f"[ProductVectorIndex] Saved {len(ids)} product vectors")
+
+    # ===============================
+    # INTERNAL HELPERS
+    # ===============================
+
+    def _maybe_reload(self) -> None:
+        now = time.monotonic()
+
+        if self._mtime is not None and now - self._checked_at < settings.PRODUCT_INDEX_RELOAD_CHECK_SECONDS:
+            return
+
+        self._checked_at = now
+
+        try:
+            mtime = os.stat(self.manifest_path).st_mtime
+        except FileNotFoundError:
+            return
+
+        if mtime == self._mtime:
+            return
+
+        with self._lock:
+            if mtime == self._mtime:
+                return
+
+            try:
+                with open(self.manifest_path) as f:
+                    manifest = json.load(f)
+
+                ids = [int(i) for i in manifest["ids"]]
+                matrix = np.load(self.matrix_path, mmap_mode="r") if ids else None
+
+                if matrix is not None and matrix.shape[0] != len(ids):
+                    raise ValueError("manifest and matrix are out of sync")
+
+            except Exception as e:
+                logger.warning(f"[ProductVectorIndex] Reload failed: {e}")
+                return
+
+            self._matrix = matrix
+            self._ids = ids
+            self._hashes = {int(k): v for k, v in manifest["hashes"].items()}
+            self._mtime = mtime
+
+            logger.info(f"[ProductVectorIndex] Loaded {len(ids)} product vectors")
+
+
+# One index per process
+product_vector_index = ProductVectorIndex()
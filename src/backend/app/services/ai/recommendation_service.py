@@ -1,17 +1,23 @@
 import logging
-from sqlalchemy import delete
+from concurrent.futures import ThreadPoolExecutor
+from sqlalchemy import delete, select
 from ...models.insight import Insight
 from ...models.recommendation import Recommendation
 from ...models.hpe_product import HPEProduct
 from ...models.analysis import Analysis
-from ...clients.embedding_client import EmbeddingClient
-from ...clients.pinecone_client import PineconeClient
-from ...clients.llm_client import LLMClient
+from ...clients.registry import (
+    get_embedding_client,
+    get_llm_client,
+    get_vector_store,
+)
+from .product_catalog import product_catalog
+from .product_vector_index import product_vector_index
+from ...core.config import settings
 
 # =========================
 # LLM Structured Output
 # =========================
-from ...schemas.ranking import RankedProduct, RankingOutput
+from ...schemas.ranking import RankedProduct, RankingOutput, AnalysisRankingOutput
 
 logger = logging.getLogger(__name__)
 
@@ -24,9 +30,9 @@ class RecommendationService:
 
     def __init__(self, db):
         self.db = db
-        self.embedding_client = EmbeddingClient()
-        self.pinecone_client = PineconeClient()
-        self.llm_client = LLMClient()
+        self.embedding_client = get_embedding_client()
+        self.vector_store = get_vector_store()
+        self.llm_client = get_llm_client()
 
     # --------------------------------------------------
     # Financial Alignment (Enterprise Weighting)
@@ -110,38 +116,22 @@ class RecommendationService:
 
         logger.info("[Recommendation] Cleared previous recommendations")
 
-        query_text = f"{insight.title}. {insight.description}"
+        query_text = self._build_query_text(insight)
 
         # --------------------------------------------------
         # Semantic Retrieval (Recall Layer)
         # --------------------------------------------------
         query_vector = self.embedding_client.embed_text(query_text)
 
-        matches = self.pinecone_client.similarity_search(
-            query_vector=query_vector,
-            namespace="products",
-            top_k=top_k
+        matches = self._search_products(
+            query_vector,
+            top_k=top_k,
+            use_local=self._local_index_ready(),
         )
 
-        logger.info(f"[Recommendation] Pinecone returned {len(matches)} matches")
-
-        candidates = []
-
-        for match in matches:
-            product_id = int(match["metadata"]["product_id"])
-            semantic_score = float(match["score"])
-
-            product = self.db.get(HPEProduct, product_id)
-            if not product:
-                logger.warning(
-                    f"[Recommendation] Skipping product_id={product_id} (not found in DB)"
-                )
-                continue
+        logger.info(f"[Recommendation] Product search returned {len(matches)} matches")
 
-            candidates.append({
-                "product": product,
-                "semantic_score": semantic_score
-            })
+        candidates = self._load_candidates(matches)
 
         if not candidates:
             logger.warning("[Recommendation] No valid candidates found")
@@ -151,15 +141,7 @@ class RecommendationService:
         # LLM Re-Ranking (Decision Layer)
         # --------------------------------------------------
 
-        products_context = "\n\n".join([
-            f"""
-            Product ID: {c['product'].id}
-            Name: {c['product'].name}
-            Category ID: {c['product'].category_id}
-            Description: {c['product'].description}
-            """
-            for c in candidates
-        ])
+        products_context = self._build_products_context(candidates)
 
         prompt = f"""
         You are an enterprise AI strategist.
@@ -185,29 +167,252 @@ class RecommendationService:
                 prompt=prompt,
                 output_schema=RankingOutput
             )
-        except Exception:
-            logger.warning("LLM quota exceeded — falling back to semantic ranking")
+        except Exception as e:
+            # Throttling was already retried with backoff inside the client
+            logger.warning(f"LLM ranking failed ({e!r}) — falling back to semantic ranking")
             ranking_result = None
 
+        results = self._score_results(
+            insight=insight,
+            analysis=analysis,
+            candidates=candidates,
+            ranked_products=ranking_result.ranked_products if ranking_result else None,
+        )
+
+        self._persist_recommendations(insight_id, results)
+
+        self.db.commit()
+
+        logger.info(f"[Recommendation] Completed for insight_id={insight_id}")
+
+    def generate_for_analysis(self, analysis_id: int, top_k: int = 3):
+        """
+        Recommend products for every insight of an analysis at once:
+        one embed_batch call, concurrent vector queries and a single
+        LLM re-ranking call over the union of candidates.
+        """
+
+        logger.info(f"[Recommendation] Starting for analysis_id={analysis_id}")
+
+        analysis = self.db.get(Analysis, analysis_id)
+
+        if not analysis:
+            logger.error(f"[Recommendation] Analysis {analysis_id} not found")
+            raise ValueError("Analysis not found")
+
+        insights = self.db.execute(
+            select(Insight)
+            .where(Insight.analysis_id == analysis_id)
+            .order_by(Insight.id)
+        ).scalars().all()
+
+        if not insights:
+            logger.warning("[Recommendation] Analysis has no insights")
+            return
+
+        insight_ids = [insight.id for insight in insights]
+
+        # --------------------------------------------------
+        # Delete previous recommendations (idempotent behavior)
+        # --------------------------------------------------
+        self.db.execute(
+            delete(Recommendation).where(
+                Recommendation.insight_id.in_(insight_ids)
+            )
+        )
+
+        # --------------------------------------------------
+        # Semantic Retrieval (Recall Layer), batched
+        # --------------------------------------------------
+        query_vectors = self.embedding_client.embed_batch(
+            [self._build_query_text(insight) for insight in insights]
+        )
+
+        # Decided once here: the catalog lookup needs the session, which
+        # must not be touched from the worker threads below
+        use_local = self._local_index_ready()
+
+        def _search(query_vector):
+            return self._search_products(query_vector, top_k=top_k, use_local=use_local)
+
+        with ThreadPoolExecutor(
+            max_workers=len(query_vectors),
+            thread_name_prefix="recommendation",
+        ) as executor:
+            matches_per_insight = list(executor.map(_search, query_vectors))
+
+        candidates_by_insight = {
+            insight.id: self._load_candidates(matches)
+            for insight, matches in zip(insights, matches_per_insight)
+        }
+
+        union = {}
+        for candidates in candidates_by_insight.values():
+            for c in candidates:
+                union[c["product"].id] = c
+
+        if not union:
+            logger.warning("[Recommendation] No valid candidates found")
+            return
+
+        # --------------------------------------------------
+        # LLM Re-Ranking (Decision Layer), one call
+        # --------------------------------------------------
+
+        products_context = self._build_products_context(union.values())
+
+        insights_context = "\n\n".join([
+            f"""
+            Insight ID: {insight.id}
+            Title: {insight.title}
+            Description: {insight.description}
+            Severity: {insight.severity}
+            Candidate product IDs: {[c['product'].id for c in candidates_by_insight[insight.id]]}
+            """
+            for insight in insights
+            if candidates_by_insight[insight.id]
+        ])
+
+        prompt = f"""
+        You are an enterprise AI strategist.
+
+        For EACH insight, rank its candidate products by strategic
+        alignment with that insight. Only use the candidate product IDs
+        listed for the insight.
+
+        Return, per insight:
+        - insight_id
+        - ranked_products, each with:
+          - product_id
+          - strategic_score (0-100)
+          - reasoning
+
+        Insights:
+        {insights_context}
+
+        Products:
+        {products_context}
+        """
+
+        try:
+            ranking_result = self.llm_client.generate_structured_output(
+                prompt=prompt,
+                output_schema=AnalysisRankingOutput
+            )
+            ranked_by_insight = {
+                item.insight_id: item.ranked_products
+                for item in ranking_result.insights
+            }
+        except Exception as e:
+            # Throttling was already retried with backoff inside the client
+            logger.warning(f"LLM ranking failed ({e!r}) — falling back to semantic ranking")
+            ranked_by_insight = {}
+
+        for insight in insights:
+            candidates = candidates_by_insight[insight.id]
+
+            if not candidates:
+                continue
+
+            results = self._score_results(
+                insight=insight,
+                analysis=analysis,
+                candidates=candidates,
+                ranked_products=ranked_by_insight.get(insight.id),
+            )
+
+            self._persist_recommendations(insight.id, results)
+
+        self.db.commit()
+
+        logger.info(f"[Recommendation] Completed for analysis_id={analysis_id}")
+
+    # --------------------------------------------------
+    # Shared helpers
+    # --------------------------------------------------
+    def _build_query_text(self, insight: Insight) -> str:
+        return f"{insight.title}. {insight.description}"
+
+    def _local_index_ready(self) -> bool:
+        """
+        The local index is used only when it holds exactly the catalog's
+        current embeddings; otherwise the vector store is queried.
+        """
+        if not settings.PRODUCT_INDEX_ENABLED:
+            return False
+
+        expected = {
+            p.id: p.embedding_hash
+            for p in product_catalog.all(self.db)
+            if p.embedding_hash
+        }
+
+        return bool(expected) and product_vector_index.is_current(expected)
+
+    def _search_products(self, query_vector, top_k: int, use_local: bool):
+        if use_local:
+            return product_vector_index.search(query_vector, top_k=top_k)
+
+        return self.vector_store.similarity_search(
+            query_vector=query_vector,
+            namespace="products",
+            top_k=top_k
+        )
+
+    def _load_candidates(self, matches):
+
+        candidates = []
+
+        for match in matches:
+            product_id = int(match["metadata"]["product_id"])
+            semantic_score = float(match["score"])
+
+            product = product_catalog.get(self.db, product_id)
+            if not product:
+                logger.warning(
+                    f"[Recommendation] Skipping product_id={product_id} (not found in catalog)"
+                )
+                continue
+
+            candidates.append({
+                "product": product,
+                "semantic_score": semantic_score
+            })
+
+        return candidates
+
+    def _build_products_context(self, candidates) -> str:
+        return "\n\n".join([
+            f"""
+            Product ID: {c['product'].id}
+            Name: {c['product'].name}
+            Category ID: {c['product'].category_id}
+            Description: {c['product'].description}
+            """
+            for c in candidates
+        ])
+
+    def _score_results(self, insight, analysis, candidates, ranked_products):
+
         # --------------------------------------------------
         # Hybrid + Enterprise Strategic Fit Scoring
         # --------------------------------------------------
 
         results = []
 
-        if ranking_result:
+        candidates_by_id = {c["product"].id: c for c in candidates}
+
+        if ranked_products:
 
-            for rank_position, item in enumerate(ranking_result.ranked_products, start=1):
+            for rank_position, item in enumerate(ranked_products, start=1):
 
-                product = self.db.get(HPEProduct, item.product_id)
-                if not product:
+                # Ignore products the LLM was not asked about
+                candidate = candidates_by_id.get(item.product_id)
+                if not candidate:
                     continue
 
-                semantic_score = next(
-                    c["semantic_score"]
-                    for c in candidates
-                    if c["product"].id == item.product_id
-                )
+                product = candidate["product"]
+                semantic_score = candidate["semantic_score"]
 
                 llm_score = item.strategic_score / 100
 
@@ -228,7 +433,7 @@ class RecommendationService:
                     "llm_rank_position": rank_position
                 })
 
-        else:
+        if not results:
             # Fallback purely semantic
             for index, c in enumerate(sorted(candidates, key=lambda x: x["semantic_score"], reverse=True), start=1):
 
@@ -249,6 +454,10 @@ class RecommendationService:
                     "llm_rank_position": index
                 })
 
+        return results
+
+    def _persist_recommendations(self, insight_id: int, results):
+
         # --------------------------------------------------
         # Final Sorting by Strategic Fit
         # --------------------------------------------------
@@ -280,7 +489,3 @@ class RecommendationService:
                 f"[Recommendation] Strategic Fit for product_id={item['product'].id} "
                 f"= {final_percentage}% | priority_rank={priority_rank}"
             )
-
-        self.db.commit()
-
-        logger.info(f"[Recommendation] Completed for insight_id={insight_id}")
\ No newline at end of file
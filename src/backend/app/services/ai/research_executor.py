@@ -0,0 +1,99 @@
+import logging
+import math
+from concurrent.futures import ThreadPoolExecutor, TimeoutError, as_completed
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from ...clients.tavily_client import TavilyClient
+from ...core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class ResearchExecutor:
+    """
+    Runs Tavily research queries concurrently on a bounded thread pool.
+
+    Results are yielded in completion order so the caller can start the
+    embedding stage while slower queries are still in flight. All DB work
+    stays on the caller's thread; only the network calls are parallel.
+    """
+
+    def __init__(
+        self,
+        tavily: TavilyClient,
+        max_concurrency: Optional[int] = None,
+        query_timeout: Optional[int] = None,
+    ):
+        self.tavily = tavily
+        self.max_concurrency = max_concurrency or settings.RESEARCH_MAX_CONCURRENCY
+        self.query_timeout = query_timeout or settings.RESEARCH_QUERY_TIMEOUT_SECONDS
+
+    def run(
+        self,
+        queries: List[str],
+        max_results: int = 3,
+    ) -> Iterator[Tuple[str, List[Dict]]]:
+        """
+        Yield (query, results) pairs as each search completes.
+
+        A failed or timed-out query is logged and skipped. If every query
+        fails, the last error is raised so the task can mark the analysis
+        as failed.
+        """
+
+        if not queries:
+            return
+
+        workers = max(1, min(self.max_concurrency, len(queries)))
+
+        # Per-query timeout is enforced by the HTTP call itself; the overall
+        # deadline only guards against a hung worker thread.
+        waves = math.ceil(len(queries) / workers)
+        deadline = self.query_timeout * waves + 5
+
+        succeeded = 0
+        last_error: Optional[BaseException] = None
+
+        executor = ThreadPoolExecutor(
+            max_workers=workers,
+            thread_name_prefix="research",
+        )
+
+        try:
+            futures = {
+                executor.submit(
+                    self.tavily.search,
+                    query=query,
+                    max_results=max_results,
+                    timeout=self.query_timeout,
+                ): query
+                for query in queries
+            }
+
+            try:
+                for future in as_completed(futures, timeout=deadline):
+                    query = futures[future]
+
+                    try:
+                        results = future.result()
+                    except Exception as e:
+                        last_error = e
+                        logger.warning(f"[Research] Query failed: '{query}' ({e})")
+                        continue
+
+                    succeeded += 1
+                    yield query, results
+
+            except TimeoutError as e:
+                last_error = e
+                pending = [q for f, q in futures.items() if not f.done()]
+                logger.warning(
+                    f"[Research] {len(pending)} queries exceeded the {deadline}s deadline"
+                )
+
+        finally:
+            # Don't block on stragglers; their results are discarded
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        if succeeded == 0 and last_error is not None:
+            raise last_error
@@ -0,0 +1,291 @@
+import logging
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+from sqlalchemy import or_, select
+from sqlalchemy.orm import Session
+
+from ...clients.embedding_client import EmbeddingClient
+from ...clients.vector_store import VectorStore
+from ...core.config import settings
+from ...models.analysis import Analysis
+from ...models.company import Company
+from ...models.research_chunk import ResearchChunk
+from ...models.research_document import ResearchDocument
+from ...utils.chunking import iter_chunk_spans
+from ...utils.content import compute_content_hash
+
+logger = logging.getLogger(__name__)
+
+
+class ResearchIndexer:
+    """
+    Splits research documents into chunks and indexes them in batches.
+
+    Chunks are embedded with `embed_batch` once enough of them are
+    pending, and vectors are upserted to the analysis namespace in chunks.
+    A failing batch is logged and skipped so one bad request does not
+    lose the rest of the analysis.
+
+    When a chunk with the same `content_hash` was already indexed for the
+    same company, its stored vector is copied instead of re-embedding.
+    """
+
+    def __init__(
+        self,
+        db: Session,
+        analysis_id: int,
+        company: Company,
+        embedding_client: EmbeddingClient,
+        vector_store: VectorStore,
+        embed_batch_size: Optional[int] = None,
+        upsert_batch_size: Optional[int] = None,
+    ):
+        self.db = db
+        self.analysis_id = analysis_id
+        self.company = company
+        self.namespace = f"analysis_{analysis_id}"
+        self.embedding_client = embedding_client
+        self.vector_store = vector_store
+        self.embed_batch_size = embed_batch_size or settings.RESEARCH_EMBED_BATCH_SIZE
+        self.upsert_batch_size = upsert_batch_size or settings.RESEARCH_UPSERT_BATCH_SIZE
+
+        self._pending: List[ResearchChunk] = []
+        self._vectors: List[Dict] = []
+        self._chunks_by_vector_id: Dict[str, ResearchChunk] = {}
+
+        self.stats = {
+            "documents": 0,
+            "queued": 0,
+            "reused": 0,
+            "embedded": 0,
+            "upserted": 0,
+            "failed": 0,
+        }
+
+    # ===============================
+    # PUBLIC METHODS
+    # ===============================
+
+    def add(self, doc: ResearchDocument) -> None:
+        """
+        Chunk a flushed document (it must already have an id) and queue
+        its chunks for embedding.
+        """
+        text = doc.raw_content or ""
+
+        chunks = []
+
+        for index, (start, end) in enumerate(
+            iter_chunk_spans(
+                text,
+                chunk_size=settings.RESEARCH_CHUNK_SIZE,
+                overlap=settings.RESEARCH_CHUNK_OVERLAP,
+            )
+        ):
+            if index >= settings.RESEARCH_MAX_CHUNKS_PER_DOCUMENT:
+                break
+
+            content = text[start:end]
+
+            chunk = ResearchChunk(
+                research_document=doc,
+                research_document_id=doc.id,
+                analysis_id=self.analysis_id,
+                chunk_index=index,
+                start_offset=start,
+                end_offset=end,
+                content=content,
+                content_hash=compute_content_hash(content),
+            )
+
+            self.db.add(chunk)
+            chunks.append(chunk)
+
+        if not chunks:
+            return
+
+        self.db.flush()  # chunk ids are needed in vector metadata
+
+        self.stats["documents"] += 1
+
+        for chunk in chunks:
+            self._pending.append(chunk)
+            self.stats["queued"] += 1
+
+            if len(self._pending) >= self.embed_batch_size:
+                self._embed_pending()
+
+    def flush(self) -> Dict[str, int]:
+        """
+        Embed whatever is still pending and upsert all vectors.
+        Returns summary stats.
+        """
+        self._embed_pending()
+        self._upsert_vectors()
+
+        if self.stats["queued"] and not self.stats["upserted"]:
+            raise RuntimeError("No research documents could be indexed")
+
+        return self.stats
+
+    # ===============================
+    # INTERNAL HELPERS
+    # ===============================
+
+    def _embed_pending(self) -> None:
+        if not self._pending:
+            return
+
+        batch, self._pending = self._pending, []
+
+        batch = self._reuse_previous_vectors(batch)
+
+        if not batch:
+            return
+
+        texts = [chunk.content for chunk in batch]
+
+        try:
+            embeddings = self.embedding_client.embed_batch(texts)
+        except Exception as e:
+            self.stats["failed"] += len(batch)
+            logger.warning(
+                f"[ResearchIndexer] Embedding batch of {len(batch)} failed: {e}"
+            )
+            return
+
+        for chunk, values in zip(batch, embeddings):
+            self._queue_vector(chunk, values)
+
+        self.stats["embedded"] += len(batch)
+
+    def _reuse_previous_vectors(
+        self,
+        batch: List[ResearchChunk],
+    ) -> List[ResearchChunk]:
+        """
+        Copy vectors of identical chunks indexed by earlier analyses of
+        the same company. Returns the chunks that still need embedding.
+        """
+        hashes = {chunk.content_hash for chunk in batch if chunk.content_hash}
+
+        if not hashes:
+            return batch
+
+        company_filter = Analysis.company_id == self.company.id
+
+        if self.company.website_url:
+            company_filter = or_(
+                company_filter,
+                Company.website_url == self.company.website_url,
+            )
+
+        try:
+            rows = self.db.execute(
+                select(
+                    ResearchChunk.content_hash,
+                    ResearchChunk.analysis_id,
+                    ResearchChunk.embedding_id,
+                )
+                .join(Analysis, ResearchChunk.analysis_id == Analysis.id)
+                .join(Company, Analysis.company_id == Company.id)
+                .where(
+                    ResearchChunk.content_hash.in_(hashes),
+                    ResearchChunk.embedding_id.isnot(None),
+                    ResearchChunk.analysis_id != self.analysis_id,
+                    company_filter,
+                )
+                .order_by(ResearchChunk.id.desc())
+            ).all()
+
+            # Most recent copy wins
+            previous = {}
+            for content_hash, analysis_id, embedding_id in rows:
+                previous.setdefault(content_hash, (analysis_id, embedding_id))
+
+            by_namespace = defaultdict(list)
+            for analysis_id, embedding_id in previous.values():
+                by_namespace[f"analysis_{analysis_id}"].append(embedding_id)
+
+            fetched = {}
+            for namespace, vector_ids in by_namespace.items():
+                for vector_id, values in self.vector_store.fetch_vectors(
+                    vector_ids, namespace
+                ).items():
+                    fetched[(namespace, vector_id)] = values
+
+        except Exception as e:
+            logger.warning(f"[ResearchIndexer] Vector reuse lookup failed: {e}")
+            return batch
+
+        remaining = []
+        reused = 0
+
+        for chunk in batch:
+            source = previous.get(chunk.content_hash)
+            values = None
+
+            if source:
+                analysis_id, embedding_id = source
+                values = fetched.get((f"analysis_{analysis_id}", embedding_id))
+
+            if values is None:
+                remaining.append(chunk)
+                continue
+
+            self._queue_vector(chunk, values)
+            reused += 1
+
+        if reused:
+            self.stats["reused"] += reused
+            logger.info(
+                f"[ResearchIndexer] Reused {reused} vectors from previous analyses"
+            )
+
+        return remaining
+
+    def _queue_vector(self, chunk: ResearchChunk, values: List[float]) -> None:
+        vector = self._build_vector(chunk, values)
+        self._vectors.append(vector)
+        self._chunks_by_vector_id[vector["id"]] = chunk
+
+    def _upsert_vectors(self) -> None:
+        vectors, self._vectors = self._vectors, []
+
+        for start in range(0, len(vectors), self.upsert_batch_size):
+            batch = vectors[start:start + self.upsert_batch_size]
+
+            try:
+                self.vector_store.upsert_batch(
+                    vectors=batch,
+                    namespace=self.namespace,
+                )
+            except Exception as e:
+                self.stats["failed"] += len(batch)
+                logger.warning(
+                    f"[ResearchIndexer] Upsert batch of {len(batch)} failed: {e}"
+                )
+                continue
+
+            # Only chunks whose vector really landed can be reused later
+            for vector in batch:
+                chunk = self._chunks_by_vector_id[vector["id"]]
+                chunk.embedding_id = vector["id"]
+                chunk.research_document.embedding_id = str(chunk.research_document_id)
+
+            self.stats["upserted"] += len(batch)
+
+    def _build_vector(self, chunk: ResearchChunk, values: List[float]) -> Dict:
+        return {
+            "id": f"{chunk.research_document_id}-{chunk.chunk_index}",
+            "values": values,
+            "metadata": {
+                "research_document_id": chunk.research_document_id,
+                "research_chunk_id": chunk.id,
+                "analysis_id": self.analysis_id,
+                "start_offset": chunk.start_offset,
+                "end_offset": chunk.end_offset,
+                "source_url": chunk.research_document.source_url or "",
+            },
+        }
@@ -0,0 +1,109 @@
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+
+from ...clients.embedding_client import EmbeddingClient
+from ...clients.vector_store import VectorStore
+
+logger = logging.getLogger(__name__)
+
+
+# Aspect-specific retrieval queries for insight generation
+ASPECT_QUERIES = {
+    "finance": "Company financial performance, revenue, margins, costs and investments",
+    "technology": "Company technology stack, IT infrastructure, cloud and data platforms",
+    "strategy": "Company business strategy, growth plans, expansion and transformation initiatives",
+    "risk": "Company risks, challenges, regulatory pressure, security incidents and disruptions",
+}
+
+_query_vectors: Dict[str, List[float]] = {}
+_query_vectors_lock = threading.Lock()
+
+
+def get_aspect_query_vectors(embedding_client: EmbeddingClient) -> Dict[str, List[float]]:
+    """
+    Embed the constant aspect queries once per process (single batch call).
+    """
+    if _query_vectors:
+        return _query_vectors
+
+    with _query_vectors_lock:
+        if not _query_vectors:
+            aspects = list(ASPECT_QUERIES)
+            vectors = embedding_client.embed_batch(
+                [ASPECT_QUERIES[a] for a in aspects]
+            )
+            _query_vectors.update(zip(aspects, vectors))
+
+    return _query_vectors
+
+
+def reciprocal_rank_fusion(
+    result_lists: List[List[Dict]],
+    k: int = 60,
+) -> List[Dict]:
+    """
+    Fuse ranked vector-store match lists: score(d) = sum(1 / (k + rank)).
+
+    Returns one match per id (the best-scoring copy) with `score` replaced
+    by the fused score and the original kept as `semantic_score`.
+    """
+    fused: Dict[str, Dict] = {}
+
+    for matches in result_lists:
+        for rank, match in enumerate(matches, start=1):
+            entry = fused.get(match["id"])
+
+            if entry is None:
+                entry = {
+                    "id": match["id"],
+                    "metadata": match["metadata"],
+                    "semantic_score": float(match["score"]),
+                    "score": 0.0,
+                }
+                fused[match["id"]] = entry
+
+            entry["score"] += 1.0 / (k + rank)
+            entry["semantic_score"] = max(entry["semantic_score"], float(match["score"]))
+
+    return sorted(fused.values(), key=lambda m: m["score"], reverse=True)
+
+
+class MultiQueryRetriever:
+    """
+    Runs every aspect query against a namespace in parallel and fuses
+    the results with reciprocal-rank fusion.
+    """
+
+    def __init__(
+        self,
+        embedding_client: EmbeddingClient,
+        vector_store: VectorStore,
+        top_k_per_query: int = 10,
+    ):
+        self.embedding_client = embedding_client
+        self.vector_store = vector_store
+        self.top_k_per_query = top_k_per_query
+
+    def retrieve(self, namespace: str) -> List[Dict]:
+        query_vectors = get_aspect_query_vectors(self.embedding_client)
+
+        def _search(aspect: str) -> List[Dict]:
+            try:
+                return self.vector_store.similarity_search(
+                    query_vector=query_vectors[aspect],
+                    namespace=namespace,
+                    top_k=self.top_k_per_query,
+                )
+            except Exception as e:
+                logger.warning(f"[Retrieval] '{aspect}' query failed: {e}")
+                return []
+
+        with ThreadPoolExecutor(
+            max_workers=len(query_vectors),
+            thread_name_prefix="retrieval",
+        ) as executor:
+            result_lists = list(executor.map(_search, query_vectors))
+
+        return reciprocal_rank_fusion(result_lists)
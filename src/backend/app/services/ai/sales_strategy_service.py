@@ -1,3 +1,4 @@
+import asyncio
 import json
 import logging
 from sqlalchemy import select
@@ -5,8 +6,9 @@ from ...models.sales_strategy import SalesStrategy
 from ...models.recommendation import Recommendation
 from ...models.insight import Insight
 from ...models.analysis import Analysis
-from ...models.hpe_product import HPEProduct
-from ...clients.llm_client import LLMClient
+from ...clients.registry import get_llm_client
+from ...core.analysis_events import publish_analysis_event
+from .product_catalog import product_catalog
 
 logger = logging.getLogger(__name__)
 
@@ -15,9 +17,14 @@ class SalesStrategyService:
 
     def __init__(self, db):
         self.db = db  # AsyncSession
-        self.llm_client = LLMClient()
+        self.llm_client = get_llm_client()
 
-    async def generate_for_analysis(self, analysis_id: int):
+    async def generate_for_analysis(self, analysis_id: int, stream: bool = False):
+        """
+        Generate and persist the strategy. With `stream=True` each section
+        is published on the analysis "strategy" event stream as soon as
+        the model has written it.
+        """
 
         logger.info(f"[SalesStrategy] Generating for analysis_id={analysis_id}")
 
@@ -56,7 +63,7 @@ class SalesStrategyService:
         accepted_products = []
 
         for r in accepted_recommendations:
-            product = await self.db.get(HPEProduct, r.product_id)
+            product = await product_catalog.aget(self.db, r.product_id)
             if not product:
                 continue
 
@@ -113,7 +120,34 @@ class SalesStrategyService:
         # LLM Strategy Generation
         # --------------------------------------------------
 
-        llm_response = self.llm_client.generate_sales_strategy(context_payload)
+        if stream:
+
+            async def _publish_section(section, value):
+                await asyncio.to_thread(
+                    publish_analysis_event,
+                    analysis_id,
+                    "strategy_section",
+                    {"section": section, "value": value},
+                    "strategy",
+                )
+
+            async def _publish_reset():
+                await asyncio.to_thread(
+                    publish_analysis_event,
+                    analysis_id,
+                    "strategy_reset",
+                    {},
+                    "strategy",
+                )
+
+            llm_response = await self.llm_client.astream_sales_strategy(
+                context_payload,
+                on_section=_publish_section,
+                on_reset=_publish_reset,
+            )
+
+        else:
+            llm_response = await self.llm_client.agenerate_sales_strategy(context_payload)
 
         logger.info(f"[SalesStrategy] LLM RAW RESPONSE: {llm_response}")
 
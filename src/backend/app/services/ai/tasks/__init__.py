@@ -2,5 +2,12 @@ from .research_task import run_research
 from .insight_task import run_insights
 from .product_index_task import run_product_index
 from .product_seed_task import run_product_seed
-from .recommendation_task import run_recommendations
-from .sales_strategy_task import run_sales_strategy
\ No newline at end of file
+from .recommendation_task import run_recommendations, run_analysis_recommendations
+from .sales_strategy_task import run_sales_strategy
+from .daily_priority_task import refresh_daily_priorities, refresh_user_daily_priorities
+from .pipeline_task import (
+    finalize_analysis,
+    mark_analysis_failed,
+    run_recommendation_stage,
+    start_analysis_pipeline,
+)
\ No newline at end of file
@@ -0,0 +1,56 @@
+import logging
+from typing import Optional
+
+from ....core.celery_app import celery
+from ....core.config import settings
+from ....db.database import SyncSessionLocal
+from ..daily_prioritization_service import DailyPrioritizationService
+
+logger = logging.getLogger(__name__)
+
+
+def _refresh(user_id: Optional[int] = None) -> int:
+    """
+    Rewrite the daily_priorities snapshot (all users, or one) in a single
+    transaction; dashboard readers keep seeing the previous rows until commit.
+    """
+    clear, fill = DailyPrioritizationService.build_snapshot_statements(
+        settings.DAILY_PRIORITY_SNAPSHOT_SIZE,
+        user_id=user_id,
+    )
+
+    db = SyncSessionLocal()
+
+    try:
+        db.execute(clear)
+        written = db.execute(fill).rowcount
+        db.commit()
+
+        return written
+
+    except Exception:
+        db.rollback()
+        raise
+
+    finally:
+        db.close()
+
+
+@celery.task
+def refresh_daily_priorities():
+    """
+    Nightly beat job: top-N accounts for every user in one set-based pass.
+    """
+    written = _refresh()
+    logger.info(f"[DailyPriority] Snapshot refreshed ({written} rows)")
+    return written
+
+
+@celery.task
+def refresh_user_daily_priorities(user_id: int):
+    """
+    Incremental refresh after one of the user's analyses completes.
+    """
+    written = _refresh(user_id)
+    logger.info(f"[DailyPriority] Snapshot refreshed for user_id={user_id} ({written} rows)")
+    return written
@@ -1,16 +1,25 @@
+from sqlalchemy import delete, select
+
 from ....core.celery_app import celery
+from ....core.config import settings
 from ....db.database import SyncSessionLocal
 from ....models.analysis import Analysis
 from ....models.insight import Insight
 from ....models.insight_source import InsightSource
+from ....models.recommendation import Recommendation
 from ....models.enums import AnalysisStatus
-from ....models.research_document import ResearchDocument
+from ....models.research_chunk import ResearchChunk
+from ....core.analysis_events import publish_analysis_event, publish_status
 
-from ....clients.embedding_client import EmbeddingClient
-from ....clients.pinecone_client import PineconeClient
-from ....clients.llm_client import LLMClient
+from ....clients.registry import (
+    get_embedding_client,
+    get_llm_client,
+    get_vector_store,
+)
 
 from ....schemas.insight import InsightItem, InsightOutput
+from ..context_builder import ContextBuilder
+from ..retrieval import MultiQueryRetriever
 
 def calculate_card_size(severity: str, strategic_score: int):
 
@@ -41,43 +50,83 @@ def run_insights(self, analysis_id: int):
         if not analysis:
             raise ValueError("Analysis not found")
 
+        # ─────────────────────────────────────────────
+        # Start clean: with acks_late a crashed run is
+        # redelivered, and may have left insights behind
+        # (their FKs do not cascade in the database)
+        # ─────────────────────────────────────────────
+        previous_insights = select(Insight.id).where(Insight.analysis_id == analysis_id)
+
+        db.execute(
+            delete(Recommendation).where(Recommendation.insight_id.in_(previous_insights))
+        )
+        db.execute(
+            delete(InsightSource).where(InsightSource.insight_id.in_(previous_insights))
+        )
+        db.execute(
+            delete(Insight).where(Insight.analysis_id == analysis_id)
+        )
+
         namespace = f"analysis_{analysis_id}"
 
-        pinecone = PineconeClient()
-        llm = LLMClient()
-        embedding = EmbeddingClient()
+        vector_store = get_vector_store()
+        llm = get_llm_client()
+        embedding = get_embedding_client()
 
         # ─────────────────────────────────────────────
-        # Representative vector for RAG retrieval
+        # Aspect queries (finance, technology, strategy, risk)
+        # fused with reciprocal-rank fusion
         # ─────────────────────────────────────────────
-        query_vector = embedding.embed_text(
-            "Strategic company analysis overview"
+        retriever = MultiQueryRetriever(
+            embedding_client=embedding,
+            vector_store=vector_store,
+            top_k_per_query=settings.INSIGHT_RETRIEVAL_TOP_K,
         )
 
-        matches = pinecone.similarity_search(
-            query_vector=query_vector,
-            namespace=namespace,
-            top_k=8,
-        )
+        matches = retriever.retrieve(namespace)
 
-        document_ids = [
-            int(match["metadata"]["research_document_id"])
+        scores_by_chunk_id = {
+            int(match["metadata"]["research_chunk_id"]): float(match["score"])
             for match in matches
+            if "research_chunk_id" in match["metadata"]
+        }
+
+        # ─────────────────────────────────────────────
+        # Fetch retrieved passages
+        # ─────────────────────────────────────────────
+        chunks = []
+
+        if scores_by_chunk_id:
+            chunks = db.execute(
+                select(ResearchChunk).where(
+                    ResearchChunk.id.in_(list(scores_by_chunk_id))
+                )
+            ).scalars().all()
+
+        passages = [
+            {
+                "text": chunk.content,
+                "score": scores_by_chunk_id[chunk.id],
+                "chunk": chunk,
+            }
+            for chunk in chunks
         ]
 
         # ─────────────────────────────────────────────
-        # Fetch raw documents
+        # Pack the best passages into the token budget
         # ─────────────────────────────────────────────
-        documents = []
-        research_documents = []
+        context_builder = ContextBuilder(
+            token_budget=settings.INSIGHT_CONTEXT_TOKEN_BUDGET,
+            dedup_threshold=settings.INSIGHT_CONTEXT_DEDUP_THRESHOLD,
+        )
 
-        for doc_id in document_ids:
-            doc = db.get(ResearchDocument, doc_id)
-            if doc:
-                research_documents.append(doc)
-                documents.append((doc.raw_content or "")[:4000])
+        context, selected = context_builder.build(passages)
 
-        context = "\n\n".join(documents)
+        # Best-ranked passage per parent document, used as source snippet
+        research_documents = {}
+        for passage in selected:
+            chunk = passage["chunk"]
+            research_documents.setdefault(chunk.research_document_id, chunk)
 
         prompt = f"""
         You are a strategic B2B AI analyst.
@@ -141,11 +190,11 @@ def run_insights(self, analysis_id: int):
         # Attach Insight Sources
         # ─────────────────────────────────────────────
         for insight in created_insights:
-            for doc in research_documents:
+            for doc_id, chunk in research_documents.items():
                 source = InsightSource(
                     insight_id=insight.id,
-                    research_document_id=doc.id,
-                    snippet=(doc.raw_content or "")[:500],
+                    research_document_id=doc_id,
+                    snippet=chunk.content[:500],
                 )
                 db.add(source)
 
@@ -170,6 +219,23 @@ def run_insights(self, analysis_id: int):
 
         insight_ids = [insight.id for insight in created_insights]
 
+        # Partial result: insights are shown before recommendations exist
+        publish_analysis_event(analysis_id, "insights", {
+            "strategic_score": strategic_score,
+            "insights": [
+                {
+                    "id": insight.id,
+                    "title": insight.title,
+                    "description": insight.description,
+                    "category": insight.category,
+                    "severity": insight.severity,
+                    "card_size": insight.card_size,
+                }
+                for insight in created_insights
+            ],
+        })
+        publish_status(analysis_id, AnalysisStatus.RECOMMENDING)
+
     except Exception as e:
         analysis = db.get(Analysis, analysis_id)
         if analysis:
@@ -182,10 +248,5 @@ def run_insights(self, analysis_id: int):
     finally:
         db.close()
 
-    # ─────────────────────────────────────────────
-    # Trigger recommendation tasks (outside DB session)
-    # ─────────────────────────────────────────────
-    from app.services.ai.tasks.recommendation_task import run_recommendations
-
-    for insight_id in insight_ids:
-        run_recommendations.delay(insight_id)
\ No newline at end of file
+    # Next stage (recommendations) is driven by the pipeline chain
+    return insight_ids
@@ -0,0 +1,116 @@
+import logging
+from typing import List
+
+from celery import chain, group
+
+from ....core.celery_app import celery
+from ....core.analysis_events import publish_status
+from ....core.config import settings
+from ....db.database import SyncSessionLocal
+from ....models.analysis import Analysis
+from ....models.enums import AnalysisStatus
+from .insight_task import run_insights
+from .recommendation_task import run_analysis_recommendations, run_recommendations
+from .research_task import run_research
+
+logger = logging.getLogger(__name__)
+
+
+# ─────────────────────────────────────────────
+# Stage status → error_stage, for failures the
+# stage task itself did not record
+# ─────────────────────────────────────────────
+ERROR_STAGES = {
+    AnalysisStatus.RESEARCHING: "research",
+    AnalysisStatus.INSIGHT_PROCESSING: "insight_generation",
+    AnalysisStatus.RECOMMENDING: "recommendation",
+}
+
+
+def build_analysis_pipeline(analysis_id: int):
+    """
+    research → insights → group(recommendations) → finalize
+
+    Each stage only runs when the previous one succeeded; any failure
+    triggers `mark_analysis_failed`.
+    """
+    return chain(
+        run_research.si(analysis_id),
+        run_insights.si(analysis_id),
+        run_recommendation_stage.s(analysis_id),
+        finalize_analysis.si(analysis_id),
+    ).on_error(mark_analysis_failed.s(analysis_id))
+
+
+def start_analysis_pipeline(analysis_id: int):
+    return build_analysis_pipeline(analysis_id).apply_async()
+
+
+@celery.task(bind=True)
+def run_recommendation_stage(self, insight_ids: List[int], analysis_id: int):
+    """
+    Fan out recommendation work for the insights created by `run_insights`.
+    The task replaces itself with a group, so `finalize_analysis` runs as
+    the chord callback once every member has finished.
+    """
+    if settings.RECOMMENDATION_MODE == "analysis":
+        # One task, one LLM call for all insights
+        signatures = [run_analysis_recommendations.si(analysis_id)] if insight_ids else []
+    else:
+        signatures = [run_recommendations.si(insight_id) for insight_id in insight_ids]
+
+    if not signatures:
+        logger.info(f"[Pipeline] No insights for analysis_id={analysis_id}")
+        return
+
+    raise self.replace(group(signatures))
+
+
+@celery.task
+def finalize_analysis(analysis_id: int):
+
+    db = SyncSessionLocal()
+
+    try:
+        analysis = db.get(Analysis, analysis_id)
+
+        if not analysis or analysis.status == AnalysisStatus.FAILED:
+            return
+
+        analysis.status = AnalysisStatus.ANALYSIS_COMPLETED
+        db.commit()
+        publish_status(analysis_id, AnalysisStatus.ANALYSIS_COMPLETED)
+
+        logger.info(f"[Pipeline] Analysis {analysis_id} completed")
+
+    finally:
+        db.close()
+
+
+@celery.task
+def mark_analysis_failed(request, exc, traceback, analysis_id: int):
+    """
+    Error callback of the pipeline.
+    """
+    logger.error(f"[Pipeline] Analysis {analysis_id} failed in {request.task}: {exc}")
+
+    db = SyncSessionLocal()
+
+    try:
+        analysis = db.get(Analysis, analysis_id)
+
+        if not analysis:
+            return
+
+        if analysis.status != AnalysisStatus.FAILED:
+            analysis.error_stage = ERROR_STAGES.get(analysis.status, "pipeline")
+            analysis.status = AnalysisStatus.FAILED
+
+        if not analysis.error_message:
+            analysis.error_message = str(exc)
+
+        db.commit()
+        publish_status(analysis_id, AnalysisStatus.FAILED, error=analysis.error_message)
+
+    finally:
+        db.close()
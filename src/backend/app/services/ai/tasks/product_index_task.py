@@ -1,3 +1,5 @@
+import logging
+
 from ....core.celery_app import celery
 
 from sqlalchemy.orm import sessionmaker
@@ -7,17 +9,18 @@ from ....core.config import settings
 from ....services.ai.product_ingestion.product_indexing_service import (
     ProductIndexingService,
 )
-from ....clients.embedding_client import EmbeddingClient
-from ....clients.pinecone_client import PineconeClient
+from ....clients.registry import get_embedding_client, get_vector_store
+
+logger = logging.getLogger(__name__)
 
 
 @celery.task(bind=True)
 def run_product_index(self):
     """
-    Celery task to index all products incrementally in Pinecone.
+    Celery task to index all products incrementally in the vector store.
     """
 
-    print("[ProductIndexTask] Starting product indexing...")
+    logger.info("[ProductIndexTask] Starting product indexing...")
 
     # We use Celery worker (sync context).
     # A sync session is needed.
@@ -35,23 +38,23 @@ def run_product_index(self):
     db = SessionLocal()
 
     try:
-        embedding_client = EmbeddingClient()
-        pinecone_client = PineconeClient()
+        embedding_client = get_embedding_client()
+        vector_store = get_vector_store()
 
         service = ProductIndexingService(
             db=db,
             embedding_client=embedding_client,
-            pinecone_client=pinecone_client,
+            vector_store=vector_store,
         )
 
         result = service.index_all_products()
 
-        print(f"[ProductIndexTask] Finished indexing: {result}")
+        logger.info(f"[ProductIndexTask] Finished indexing: {result}")
 
         return result
 
     except Exception as e:
-        print(f"[ProductIndexTask] Failed: {e}")
+        logger.exception(f"[ProductIndexTask] Failed: {e}")
         raise e
 
     finally:
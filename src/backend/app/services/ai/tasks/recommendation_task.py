@@ -1,6 +1,9 @@
 import logging
+from sqlalchemy import select
 from ....core.celery_app import celery
 from ....db.database import SyncSessionLocal
+from ....core.analysis_events import publish_analysis_event
+from ....models.insight import Insight
 from ..recommendation_service import RecommendationService
 
 logger = logging.getLogger(__name__)
@@ -19,6 +22,12 @@ def run_recommendations(self, insight_id: int):
 
         db.commit()
 
+        insight = db.get(Insight, insight_id)
+        if insight:
+            publish_analysis_event(insight.analysis_id, "recommendations", {
+                "insight_ids": [insight_id],
+            })
+
     except Exception as e:
         db.rollback()
         logger.exception(
@@ -29,4 +38,42 @@ def run_recommendations(self, insight_id: int):
     finally:
         db.close()
 
-    logger.info(f"[Task] run_recommendations finished for insight_id={insight_id}")
\ No newline at end of file
+    logger.info(f"[Task] run_recommendations finished for insight_id={insight_id}")
+
+
+@celery.task(bind=True)
+def run_analysis_recommendations(self, analysis_id: int):
+
+    logger.info(
+        f"[Task] run_analysis_recommendations triggered for analysis_id={analysis_id}"
+    )
+
+    db = SyncSessionLocal()
+
+    try:
+        service = RecommendationService(db)
+        service.generate_for_analysis(analysis_id)
+
+        db.commit()
+
+        insight_ids = db.execute(
+            select(Insight.id).where(Insight.analysis_id == analysis_id)
+        ).scalars().all()
+
+        publish_analysis_event(analysis_id, "recommendations", {
+            "insight_ids": list(insight_ids),
+        })
+
+    except Exception as e:
+        db.rollback()
+        logger.exception(
+            f"[Task] run_analysis_recommendations failed for analysis_id={analysis_id}"
+        )
+        raise e
+
+    finally:
+        db.close()
+
+    logger.info(
+        f"[Task] run_analysis_recommendations finished for analysis_id={analysis_id}"
+    )
@@ -1,13 +1,20 @@
+from sqlalchemy import delete
+
 from ....core.celery_app import celery
 from ....db.database import SyncSessionLocal
 from ....models.analysis import Analysis
 from ....models.company import Company
 from ....models.research_document import ResearchDocument
-from ....clients.tavily_client import TavilyClient
-from ....clients.embedding_client import EmbeddingClient
-from ....clients.pinecone_client import PineconeClient
+from ....clients.registry import (
+    get_embedding_client,
+    get_tavily_client,
+    get_vector_store,
+)
 from ....models.enums import AnalysisStatus
-from .insight_task import run_insights
+from ....core.analysis_events import publish_analysis_event, publish_status
+from ..research_executor import ResearchExecutor
+from ..research_indexer import ResearchIndexer
+from ....utils.content import compute_content_hash
 
 @celery.task(bind=True)
 def run_research(self, analysis_id: int):
@@ -21,27 +28,32 @@ def run_research(self, analysis_id: int):
         analysis = db.get(Analysis, analysis_id)
 
         if not analysis:
-            return
+            raise ValueError("Analysis not found")
 
         company = db.get(Company, analysis.company_id)
 
         if not company:
-            analysis.status = AnalysisStatus.FAILED
-            analysis.error_message = "Company not found"
-            db.commit()
-            return
+            raise ValueError("Company not found")
+
+        tavily = get_tavily_client()
+        embedding_client = get_embedding_client()
+        vector_store = get_vector_store()
+
+        # ─────────────────────────────────────────────
+        # Start clean: with acks_late a crashed run is
+        # redelivered, and may have left documents/vectors
+        # ─────────────────────────────────────────────
+        db.execute(
+            delete(ResearchDocument).where(ResearchDocument.analysis_id == analysis_id)
+        )
+        vector_store.delete_namespace(f"analysis_{analysis_id}")
 
         # ─────────────────────────────────────────────
         # Update status → RESEARCHING
         # ─────────────────────────────────────────────
         analysis.status = AnalysisStatus.RESEARCHING
         db.commit()
-
-        tavily = TavilyClient()
-        embedding_client = EmbeddingClient()
-        pinecone = PineconeClient()
-
-        namespace = f"analysis_{analysis_id}"
+        publish_status(analysis_id, AnalysisStatus.RESEARCHING)
 
         # ─────────────────────────────────────────────
         # Strategic queries
@@ -57,53 +69,62 @@ def run_research(self, analysis_id: int):
             f"{base_query} business strategy challenges news",
         ]
 
-        for query in queries:
+        # Queries run concurrently; results are embedded as they arrive
+        executor = ResearchExecutor(tavily)
+        indexer = ResearchIndexer(
+            db=db,
+            analysis_id=analysis_id,
+            company=company,
+            embedding_client=embedding_client,
+            vector_store=vector_store,
+        )
 
-            results = tavily.search(query=query, max_results=3)
+        seen_hashes = set()
+
+        for query, results in executor.run(queries, max_results=3):
 
             for result in results:
 
+                raw_content = result.get("raw_content") or result.get("content")
+                content_hash = compute_content_hash(raw_content)
+
+                # Same page returned by several queries → keep one copy
+                if content_hash and content_hash in seen_hashes:
+                    continue
+
+                seen_hashes.add(content_hash)
+
                 doc = ResearchDocument(
                     analysis_id=analysis_id,
                     title=result.get("title"),
                     source_url=result.get("url"),
-                    raw_content=result.get("raw_content") or result.get("content"),
+                    raw_content=raw_content,
+                    content_hash=content_hash,
                 )
 
                 db.add(doc)
                 db.flush()  # get doc.id without full commit
 
-                # ─────────────────────────────────────────────
-                # Generate embedding (truncate to reduce quota usage)
-                # ─────────────────────────────────────────────
-                text_for_embedding = (doc.raw_content or "")[:1500]
-
-                if text_for_embedding.strip():
-                    vector = embedding_client.embed_text(text_for_embedding)
-
-                    # ─────────────────────────────────────────────
-                    # Upsert to Pinecone
-                    # ─────────────────────────────────────────────
-                    pinecone.upsert_vector(
-                        vector_id=str(doc.id),
-                        values=vector,
-                        metadata={
-                            "research_document_id": doc.id,
-                            "analysis_id": analysis_id,
-                            "source_url": doc.source_url,
-                        },
-                        namespace=namespace,
-                    )
+                indexer.add(doc)
+
+        # ─────────────────────────────────────────────
+        # Embed remaining docs + batched upsert to the vector store
+        # ─────────────────────────────────────────────
+        stats = indexer.flush()
 
         db.commit()
 
+        publish_analysis_event(analysis_id, "research", {
+            "documents": stats["documents"],
+            "chunks": stats["upserted"],
+        })
+
         # ─────────────────────────────────────────────
         # Move to next stage → INSIGHT_PROCESSING
         # ─────────────────────────────────────────────
         analysis.status = AnalysisStatus.INSIGHT_PROCESSING
         db.commit()
-
-        run_insights.delay(analysis.id)
+        publish_status(analysis_id, AnalysisStatus.INSIGHT_PROCESSING)
 
     except Exception as e:
         # ─────────────────────────────────────────────
@@ -1,8 +1,11 @@
 from ....core.celery_app import celery
+from ....core.config import settings
 from ....db.database import sessionLocal
 from ..sales_strategy_service import SalesStrategyService
 from ....models.analysis import Analysis
 from ....models.enums import AnalysisStatus
+from ....core.analysis_events import publish_analysis_event, publish_status
+from .daily_priority_task import refresh_user_daily_priorities
 
 @celery.task(bind=True)
 def run_sales_strategy(self, analysis_id: int):
@@ -13,12 +16,29 @@ def run_sales_strategy(self, analysis_id: int):
 
             service = SalesStrategyService(db)
 
-            await service.generate_for_analysis(analysis_id)
+            await service.generate_for_analysis(
+                analysis_id,
+                stream=settings.STRATEGY_STREAMING_ENABLED,
+            )
 
             # Mark analysis as completed
             analysis = await db.get(Analysis, analysis_id)
             analysis.status = AnalysisStatus.COMPLETED
             await db.commit()
 
+            user_id = analysis.user_id
+
+        publish_status(analysis_id, AnalysisStatus.COMPLETED)
+
+        # The analysis now counts for the dashboard ranking
+        refresh_user_daily_priorities.delay(user_id)
+
     import asyncio
-    asyncio.run(_run())
\ No newline at end of file
+
+    try:
+        asyncio.run(_run())
+    except Exception as e:
+        publish_analysis_event(analysis_id, "strategy_failed", {"error": str(e)}, "strategy")
+        raise
+
+    publish_analysis_event(analysis_id, "strategy_completed", {}, "strategy")
@@ -0,0 +1,99 @@
+from typing import Iterator, Tuple
+
+# Break preference, strongest first
+_PARAGRAPH_BREAKS = ("\n\n",)
+_SENTENCE_BREAKS = (". ", "? ", "! ", ".\n", "?\n", "!\n", "\n")
+_WORD_BREAKS = (" ", "\t")
+
+
+def _rfind_any(text: str, needles: Tuple[str, ...], start: int, end: int) -> int:
+    """
+    Position right after the last needle found in text[start:end], or -1.
+    """
+    best = -1
+
+    for needle in needles:
+        pos = text.rfind(needle, start, end)
+        if pos != -1:
+            best = max(best, pos + len(needle))
+
+    return best
+
+
+def _find_any(text: str, needles: Tuple[str, ...], start: int, end: int) -> int:
+    """
+    Position right after the first needle found in text[start:end], or -1.
+    """
+    best = -1
+
+    for needle in needles:
+        pos = text.find(needle, start, end)
+        if pos != -1 and (best == -1 or pos + len(needle) < best):
+            best = pos + len(needle)
+
+    return best
+
+
+def iter_chunk_spans(
+    text: str,
+    chunk_size: int = 1200,
+    overlap: int = 200,
+) -> Iterator[Tuple[int, int]]:
+    """
+    Yield (start, end) offsets of overlapping chunks of `text`.
+
+    Chunks end on a paragraph break when one falls in the second half of
+    the window, otherwise on a sentence end, otherwise on whitespace. Only
+    offsets are produced, so callers slice out just the chunk they need
+    instead of copying the remaining text on every step.
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+
+    overlap = max(0, min(overlap, chunk_size // 2))
+    length = len(text)
+    start = 0
+
+    # Skip leading whitespace
+    while start < length and text[start].isspace():
+        start += 1
+
+    while start < length:
+        end = min(start + chunk_size, length)
+
+        if end < length:
+            window_start = start + chunk_size // 2
+
+            for breaks in (_PARAGRAPH_BREAKS, _SENTENCE_BREAKS, _WORD_BREAKS):
+                cut = _rfind_any(text, breaks, window_start, end)
+                if cut != -1:
+                    end = cut
+                    break
+
+        # Trim trailing whitespace from the span
+        span_end = end
+        while span_end > start and text[span_end - 1].isspace():
+            span_end -= 1
+
+        if span_end > start:
+            yield start, span_end
+
+        if end >= length:
+            break
+
+        # Step back by `overlap`, then move forward to a sentence start
+        # (or at least a word start) inside the overlap window
+        next_start = max(end - overlap, start + 1)
+
+        if next_start > 0 and not text[next_start - 1].isspace():
+            sentence = _find_any(text, _SENTENCE_BREAKS, next_start, end)
+            if sentence != -1 and sentence < end:
+                next_start = sentence
+            else:
+                space = text.find(" ", next_start, end)
+                next_start = space + 1 if space != -1 else next_start
+
+        while next_start < length and text[next_start].isspace():
+            next_start += 1
+
+        start = next_start
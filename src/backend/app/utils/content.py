@@ -0,0 +1,24 @@
+import hashlib
+import re
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_content(text: str | None) -> str:
+    """
+    Collapse whitespace and case so trivially different copies of the
+    same page produce the same hash.
+    """
+    if not text:
+        return ""
+
+    return _WHITESPACE_RE.sub(" ", text).strip().lower()
+
+
+def compute_content_hash(text: str | None) -> str | None:
+    normalized = normalize_content(text)
+
+    if not normalized:
+        return None
+
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
@@ -0,0 +1,143 @@
+import json
+from typing import Any, Dict, List, Tuple
+
+_WHITESPACE = " \t\r\n"
+
+
+class IncrementalJSONObjectParser:
+    """
+    Parse a JSON object that arrives in chunks (e.g. an LLM token stream)
+    and report each top-level member as soon as its value is complete.
+
+    Anything before the first `{` (such as a ```json fence) is ignored.
+    Scanning is incremental, so each character is looked at once.
+    """
+
+    def __init__(self):
+        self.result: Dict[str, Any] = {}
+        self.done = False
+
+        self._buffer = ""
+        self._pos = 0
+        self._state = "seek_object"
+        self._key = None
+        self._token_start = 0
+        self._nesting = 0
+        self._in_string = False
+        self._escaped = False
+
+    def feed(self, chunk: str) -> List[Tuple[str, Any]]:
+        """
+        Add text; returns the (key, value) members completed by it.
+        """
+        if self.done or not chunk:
+            return []
+
+        self._buffer += chunk
+        completed: List[Tuple[str, Any]] = []
+
+        while self._pos < len(self._buffer) and not self.done:
+            char = self._buffer[self._pos]
+            handler = getattr(self, f"_on_{self._state}")
+            handler(char, completed)
+            self._pos += 1
+
+        return completed
+
+    # ===============================
+    # STATES
+    # ===============================
+
+    def _on_seek_object(self, char, completed):
+        if char == "{":
+            self._state = "seek_key"
+
+    def _on_seek_key(self, char, completed):
+        if char == '"':
+            self._token_start = self._pos
+            self._escaped = False
+            self._state = "key"
+        elif char == "}":
+            self.done = True
+
+    def _on_key(self, char, completed):
+        if self._string_closed(char):
+            self._key = json.loads(self._buffer[self._token_start:self._pos + 1])
+            self._state = "seek_colon"
+
+    def _on_seek_colon(self, char, completed):
+        if char == ":":
+            self._state = "seek_value"
+
+    def _on_seek_value(self, char, completed):
+        if char in _WHITESPACE:
+            return
+
+        self._token_start = self._pos
+
+        if char == '"':
+            self._escaped = False
+            self._state = "string_value"
+        elif char in "{[":
+            self._nesting = 1
+            self._in_string = False
+            self._escaped = False
+            self._state = "container_value"
+        else:
+            self._state = "scalar_value"
+
+    def _on_string_value(self, char, completed):
+        if self._string_closed(char):
+            self._emit(self._pos + 1, completed)
+
+    def _on_container_value(self, char, completed):
+        if self._in_string:
+            if self._string_closed(char):
+                self._in_string = False
+            return
+
+        if char == '"':
+            self._in_string = True
+            self._escaped = False
+        elif char in "{[":
+            self._nesting += 1
+        elif char in "}]":
+            self._nesting -= 1
+            if self._nesting == 0:
+                self._emit(self._pos + 1, completed)
+
+    def _on_scalar_value(self, char, completed):
+        if char == "," or char == "}" or char in _WHITESPACE:
+            self._emit(self._pos, completed)
+            if char == "}":
+                self.done = True
+
+    # ===============================
+    # HELPERS
+    # ===============================
+
+    def _string_closed(self, char) -> bool:
+        """
+        Track escapes inside a string; True on the closing quote.
+        """
+        if self._escaped:
+            self._escaped = False
+            return False
+
+        if char == "\\":
+            self._escaped = True
+            return False
+
+        return char == '"' and self._pos != self._token_start
+
+    def _emit(self, end: int, completed) -> None:
+        raw = self._buffer[self._token_start:end].strip()
+        self._state = "seek_key"
+
+        try:
+            value = json.loads(raw)
+        except ValueError:
+            return
+
+        self.result[self._key] = value
+        completed.append((self._key, value))
@@ -0,0 +1,33 @@
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def keyset_page(query, id_column, limit: int, cursor: Optional[int] = None):
+    """
+    Newest-first page of `query`: rows with id < cursor, one extra row
+    fetched to know whether another page follows.
+    """
+    if cursor is not None:
+        query = query.where(id_column < cursor)
+
+    return query.order_by(id_column.desc()).limit(limit + 1)
+
+
+def split_page(
+    rows: Sequence[Any],
+    limit: int,
+    get_id: Callable[[Any], int],
+) -> Tuple[List[Any], Optional[int]]:
+    """
+    Drop the look-ahead row; returns (page, cursor of the next page or None).
+    """
+    page = list(rows[:limit])
+
+    if len(rows) <= limit or not page:
+        return page, None
+
+    return page, get_id(page[-1])
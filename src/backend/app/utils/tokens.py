@@ -0,0 +1,17 @@
+import re
+
+# Words, numbers and individual punctuation marks
+_TOKEN_RE = re.compile(r"\w+|[^\w\s]")
+
+
+def estimate_tokens(text: str | None) -> int:
+    """
+    Cheap local estimate of LLM tokens.
+
+    Sub-word tokenizers split long words, so each word-like piece counts
+    as ~1.3 tokens. Good enough for budgeting, no tokenizer download.
+    """
+    if not text:
+        return 0
+
+    return int(len(_TOKEN_RE.findall(text)) * 1.3) + 1
@@ -0,0 +1,77 @@
+"""
+test_auth_cache.py — Cached users never outlive a revocation
+"""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("pydantic_settings")
+
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+
+from app.core.auth_cache import AuthenticatedUser, MemoryAuthUserCache, NamedRef
+from app.dependencies import deps_auth
+
+
+def _user(**overrides):
+    fields = {
+        "id": 1,
+        "email": "rep@example.com",
+        "first_name": "Ana",
+        "last_name": "Ruiz",
+        "role_id": 3,
+        "region_id": 1,
+        "role": NamedRef(3, "sales"),
+        "region": NamedRef(1, "LATAM"),
+        "token_version": 2,
+        "is_active": True,
+        "is_deleted": False,
+    }
+    fields.update(overrides)
+    return AuthenticatedUser(**fields)
+
+
+def test_snapshot_is_only_served_for_its_token_version():
+    cache = MemoryAuthUserCache(ttl_seconds=30, max_entries=10)
+    asyncio.run(cache.set(_user()))
+
+    assert asyncio.run(cache.get("rep@example.com", 2)) == _user()
+    assert asyncio.run(cache.get("rep@example.com", 1)) is None
+
+
+def test_invalidate_drops_the_snapshot():
+    cache = MemoryAuthUserCache(ttl_seconds=30, max_entries=10)
+    asyncio.run(cache.set(_user()))
+
+    asyncio.run(cache.invalidate("rep@example.com"))
+
+    assert asyncio.run(cache.get("rep@example.com", 2)) is None
+
+
+def test_snapshot_survives_json_round_trip():
+    user = _user(region=None)
+
+    assert AuthenticatedUser.from_json(user.to_json()) == user
+
+
+def test_soft_deleted_user_is_rejected(monkeypatch):
+    cache = MemoryAuthUserCache(ttl_seconds=30, max_entries=10)
+    asyncio.run(cache.set(_user(is_deleted=True)))
+
+    monkeypatch.setattr(deps_auth, "auth_user_cache", cache)
+    monkeypatch.setattr(
+        deps_auth,
+        "verify_token",
+        lambda token: {"type": "access", "sub": "rep@example.com", "token_version": 2},
+    )
+
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials="token")
+
+    # Served from the cache: the database is never touched
+    with pytest.raises(HTTPException) as error:
+        asyncio.run(deps_auth.get_current_user(credentials=credentials, db=None))
+
+    assert error.value.status_code == 403
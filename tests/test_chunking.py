@@ -0,0 +1,45 @@
+"""
+test_chunking.py — Research document chunking
+"""
+
+from app.utils.chunking import iter_chunk_spans
+
+
+PARAGRAPH = "The company expanded its data centers this year. " * 12
+
+
+def test_empty_text_has_no_chunks():
+    assert list(iter_chunk_spans("")) == []
+    assert list(iter_chunk_spans("   \n  ")) == []
+
+
+def test_short_text_is_single_chunk():
+    text = "Short page about cloud migration."
+    assert list(iter_chunk_spans(text, chunk_size=200)) == [(0, len(text))]
+
+
+def test_chunks_cover_text_with_overlap():
+    text = "\n\n".join([PARAGRAPH] * 6)
+    spans = list(iter_chunk_spans(text, chunk_size=400, overlap=80))
+
+    assert spans[0][0] == 0
+    assert spans[-1][1] == len(text.rstrip())
+
+    for (start, end), (next_start, _) in zip(spans, spans[1:]):
+        assert end - start <= 400
+        # consecutive chunks overlap (or touch) — nothing is skipped
+        assert next_start <= end
+
+
+def test_chunks_end_on_sentence_boundaries():
+    text = "\n\n".join([PARAGRAPH] * 6)
+
+    for start, end in iter_chunk_spans(text, chunk_size=400, overlap=80):
+        assert text[start:end].endswith(".")
+
+
+def test_unbroken_text_is_hard_split():
+    spans = list(iter_chunk_spans("x" * 50, chunk_size=10, overlap=4))
+
+    assert spans[0] == (0, 10)
+    assert spans[-1][1] == 50
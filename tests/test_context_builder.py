@@ -0,0 +1,53 @@
+"""
+test_context_builder.py — Token-budgeted context packing for insights
+"""
+
+from app.services.ai.context_builder import ContextBuilder
+from app.utils.tokens import estimate_tokens
+
+
+def _passage(text, score):
+    return {"text": text, "score": score}
+
+
+def test_passages_are_ranked_by_score():
+    builder = ContextBuilder(token_budget=1000)
+
+    context, selected = builder.build([
+        _passage("Revenue declined in the retail segment.", 0.2),
+        _passage("The CIO announced a hybrid cloud program.", 0.9),
+    ])
+
+    assert [p["score"] for p in selected] == [0.9, 0.2]
+    assert context.startswith("The CIO announced")
+
+
+def test_near_duplicates_are_dropped():
+    builder = ContextBuilder(token_budget=1000)
+    text = "The company is migrating its ERP workloads to a private cloud platform this year."
+
+    _, selected = builder.build([
+        _passage(text, 0.9),
+        _passage(text + " Read more.", 0.8),
+        _passage("Supply chain costs rose sharply in Q3.", 0.5),
+    ])
+
+    assert len(selected) == 2
+    assert selected[1]["score"] == 0.5
+
+
+def test_budget_is_respected():
+    long_text = "Network outage impacted stores across the region. " * 40
+    short_text = "New CTO hired."
+
+    budget = estimate_tokens(long_text) - 1
+    builder = ContextBuilder(token_budget=budget)
+
+    context, selected = builder.build([
+        _passage(long_text, 0.9),
+        _passage(short_text, 0.1),
+    ])
+
+    # The long passage does not fit, the smaller one still does
+    assert selected == [_passage(short_text, 0.1)]
+    assert estimate_tokens(context) <= budget
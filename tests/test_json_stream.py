@@ -0,0 +1,46 @@
+"""
+test_json_stream.py — Incremental parsing of streamed LLM JSON
+"""
+
+import json
+
+from app.utils.json_stream import IncrementalJSONObjectParser
+
+
+DOCUMENT = {
+    "account_strategic_overview": "Margins are under \"pressure\" {not json}",
+    "priority_initiatives": [
+        {"initiative": "Hybrid cloud", "recommended_products": ["GreenLake"]},
+    ],
+    "confidence": 0.82,
+    "approved": True,
+    "email_version": "Hi [Executive Name],\nLet's talk.",
+}
+
+
+def _feed_in_chunks(parser, text, size):
+    completed = []
+    for start in range(0, len(text), size):
+        completed.extend(parser.feed(text[start:start + size]))
+    return completed
+
+
+def test_members_are_emitted_in_order_across_chunk_boundaries():
+    text = "```json\n" + json.dumps(DOCUMENT, indent=2) + "\n```"
+
+    for size in (1, 7, 64):
+        parser = IncrementalJSONObjectParser()
+        completed = _feed_in_chunks(parser, text, size)
+
+        assert [key for key, _ in completed] == list(DOCUMENT)
+        assert parser.result == DOCUMENT
+        assert parser.done
+
+
+def test_member_is_reported_as_soon_as_its_value_closes():
+    parser = IncrementalJSONObjectParser()
+
+    assert parser.feed('{"overview": "Grow') == []
+    assert parser.feed('th plan", "initiatives": [1, ') == [("overview", "Growth plan")]
+    assert parser.feed("2]") == [("initiatives", [1, 2])]
+    assert not parser.done
@@ -0,0 +1,51 @@
+"""
+test_local_vector_store.py — Upserts keep ids, rows and metadata aligned
+"""
+
+import pytest
+
+pytest.importorskip("numpy")
+pytest.importorskip("pydantic_settings")
+
+from app.clients.local_vector_store import LocalVectorStore
+
+
+def test_repeated_id_later_in_batch_updates_its_own_row(tmp_path):
+    store = LocalVectorStore(path=str(tmp_path))
+    store.upsert_batch([{"id": "a", "values": [1, 0, 0]}], "ns")
+
+    store.upsert_batch(
+        [
+            {"id": "b", "values": [0, 1, 0], "metadata": {"v": "b1"}},
+            {"id": "c", "values": [0, 0, 1], "metadata": {"v": "c1"}},
+            {"id": "c", "values": [1, 1, 0], "metadata": {"v": "c2"}},
+        ],
+        "ns",
+    )
+
+    vectors = store.fetch_vectors(["a", "b", "c"], "ns")
+
+    assert vectors["a"] == pytest.approx([1, 0, 0])
+    assert vectors["b"] == pytest.approx([0, 1, 0])
+    assert vectors["c"] == pytest.approx([2 ** -0.5, 2 ** -0.5, 0])
+
+    hits = store.similarity_search([0, 1, 0], "ns", top_k=3)
+
+    assert len(hits) == 3
+    assert {hit["id"]: hit["metadata"] for hit in hits}["c"] == {"v": "c2"}
+
+
+def test_reload_from_disk_keeps_rows(tmp_path):
+    LocalVectorStore(path=str(tmp_path)).upsert_batch(
+        [
+            {"id": "x", "values": [1, 0]},
+            {"id": "y", "values": [0, 1]},
+            {"id": "y", "values": [1, 1]},
+        ],
+        "ns",
+    )
+
+    vectors = LocalVectorStore(path=str(tmp_path)).fetch_vectors(["x", "y"], "ns")
+
+    assert vectors["x"] == pytest.approx([1, 0])
+    assert vectors["y"] == pytest.approx([2 ** -0.5, 2 ** -0.5])
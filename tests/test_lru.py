@@ -0,0 +1,42 @@
+"""
+test_lru.py — In-process LRU cache used in front of shared caches
+"""
+
+import time
+
+from app.utils.lru import LRUCache
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = LRUCache(max_entries=2)
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_entries_expire_after_ttl():
+    cache = LRUCache(max_entries=10, ttl_seconds=0.01)
+
+    cache.set("a", 1)
+    cache.set("b", 2, ttl_seconds=60)
+    time.sleep(0.02)
+
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+
+
+def test_deleted_entry_is_gone():
+    cache = LRUCache(max_entries=10)
+
+    cache.set("a", 1)
+    cache.delete("a")
+    cache.delete("missing")
+
+    assert cache.get("a") is None
+    assert len(cache) == 0
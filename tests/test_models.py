@@ -0,0 +1,17 @@
+"""
+test_models.py — Every ORM relationship resolves
+"""
+
+import pytest
+
+sqlalchemy = pytest.importorskip("sqlalchemy")
+pytest.importorskip("pydantic_settings")
+
+from sqlalchemy.orm import configure_mappers
+
+import app.models  # noqa: F401  (registers every mapper)
+
+
+def test_mappers_configure():
+    # Raises on any back_populates pointing at a missing property
+    configure_mappers()
@@ -0,0 +1,19 @@
+"""
+test_pagination.py — Keyset page splitting
+"""
+
+from app.utils.pagination import split_page
+
+
+def test_full_page_returns_cursor_of_last_row():
+    rows = [10, 9, 8, 7]
+
+    page, cursor = split_page(rows, 3, lambda row: row)
+
+    assert page == [10, 9, 8]
+    assert cursor == 8
+
+
+def test_last_page_has_no_cursor():
+    assert split_page([5, 4], 3, lambda row: row) == ([5, 4], None)
+    assert split_page([], 3, lambda row: row) == ([], None)
@@ -0,0 +1,38 @@
+"""
+test_rate_limiter.py — Only transient throttling is retried
+"""
+
+import pytest
+
+pytest.importorskip("pydantic_settings")
+pytest.importorskip("redis")
+
+from app.core.rate_limiter import is_retryable_error
+
+
+class StatusError(Exception):
+
+    def __init__(self, message, status_code):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+@pytest.mark.parametrize("exc", [
+    StatusError("Too Many Requests", 429),
+    StatusError("Service Unavailable", 503),
+    Exception("429 RESOURCE_EXHAUSTED. Quota exceeded for metric: "
+              "GenerateRequestsPerMinutePerProjectPerModel. Please retry in 12s."),
+    Exception("rate limit reached, try again later"),
+])
+def test_transient_throttling_is_retried(exc):
+    assert is_retryable_error(exc)
+
+
+@pytest.mark.parametrize("exc", [
+    StatusError("Quota exceeded for metric: GenerateRequestsPerDayPerProjectPerModel", 429),
+    Exception("429 RESOURCE_EXHAUSTED. Daily limit exceeded"),
+    StatusError("Monthly quota exceeded for this project", 429),
+    ValueError("invalid prompt"),
+])
+def test_exhausted_quota_and_other_errors_are_not_retried(exc):
+    assert not is_retryable_error(exc)